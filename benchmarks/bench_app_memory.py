@@ -0,0 +1,108 @@
+"""
+Benchmark: memory held by a batch of app records at every stage.
+
+Builds the concept, plan, app, test results and launch status for N apps and
+keeps them all alive, then reports the traced allocation size (tracemalloc):
+- dict: nested plain dicts, rebuilt per app, as main.py used to pass them
+- slots: the frozen, slotted stage records with interned shared constants
+
+Also times attribute access against dict lookups on the app records.
+
+Usage:
+    python benchmarks/bench_app_memory.py [--apps 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '../phases/phase3_ai_execution/codebase')))
+import main as app_main  # type: ignore  # noqa: E402
+
+FEATURE_SETS = (
+    ["authentication", "messaging"],
+    ["authentication", "notifications"],
+    ["authentication", "messaging", "notifications"],
+)
+
+
+def make_inputs(apps: int) -> list[dict]:
+    return [{"name": f"App {i}", "features": list(FEATURE_SETS[i % len(FEATURE_SETS)]),
+             "target_audience": "General"}
+            for i in range(apps)]
+
+
+def build_dicts(user_input):
+    concept = {"name": user_input["name"], "features": user_input["features"],
+               "target_audience": user_input["target_audience"]}
+    architecture = {"backend": "Django REST Framework", "frontend": "React",
+                    "database": "PostgreSQL", "features": concept["features"]}
+    plan = {"architecture": architecture, "workflows": {
+        "user_authentication": "OAuth2 implementation",
+        "messaging": "WebSocket-based real-time messaging",
+        "notifications": "Push notifications using Firebase"}}
+    app = {"backend": f"Backend built using {architecture['backend']}",
+           "frontend": f"Frontend built using {architecture['frontend']}",
+           "database": f"Database configured with {architecture['database']}",
+           "features": architecture["features"],
+           "authentication": {"method": "OAuth2", "provider": "Google, Facebook, Custom"}}
+    test_results = {"feature_tests": {f: f"{f} test passed" for f in app["features"]},
+                    "performance": "Performance tests passed"}
+    launch = {"deployment_status": "App deployed to cloud infrastructure",
+              "scaling_options": {"auto_scaling": True, "regions": ["us-east-1", "eu-west-1"]}}
+    return concept, plan, app, test_results, launch
+
+
+def build_slots(user_input):
+    concept = app_main.conceptualize_app(user_input, verbose=False)
+    plan = app_main.plan_app(concept, verbose=False)
+    app = app_main.execute_app_plan(plan, verbose=False)
+    test_results = app_main.test_app(app, verbose=False)
+    return concept, plan, app, test_results, app_main.launch_app(test_results, verbose=False)
+
+
+def measure(build, inputs):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = [build(user_input) for user_input in inputs]
+    seconds = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, size, seconds
+
+
+def time_access(apps, read) -> float:
+    start = time.perf_counter()
+    for app in apps:
+        read(app)
+    return (time.perf_counter() - start) / len(apps)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--apps", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    inputs = make_inputs(args.apps)
+    dict_held, dict_size, dict_seconds = measure(build_dicts, inputs)
+    slot_held, slot_size, slot_seconds = measure(build_slots, inputs)
+
+    print(f"{'model':>6}  {'MiB held':>9}  {'bytes/app':>9}  {'build s':>8}  {'access ns':>9}")
+    dict_access = time_access([h[2] for h in dict_held],
+                              lambda a: (a["backend"], a["features"], a["database"]))
+    slot_access = time_access([h[2] for h in slot_held],
+                              lambda a: (a.backend, a.features, a.database))
+    for label, size, seconds, access in (("dict", dict_size, dict_seconds, dict_access),
+                                         ("slots", slot_size, slot_seconds, slot_access)):
+        print(f"{label:>6}  {size / 2**20:>9.1f}  {size / args.apps:>9.0f}  "
+              f"{seconds:>8.3f}  {access * 1e9:>9.1f}")
+    print(f"slotted records use {slot_size / dict_size:.0%} of the dict representation's memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: app concepts per second through the main.py workflow.
+
+Compares running the five phases one app at a time with per-stage printing
+(sent to a null stream) against the batch API with printing off.
+
+Usage:
+    python benchmarks/bench_app_pipeline.py [--apps 10000] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '../phases/phase3_ai_execution/codebase')))
+import main as app_main  # type: ignore  # noqa: E402
+
+FEATURE_SETS = (
+    ["authentication", "messaging"],
+    ["authentication", "notifications"],
+    ["authentication", "messaging", "notifications"],
+)
+
+
+def make_inputs(apps: int) -> list[dict]:
+    return [{"name": f"App {i}", "features": FEATURE_SETS[i % len(FEATURE_SETS)],
+             "target_audience": "General"}
+            for i in range(apps)]
+
+
+def run_single(inputs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for user_input in inputs:
+            concept = app_main.conceptualize_app(user_input)
+            plan = app_main.plan_app(concept)
+            app = app_main.execute_app_plan(plan)
+            app_main.launch_app(app_main.test_app(app))
+
+
+def run_batch(inputs):
+    app_main.run_batch(inputs)
+
+
+def bench(run, inputs, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(inputs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--apps", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    inputs = make_inputs(args.apps)
+    print(f"{'mode':>8}  {'apps/sec':>12}")
+    for label, run in (("single", run_single), ("batch", run_batch)):
+        seconds = bench(run, inputs, args.repeat)
+        print(f"{label:>8}  {args.apps / seconds:>12,.0f}")
+    info = app_main.compose_features.cache_info()
+    print(f"feature compositions: {info.misses} built, {info.hits} reused")
+
+
+if __name__ == "__main__":
+    main()
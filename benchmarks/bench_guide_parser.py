@@ -0,0 +1,59 @@
+"""
+Benchmark: streaming guide parser on synthetic guides.
+
+Generates guides with an increasing number of ``## Step N`` sections and
+times parse_guide on each. Per-step time should stay flat as the guide
+grows, which is what linear-time parsing looks like.
+
+Usage:
+    python benchmarks/bench_guide_parser.py [--steps 1000 2000 4000 8000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+from guide_store import parse_guide  # type: ignore  # noqa: E402
+
+
+def write_guide(path: str, steps: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Phase X – Synthetic Guide\n\n## How This Step Works\n- Intro bullet\n\n")
+        for n in range(1, steps + 1):
+            f.write(f"## Step {n} – Synthetic step {n}\n")
+            f.write(f"**Short description:** Description for step {n}.\n")
+            for d in range(4):
+                f.write(f"- Directive {d} for step {n}.\n")
+            f.write("### Details (Expanded)\n- Nested detail.\n\n---\n\n")
+
+
+def bench(steps: int, repeat: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "guide.md")
+        write_guide(path, steps)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            outline = parse_guide(path)
+            best = min(best, time.perf_counter() - start)
+        assert len(outline["steps"]) == steps
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, nargs="+", default=[1000, 2000, 4000, 8000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'steps':>8}  {'best (ms)':>10}  {'us/step':>8}")
+    for steps in args.steps:
+        seconds = bench(steps, args.repeat)
+        print(f"{steps:>8}  {seconds * 1000:>10.2f}  {seconds / steps * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
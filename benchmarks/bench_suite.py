@@ -0,0 +1,287 @@
+"""
+Benchmark suite: how the workspace tools scale with workspace size.
+
+Generates a synthetic workspace (see workspace_generator.py), then times each
+operation cold (its caches removed) and warm (caches from the cold run):
+
+    analyze_workspace   phase folder scan plus guide headings
+    phase_checks        the PHASES progress checks over a WorkspaceIndex
+    phase2_wizard       run_phase2_wizard (cold: force=True; warm: incremental)
+    update_progress     tools/update_progress.py over the whole workspace
+    validate_links      tools/project_validator.py over the whole workspace
+    guide_parse         GuideStore outline of the generated guide
+
+Every run happens in a fresh spawned process and records wall time, peak RSS
+and the RSS growth during the operation, and file-system call counts (open,
+stat/lstat, scandir/listdir, mkdir, rename/replace, remove). stat calls made
+through os.DirEntry are served by the directory listing and are not counted.
+Results are written as JSON; --compare prints the change against an earlier
+results file.
+
+Usage:
+    python benchmarks/bench_suite.py [--files 5000] [--screens 50] [--docs 6] [--guide-steps 40]
+                                     [--ops analyze_workspace,...] [--output bench_results.json]
+                                     [--compare previous.json] [--workspace DIR]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(REPO_ROOT, 'tools'))
+sys.path.insert(0, BENCH_DIR)
+from workspace_generator import generate_workspace  # type: ignore  # noqa: E402
+
+RESULTS_VERSION = 1
+
+# Audit events counted as file-system calls, by the name reported in results
+AUDIT_EVENTS = {
+    "open": "open",
+    "os.scandir": "listdir",
+    "os.listdir": "listdir",
+    "os.mkdir": "mkdir",
+    "os.rename": "rename",
+    "os.remove": "remove",
+    "os.rmdir": "remove",
+}
+
+
+# ----- operations (run inside the worker process) ----------------------------
+
+def _cache(workspace, name):
+    return os.path.join(workspace, ".builder_cache", name)
+
+
+def _remove(*paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _guide_path(workspace):
+    return os.path.join(workspace, "copilot_brain", "bench_guide.md")
+
+
+def prepare(op, workspace, cold):
+    """Drop the operation's caches before a cold run."""
+    if not cold:
+        return
+    if op in ("analyze_workspace", "phase_checks"):
+        _remove(_cache(workspace, "progress_index.json"))
+    elif op == "update_progress":
+        _remove(_cache(workspace, "progress_cache.json"))
+    elif op == "validate_links":
+        _remove(_cache(workspace, "reference_index.json"))
+    elif op == "guide_parse":
+        _remove(_cache(workspace, "bench_guides.json"))
+
+
+def run_op(op, workspace, cold):
+    if op == "analyze_workspace":
+        import cli_interface
+        return cli_interface.analyze_workspace(project_root=workspace)[0]
+    if op == "phase_checks":
+        import cli_interface
+        from workspace_index import WorkspaceIndex
+        folders = {ph["index"]: os.path.join(workspace,
+                                             os.path.relpath(ph["folder"], cli_interface.ROOT))
+                   for ph in cli_interface.PHASES}
+        index = WorkspaceIndex(workspace, _cache(workspace, "progress_index.json"))
+        index.load()
+        index.scan(folders.values())
+        index.save()
+        return sum(bool(ph["progress_check"](index, folders[ph["index"]]))
+                   for ph in cli_interface.PHASES)
+    if op == "phase2_wizard":
+        import contextlib
+        import io
+        import cli_interface
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = cli_interface.run_phase2_wizard(workspace, force=cold)
+        return report["files"] if report else 0
+    if op == "update_progress":
+        import update_progress
+        report = os.path.join(workspace, "project_overview", "MASTER_GOAL_PROGRESS.md")
+        os.makedirs(os.path.dirname(report), exist_ok=True)
+        cache = _cache(workspace, "progress_cache.json")
+        return update_progress.update_progress(workspace, report, cache)["files"]
+    if op == "validate_links":
+        import contextlib
+        import io
+        import project_validator
+        with contextlib.redirect_stdout(io.StringIO()):
+            return len(project_validator.validate_paths(workspace))
+    if op == "guide_parse":
+        from guide_store import GuideStore
+        store = GuideStore(_cache(workspace, "bench_guides.json"))
+        return len(store.get(_guide_path(workspace))["steps"])
+    raise ValueError(f"Unknown operation: {op}")
+
+
+OPERATIONS = ("analyze_workspace", "phase_checks", "phase2_wizard", "update_progress",
+              "validate_links", "guide_parse")
+
+
+def _max_rss_kb():
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss  # bytes on macOS, KiB elsewhere
+
+
+def measure(op, workspace, cold):
+    """Worker entry point: time one operation and count its file-system calls."""
+    import cli_interface  # noqa: F401  Import cost is not part of any operation
+    prepare(op, workspace, cold)
+    counts = Counter()
+
+    def audit(event, args):
+        name = AUDIT_EVENTS.get(event)
+        if name:
+            counts[name] += 1
+
+    real_stat, real_lstat = os.stat, os.lstat
+
+    def counting_stat(*args, **kwargs):
+        counts["stat"] += 1
+        return real_stat(*args, **kwargs)
+
+    def counting_lstat(*args, **kwargs):
+        counts["stat"] += 1
+        return real_lstat(*args, **kwargs)
+
+    baseline = _max_rss_kb()
+    sys.addaudithook(audit)
+    os.stat, os.lstat = counting_stat, counting_lstat
+    start = time.perf_counter()
+    try:
+        result = run_op(op, workspace, cold)
+    finally:
+        seconds = time.perf_counter() - start
+        os.stat, os.lstat = real_stat, real_lstat
+        AUDIT_EVENTS.clear()  # Audit hooks cannot be removed; silence this one
+    peak = _max_rss_kb()
+    return {
+        "op": op,
+        "mode": "cold" if cold else "warm",
+        "seconds": seconds,
+        "peak_rss_kb": peak,
+        "rss_growth_kb": peak - baseline,
+        "fs_calls": dict(sorted(counts.items())),
+        "result": result,
+    }
+
+
+# ----- driver ------------------------------------------------------------------
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(workspace, ops, params):
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for op in ops:
+        for cold in (True, False):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                results.append(pool.submit(measure, op, workspace, cold).result())
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": params,
+        },
+        "results": results,
+    }
+
+
+def print_table(data, previous=None):
+    before = {}
+    if previous:
+        before = {(r["op"], r["mode"]): r for r in previous.get("results", ())}
+    header = (f"{'operation':<18} {'mode':<5} {'seconds':>9} {'peak MiB':>9} {'+MiB':>7} "
+              f"{'opens':>7} {'stats':>8} {'lists':>7}")
+    if previous:
+        header += f" {'vs prev':>8}"
+    print(header)
+    for r in data["results"]:
+        fs = r["fs_calls"]
+        line = (f"{r['op']:<18} {r['mode']:<5} {r['seconds']:>9.4f} "
+                f"{r['peak_rss_kb'] / 1024:>9.1f} {r['rss_growth_kb'] / 1024:>7.1f} "
+                f"{fs.get('open', 0):>7} {fs.get('stat', 0):>8} {fs.get('listdir', 0):>7}")
+        old = before.get((r["op"], r["mode"]))
+        if old and old["seconds"]:
+            line += f" {r['seconds'] / old['seconds']:>7.2f}x"
+        elif previous:
+            line += f" {'-':>8}"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--screens", type=int, default=50)
+    parser.add_argument("--docs", type=int, default=6)
+    parser.add_argument("--guide-steps", type=int, default=40)
+    parser.add_argument("--ops", default=",".join(OPERATIONS),
+                        help="Comma-separated operations to run")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--workspace",
+                        help="Generate into (and keep) this directory instead of a temp dir")
+    args = parser.parse_args(argv)
+
+    ops = [op.strip() for op in args.ops.split(",") if op.strip()]
+    unknown = set(ops) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown operation(s): {', '.join(sorted(unknown))}")
+
+    params = {"files": args.files, "screens": args.screens, "docs": args.docs,
+              "guide_steps": args.guide_steps}
+    if args.workspace:
+        workspace = os.path.abspath(args.workspace)
+    else:
+        workspace = tempfile.mkdtemp(prefix="bench_ws_")
+    try:
+        start = time.perf_counter()
+        counts = generate_workspace(workspace, args.screens, args.docs, args.guide_steps,
+                                    args.files)
+        print(f"Generated {counts['total']} files in {time.perf_counter() - start:.2f}s "
+              f"at {workspace}")
+        params["generated"] = counts
+        data = run_suite(workspace, ops, params)
+    finally:
+        if not args.workspace:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    print_table(data, previous)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
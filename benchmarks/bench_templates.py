@@ -0,0 +1,100 @@
+"""
+Benchmark: per-screen Phase 2 render cost.
+
+Compares four ways of rendering one screen's flow plus six deliverables:
+- inline: the f-strings run_phase2_wizard used before templates existed
+- reparse: str.format on the raw template text (parses on every call)
+- compiled: precompiled render functions called directly
+- batch: TemplateLibrary.render_batch over the screen's seven documents
+
+Usage:
+    python benchmarks/bench_templates.py [--screens 1000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+from template_engine import TEMPLATE_SUFFIX, TemplateLibrary  # type: ignore  # noqa: E402
+
+TEMPLATES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '../templates_examples/deliverables'))
+DOCS = ("screen_flow.mmd", "user_flow.md", "data_flow.md", "state_flow.md",
+        "api_service_flow.md", "error_exception_flow.md", "security_privacy_flow.md")
+
+
+def render_inline(name, desc):
+    return [
+        f"graph TD\n    Start --> {name}\n    {name} --> End\n",
+        f"# User Flow for {name}\n\n{desc}",
+        f"# Data Flow for {name}\n\n{desc}",
+        f"# State Flow for {name}\n\n{desc}",
+        f"# API/Service Flow for {name}\n\n{desc}",
+        f"# Error/Exception Flow for {name}\n\n{desc}",
+        f"# Security/Privacy Flow for {name}\n\n{desc}",
+    ]
+
+
+def make_reparse():
+    raw = {}
+    for doc in DOCS:
+        path = os.path.join(TEMPLATES_DIR, "phase2", doc + TEMPLATE_SUFFIX)
+        with open(path, encoding="utf-8") as f:
+            raw[doc] = f.read()
+
+    def render_reparse(name, desc):
+        return [raw[doc].format(screen_name=name, screen_desc=desc) for doc in DOCS]
+    return render_reparse
+
+
+def make_compiled():
+    library = TemplateLibrary(TEMPLATES_DIR)
+    renders = [library.get(f"phase2/{doc}") for doc in DOCS]
+
+    def render_compiled(name, desc):
+        context = {"screen_name": name, "screen_desc": desc}
+        return [render(context) for render in renders]
+    return render_compiled
+
+
+def make_batch():
+    library = TemplateLibrary(TEMPLATES_DIR)
+    items = [(doc, f"phase2/{doc}", None) for doc in DOCS]
+
+    def render_batch(name, desc):
+        return [text for _, text in library.render_batch(
+            items, shared={"screen_name": name, "screen_desc": desc})]
+    return render_batch
+
+
+def bench(render, screens: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(screens):
+            render(f"Screen {i}", f"Generated from screen_{i}.md")
+        best = min(best, time.perf_counter() - start)
+    return best / screens
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--screens", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'renderer':>10}  {'us/screen':>10}")
+    renderers = (
+        ("inline", render_inline),
+        ("reparse", make_reparse()),
+        ("compiled", make_compiled()),
+        ("batch", make_batch()),
+    )
+    for label, render in renderers:
+        print(f"{label:>10}  {bench(render, args.screens, args.repeat) * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
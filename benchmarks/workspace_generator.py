@@ -0,0 +1,118 @@
+"""
+Synthetic workspace generator for the benchmark suite.
+
+Fabricates a project laid out like a real one (see copilot_brain/FOLDER_STRUCTURE.md):
+
+- phase1_concept_strategy/deliverables/: one Markdown source per screen
+- phase2_development_planning/deliverables/<screen>/: ``docs`` documents per screen
+- copilot_brain/bench_guide.md: a phase guide with ``guide_steps`` steps
+- phase3_ai_execution/codebase/ and tests/: filler files (Markdown with local
+  links, a share of them broken, plus Python sources) in nested folders of at
+  most ``per_dir`` entries, topping the workspace up to ``files`` files
+
+Output is deterministic for a given set of parameters.
+
+Usage:
+    python benchmarks/workspace_generator.py DIR [--screens 50] [--docs 6]
+        [--guide-steps 40] [--files 5000]
+"""
+
+import argparse
+import os
+
+SECTIONS = ("Overview", "Requirements", "Open questions")
+
+
+def _write(path: str, text: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _document(title: str, links=()) -> str:
+    lines = [f"# {title}", ""]
+    for section in SECTIONS:
+        lines += [f"## {section}", f"- {title}: {section.lower()} notes.", ""]
+    lines += [f"See [{target}]({target})." for target in links]
+    return "\n".join(lines) + "\n"
+
+
+def _guide(steps: int) -> str:
+    lines = ["# Benchmark Phase Guide", "", "Generated guide used to time guide parsing.", ""]
+    for n in range(1, steps + 1):
+        lines += [
+            f"### Step {n}: Task {n}",
+            f"Complete task {n} of the benchmark phase.",
+            f"- **Copilot:** Draft the output for task {n}.",
+            f"- **Copilot:** Review the output for task {n}.",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def generate_workspace(root: str, screens: int = 50, docs: int = 6, guide_steps: int = 40,
+                       files: int = 5000, per_dir: int = 100, broken_every: int = 50) -> dict:
+    """Create the workspace under ``root`` and return its file counts by area."""
+    root = os.path.abspath(root)
+    counts = {"phase1": 0, "phase2": 0, "guides": 0, "filler": 0}
+
+    phase1 = os.path.join(root, "phase1_concept_strategy", "deliverables")
+    os.makedirs(phase1, exist_ok=True)
+    for s in range(screens):
+        _write(os.path.join(phase1, f"screen_{s:05d}.md"), _document(f"Screen {s}"))
+        counts["phase1"] += 1
+
+    phase2 = os.path.join(root, "phase2_development_planning", "deliverables")
+    for s in range(screens):
+        screen_dir = os.path.join(phase2, f"screen_{s:05d}")
+        os.makedirs(screen_dir, exist_ok=True)
+        for d in range(docs):
+            _write(os.path.join(screen_dir, f"doc_{d:02d}.md"),
+                   _document(f"Screen {s} document {d}"))
+            counts["phase2"] += 1
+
+    brain = os.path.join(root, "copilot_brain")
+    os.makedirs(brain, exist_ok=True)
+    _write(os.path.join(brain, "bench_guide.md"), _guide(guide_steps))
+    counts["guides"] = 1
+
+    remaining = max(0, files - sum(counts.values()))
+    phase3 = os.path.join(root, "phase3_ai_execution")
+    for i in range(remaining):
+        area = "codebase" if i % 2 == 0 else "tests"
+        group, item = divmod(i // 2, per_dir)
+        directory = os.path.join(phase3, area, f"pkg_{group // per_dir:03d}",
+                                 f"mod_{group % per_dir:03d}")
+        if item == 0:
+            os.makedirs(directory, exist_ok=True)
+        if i % 3 == 0:
+            path = os.path.join(directory, f"module_{item:03d}.py")
+            _write(path, f"# Generated module {i}\n\n\ndef value():\n    return {i}\n")
+        else:
+            links = []
+            if screens:
+                screen = os.path.join(phase1, f"screen_{i % screens:05d}.md")
+                links.append(os.path.relpath(screen, directory))
+            if i % broken_every == 0:
+                links.append(f"missing_{i}.md")
+            _write(os.path.join(directory, f"note_{item:03d}.md"), _document(f"Note {i}", links))
+        counts["filler"] += 1
+
+    counts["total"] = sum(counts.values())
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("root")
+    parser.add_argument("--screens", type=int, default=50)
+    parser.add_argument("--docs", type=int, default=6, help="Phase 2 documents per screen")
+    parser.add_argument("--guide-steps", type=int, default=40)
+    parser.add_argument("--files", type=int, default=5000,
+                        help="Total files to create (up to 100k and beyond)")
+    args = parser.parse_args(argv)
+    counts = generate_workspace(args.root, args.screens, args.docs, args.guide_steps, args.files)
+    print(", ".join(f"{key}: {value}" for key, value in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,162 +1,534 @@
 # Main Application Logic for AI App Builder
 
+import json
+import os
+import sys
+from collections import namedtuple
+from collections.abc import Mapping
+from contextlib import nullcontext
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from types import MappingProxyType
+
+# Shared, read-only defaults. Every app references these objects instead of
+# rebuilding its own copy, which keeps large batches cheap.
+DEFAULT_ARCHITECTURE = MappingProxyType({
+    "backend": "Django REST Framework",
+    "frontend": "React",
+    "database": "PostgreSQL",
+})
+
+AUTHENTICATION = MappingProxyType({
+    "method": "OAuth2",
+    "provider": "Google, Facebook, Custom"
+})
+
+SCALING_OPTIONS = MappingProxyType({
+    "auto_scaling": True,
+    "regions": ("us-east-1", "eu-west-1")
+})
+
+DEPLOYMENT_STATUS = "App deployed to cloud infrastructure"
+PERFORMANCE_STATUS = "Performance tests passed"
+
+
+# Stage records. Slotted and frozen: no per-instance __dict__, faster
+# attribute access than dict lookups, and safe to share between apps.
+@dataclass(frozen=True, slots=True)
+class Concept:
+    name: str
+    features: tuple
+    target_audience: str
+
+
+@dataclass(frozen=True, slots=True)
+class Architecture:
+    backend: str
+    frontend: str
+    database: str
+    features: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Plan:
+    architecture: Architecture
+    workflows: Mapping
+    modules: Mapping  # Feature name -> build contribution
+    unknown: tuple = ()  # Requested features without a registered module
+
+
+@dataclass(frozen=True, slots=True)
+class App:
+    backend: str
+    frontend: str
+    database: str
+    features: tuple
+    modules: Mapping  # Feature name -> build contribution
+    unknown: tuple = ()  # Features that were requested but not built
+
+    @property
+    def authentication(self):
+        return self.modules.get("authentication")
+
+
+@dataclass(frozen=True, slots=True)
+class TestResults:
+    __test__ = False  # Not a pytest test class
+
+    feature_tests: Mapping
+    performance: str
+
+
+@dataclass(frozen=True, slots=True)
+class LaunchStatus:
+    deployment_status: str
+    scaling_options: Mapping
+
+
+# Every launch reports the same status, so all apps share one record
+LAUNCHED = LaunchStatus(DEPLOYMENT_STATUS, SCALING_OPTIONS)
+
+
+def as_dict(record):
+    """Shallow dict of a stage record's fields."""
+    return {f.name: getattr(record, f.name) for f in fields(record)}
+
+
+@lru_cache(maxsize=4096)
+def _feature_set(features):
+    """Intern a features tuple so apps with the same features share one tuple of interned names."""
+    return tuple(sys.intern(feature) for feature in features)
+
+
+@lru_cache(maxsize=256)
+def _built_components(backend, frontend, database):
+    return (
+        sys.intern(f"Backend built using {backend}"),
+        sys.intern(f"Frontend built using {frontend}"),
+        sys.intern(f"Database configured with {database}"),
+    )
+
+
+# Feature modules. Each feature registers what it adds to the plan (workflows)
+# and to the build (a module config). A feature set is composed once per
+# distinct frozenset of features; apps with the same combination, in any
+# order, share the composed workflows and modules.
+@dataclass(frozen=True, slots=True)
+class FeatureModule:
+    name: str
+    workflows: Mapping
+    build: Mapping | None
+
+
+@dataclass(frozen=True, slots=True)
+class Composition:
+    features: frozenset
+    workflows: Mapping
+    modules: Mapping
+    unknown: tuple  # Requested features without a registered module
+
+
+FEATURES = {}
+
+
+def register_feature(name, workflows=None, build=None):
+    """Register feature ``name`` with its plan ``workflows`` and ``build`` contribution."""
+    if name in FEATURES:
+        raise ValueError(f"Feature {name!r} is already registered")
+    FEATURES[name] = FeatureModule(
+        name=sys.intern(name),
+        workflows=MappingProxyType(dict(workflows or {})),
+        build=(build if build is None or isinstance(build, MappingProxyType)
+               else MappingProxyType(dict(build))),
+    )
+    compose_features.cache_clear()
+    return FEATURES[name]
+
+
+@lru_cache(maxsize=4096)
+def compose_features(features):
+    """Compose the plan and build contributions of a frozenset of features."""
+    workflows = {}
+    modules = {}
+    for module in FEATURES.values():  # Registration order keeps output deterministic
+        if module.name in features:
+            workflows.update(module.workflows)
+            if module.build is not None:
+                modules[module.name] = module.build
+    return Composition(
+        features=features,
+        workflows=MappingProxyType(workflows),
+        modules=MappingProxyType(modules),
+        unknown=tuple(sorted(features - FEATURES.keys())),
+    )
+
+
+register_feature(
+    "authentication",
+    workflows={"user_authentication": "OAuth2 implementation"},
+    build=AUTHENTICATION,
+)
+register_feature(
+    "messaging",
+    workflows={"messaging": "WebSocket-based real-time messaging"},
+    build={"transport": "WebSocket", "delivery": "real-time"},
+)
+register_feature(
+    "notifications",
+    workflows={"notifications": "Push notifications using Firebase"},
+    build={"service": "Firebase Cloud Messaging", "channels": ("push",)},
+)
+
+
+@lru_cache(maxsize=4096)
+def _feature_tests(features, unknown=()):
+    return MappingProxyType({
+        feature: f"{feature} not built: no module registered" if feature in unknown
+        else f"{feature} test passed"
+        for feature in features
+    })
+
+
 # Phase 1: Conceptualization
-def conceptualize_app(user_input):
+def conceptualize_app(user_input, verbose=True):
     """
     Accept user input for app goals and features.
     Validate the input and generate a concept.
     """
-    print("Conceptualizing app based on user input...")
+    if verbose:
+        print("Conceptualizing app based on user input...")
+    if user_input is not None and not isinstance(user_input, Mapping):
+        raise ValueError("Invalid input: an app spec must be a mapping, "
+                         f"not {type(user_input).__name__}.")
     if not user_input or not user_input.get("features"):
         raise ValueError("Invalid input: Features are required to conceptualize the app.")
-    concept = {
-        "name": user_input.get("name", "Unnamed App"),
-        "features": user_input["features"],
-        "target_audience": user_input.get("target_audience", "General")
-    }
-    print(f"Concept created: {concept}")
+    features = user_input["features"]
+    if not isinstance(features, (list, tuple)) or not all(isinstance(f, str) for f in features):
+        raise ValueError("Invalid input: Features must be a list of feature names.")
+    concept = Concept(
+        name=user_input.get("name", "Unnamed App"),
+        features=_feature_set(tuple(features)),
+        target_audience=sys.intern(str(user_input.get("target_audience", "General")))
+    )
+    if verbose:
+        print(f"Concept created: {concept}")
     return concept
 
 
 # Phase 2: Planning
-def plan_app(concept):
+def plan_app(concept, verbose=True):
     """
     Generate architecture and workflows based on the app concept.
     """
-    print("Planning app architecture and workflows...")
-    if not concept or not concept.get("features"):
+    if verbose:
+        print("Planning app architecture and workflows...")
+    if not concept or not concept.features:
         raise ValueError("Invalid concept: Features are required to plan the app.")
 
     # Example architecture and workflows based on features
-    architecture = {
-        "backend": "Django REST Framework",
-        "frontend": "React",
-        "database": "PostgreSQL",
-        "features": concept["features"]
-    }
-
-    workflows = {
-        "user_authentication": "OAuth2 implementation",
-        "messaging": "WebSocket-based real-time messaging",
-        "notifications": "Push notifications using Firebase"
-    }
-
-    plan = {
-        "architecture": architecture,
-        "workflows": workflows
-    }
-
-    print(f"Plan created: {plan}")
+    architecture = Architecture(features=concept.features, **DEFAULT_ARCHITECTURE)
+
+    composition = compose_features(frozenset(concept.features))
+    plan = Plan(architecture=architecture, workflows=composition.workflows,
+                modules=composition.modules, unknown=composition.unknown)
+
+    if verbose and plan.unknown:
+        print(f"No module registered for: {', '.join(plan.unknown)}")
+
+    if verbose:
+        print(f"Plan created: {plan}")
     return plan
 
 
 # Phase 3: Execution
-def execute_app_plan(plan):
+def execute_app_plan(plan, verbose=True):
     """
     Build the app using AI-powered automation.
     """
-    print("Executing app plan and building the app...")
-    if not plan or not plan.get("architecture"):
+    if verbose:
+        print("Executing app plan and building the app...")
+    if not plan or not plan.architecture:
         raise ValueError("Invalid plan: Architecture details are required to build the app.")
 
-    # Simulate building the backend
-    backend = f"Backend built using {plan['architecture']['backend']}"
-    # Simulate building the frontend
-    frontend = f"Frontend built using {plan['architecture']['frontend']}"
-    # Simulate setting up the database
-    database = f"Database configured with {plan['architecture']['database']}"
-
-    app = {
-        "backend": backend,
-        "frontend": frontend,
-        "database": database,
-        "features": plan['architecture']['features']
-    }
+    # Simulate building the backend and frontend and setting up the database
+    architecture = plan.architecture
+    backend, frontend, database = _built_components(
+        architecture.backend, architecture.frontend, architecture.database)
 
-    # Add authentication feature
-    app = add_authentication(app)
+    # Assemble the feature modules composed during planning
+    app = App(backend=backend, frontend=frontend, database=database, features=architecture.features,
+              modules=plan.modules, unknown=plan.unknown)
 
-    print(f"App built: {app}")
+    if verbose:
+        print(f"App built: {app}")
     return app
 
 
 # Modular Feature: Authentication
-def add_authentication(app):
+def add_authentication(app, verbose=True):
     """
-    Add authentication to the app.
+    Return a copy of the app with the authentication module added.
     """
-    print("Adding authentication to the app...")
-    app["authentication"] = {
-        "method": "OAuth2",
-        "provider": "Google, Facebook, Custom"
-    }
-    print("Authentication added.")
+    if verbose:
+        print("Adding authentication to the app...")
+    modules = dict(app.modules, authentication=FEATURES["authentication"].build)
+    app = App(app.backend, app.frontend, app.database, app.features, MappingProxyType(modules),
+              app.unknown)
+    if verbose:
+        print("Authentication added.")
     return app
 
 
 # Phase 4: Testing
-def test_app(app):
+def test_app(app, verbose=True):
     """
     Validate the app with automated tests.
     """
-    print("Testing the app for reliability and compliance...")
-    if not app or not app.get("features"):
+    if verbose:
+        print("Testing the app for reliability and compliance...")
+    if not app or not app.features:
         raise ValueError("Invalid app: Features are required to test the app.")
 
-    # Simulate feature validation
-    feature_tests = {
-        feature: f"{feature} test passed" for feature in app["features"]
-    }
+    # Simulate feature validation and performance checks
+    test_results = TestResults(feature_tests=_feature_tests(app.features, app.unknown),
+                               performance=PERFORMANCE_STATUS)
 
-    # Simulate performance checks
-    performance = "Performance tests passed"
-
-    test_results = {
-        "feature_tests": feature_tests,
-        "performance": performance
-    }
-
-    print(f"Test results: {test_results}")
+    if verbose:
+        print(f"Test results: {test_results}")
     return test_results
 
 
 # Phase 5: Launch
-def launch_app(test_results):
+def launch_app(test_results, verbose=True):
     """
     Deploy the app and provide scaling options.
     """
-    print("Launching the app...")
-    if not test_results or not test_results.get("feature_tests"):
+    if verbose:
+        print("Launching the app...")
+    if not test_results or not test_results.feature_tests:
         raise ValueError("Invalid test results: Feature tests are required to launch the app.")
 
-    # Simulate deployment
-    deployment_status = "App deployed to cloud infrastructure"
+    # Simulate deployment and scaling options
+    launch_status = LAUNCHED
+
+    if verbose:
+        print(f"Launch status: {launch_status}")
+    return launch_status
 
-    # Simulate scaling options
-    scaling_options = {
-        "auto_scaling": True,
-        "regions": ["us-east-1", "eu-west-1"]
-    }
 
-    launch_status = {
-        "deployment_status": deployment_status,
-        "scaling_options": scaling_options
-    }
+# Batch API: each stage runs over the whole batch before the next one starts
+def _run_stage(stage, records, verbose):
+    results = []
+    for number, record in enumerate(records):
+        try:
+            results.append(stage(record, verbose))
+        except ValueError as e:
+            raise ValueError(f"App {number}: {e}") from e
+    return results
+
+
+def conceptualize_apps(user_inputs, verbose=False):
+    """Phase 1 for a list (or any iterable) of user inputs."""
+    return _run_stage(conceptualize_app, user_inputs, verbose)
+
+
+def plan_apps(concepts, verbose=False):
+    """Phase 2 for a batch of concepts."""
+    return _run_stage(plan_app, concepts, verbose)
+
+
+def execute_app_plans(plans, verbose=False):
+    """Phase 3 for a batch of plans."""
+    return _run_stage(execute_app_plan, plans, verbose)
+
+
+def test_apps(apps, verbose=False):
+    """Phase 4 for a batch of apps."""
+    return _run_stage(test_app, apps, verbose)
+
+
+def launch_apps(test_results, verbose=False):
+    """Phase 5 for a batch of test results."""
+    return _run_stage(launch_app, test_results, verbose)
+
+
+def run_batch(user_inputs, verbose=False):
+    """
+    Run all five phases over a batch of user inputs, one stage at a time.
+    Returns the launch statuses in input order. A ValueError names the
+    position of the first invalid app. Printing is off unless ``verbose``.
+    """
+    concepts = conceptualize_apps(user_inputs, verbose)
+    plans = plan_apps(concepts, verbose)
+    apps = execute_app_plans(plans, verbose)
+    test_results = test_apps(apps, verbose)
+    return launch_apps(test_results, verbose)
+
+
+# Streaming API: every stage is a generator that pulls one record at a time
+# from the stage before it, so only one app is in flight per stage and a
+# slow consumer throttles the whole chain. Invalid records become StageError
+# records that later stages pass through untouched.
+StageError = namedtuple("StageError", "index stage error")
+
+STAGES = (
+    ("conceptualize", conceptualize_app),
+    ("plan", plan_app),
+    ("execute", execute_app_plan),
+    ("test", test_app),
+    ("launch", launch_app),
+)
+
+
+def stream_stage(name, stage, records, verbose=False):
+    """Yield ``stage(record)`` for each record, or a StageError if it raises ValueError."""
+    for index, record in enumerate(records):
+        if isinstance(record, StageError):
+            yield record
+            continue
+        try:
+            yield stage(record, verbose)
+        except ValueError as e:
+            yield StageError(index, name, str(e))
+
+
+def stream_pipeline(user_inputs, verbose=False):
+    """Lazily run all five phases; yields a launch status or StageError per input, in order."""
+    records = iter(user_inputs)
+    for name, stage in STAGES:
+        records = stream_stage(name, stage, records, verbose)
+    return records
+
+
+def read_jsonl(lines):
+    """Yield one user input per non-blank JSON line; bad lines become StageError records."""
+    for index, line in enumerate(line for line in lines if line.strip()):
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield StageError(index, "input", f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield StageError(index, "input", "Invalid input: each line must be a JSON object")
+            continue
+        yield record
 
-    print(f"Launch status: {launch_status}")
-    return launch_status
+
+def _json_default(value):
+    if isinstance(value, Mapping):
+        return dict(value)
+    if hasattr(value, "__dataclass_fields__"):
+        return as_dict(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def stream_jsonl(lines, output):
+    """
+    Stream app specs from JSONL ``lines`` through the pipeline, writing one
+    JSON result line per input to ``output``. Returns (succeeded, failed).
+    """
+    succeeded = failed = 0
+    for index, result in enumerate(stream_pipeline(read_jsonl(lines))):
+        if isinstance(result, StageError):
+            failed += 1
+            record = {"index": result.index, "stage": result.stage, "error": result.error}
+        else:
+            succeeded += 1
+            record = {"index": index, "launch_status": result}
+        output.write(json.dumps(record, default=_json_default) + "\n")
+    return succeeded, failed
+
+
+# Profiling: each stage runs over the whole batch inside its own section
+def _profiling():
+    """The repository's tools/profiling.py, only imported for --profile."""
+    try:
+        import profiling
+    except ImportError:
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                        "..", "..", "..", "tools"))
+        import profiling
+    return profiling
+
+
+def profile_batch(user_inputs, output_dir):
+    """
+    Run ``user_inputs`` through the batch API with cProfile, tracemalloc and
+    stack sampling per stage (see tools/profiling.py); reports are written to
+    ``output_dir`` even if a stage fails. Returns (launch statuses, profiler,
+    written paths).
+    """
+    profiler = _profiling().Profiler(output_dir).start()
+    records = list(user_inputs)
+    try:
+        for name, stage in STAGES:
+            with profiler.section(name):
+                records = _run_stage(stage, records, False)
+    finally:
+        written = profiler.stop()
+    return records, profiler, written
+
+
+EXAMPLE_INPUT = {
+    "name": "SocialConnect",
+    "features": ["authentication", "messaging", "notifications"],
+    "target_audience": "Young Adults"
+}
+
+
+def _open_specs(specs):
+    """The specs file, or stdin for "-" (left open: it is not ours to close)."""
+    return nullcontext(sys.stdin) if specs == "-" else open(specs, "r", encoding="utf-8")
+
+
+def _main_profile(specs, output_dir):
+    if specs is None:
+        user_inputs = [EXAMPLE_INPUT]
+    else:
+        with _open_specs(specs) as source:
+            user_inputs = list(read_jsonl(source))
+        errors = [r for r in user_inputs if isinstance(r, StageError)]
+        if errors:
+            print(f"Line {errors[0].index}: {errors[0].error}", file=sys.stderr)
+            return 1
+    try:
+        statuses, profiler, written = profile_batch(user_inputs, output_dir)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for index, status in enumerate(statuses):
+        print(json.dumps({"index": index, "launch_status": status}, default=_json_default))
+    print(profiler.summary_table(), file=sys.stderr)
+    print(f"Wrote {len(written)} profile files to {profiler.output_dir}", file=sys.stderr)
+    return 0
 
 
 # Main Workflow
-def main():
+def main(argv=None):
+    """
+    Without arguments, run the example app. With a JSONL file of app specs
+    ("-" for stdin), stream every spec through the pipeline and print one JSON
+    result per line; a summary goes to stderr. ``--profile DIR`` profiles each
+    stage instead (batch API, stopping at the first invalid spec) and writes
+    .pstats, allocation and collapsed-stack reports to DIR.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="AI App Builder workflow")
+    parser.add_argument("specs", nargs="?", help='JSONL file of app specs ("-" for stdin)')
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile each stage and write reports to DIR")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    if args.profile:
+        return _main_profile(args.specs, args.profile)
+    if args.specs:
+        with _open_specs(args.specs) as source:
+            succeeded, failed = stream_jsonl(source, sys.stdout)
+        print(f"{succeeded} apps launched, {failed} failed", file=sys.stderr)
+        return 1 if failed else 0
+
     print("Starting AI App Builder Workflow...")
-    user_input = {
-        "name": "SocialConnect",
-        "features": ["authentication", "messaging", "notifications"],
-        "target_audience": "Young Adults"
-    }  # Example input
     try:
-        concept = conceptualize_app(user_input)
+        concept = conceptualize_app(EXAMPLE_INPUT)
         plan = plan_app(concept)
         app = execute_app_plan(plan)
         test_results = test_app(app)
@@ -164,7 +536,8 @@ def main():
         print("Workflow Complete:", launch_status)
     except ValueError as e:
         print(f"Error: {e}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '../phases/phase3_ai_execution/codebase')))
+import main as app_main  # type: ignore
+
+SOCIAL = {"name": "SocialConnect", "features": ["authentication", "messaging"],
+          "target_audience": "Young Adults"}
+
+
+class TestAppPipeline(unittest.TestCase):
+
+    def _single(self, user_input):
+        concept = app_main.conceptualize_app(user_input)
+        app = app_main.execute_app_plan(app_main.plan_app(concept))
+        return app_main.launch_app(app_main.test_app(app))
+
+    def test_batch_matches_single_runs_without_printing(self):
+        inputs = [SOCIAL, {"name": "Notes", "features": ["notifications"]}]
+        with redirect_stdout(io.StringIO()) as out:
+            expected = [self._single(user_input) for user_input in inputs]
+        self.assertIn("Concept created:", out.getvalue())
+        with redirect_stdout(io.StringIO()) as out:
+            results = app_main.run_batch(iter(inputs))
+        self.assertEqual(results, expected)
+        self.assertEqual(out.getvalue(), "")
+
+    def test_defaults_are_shared_and_read_only(self):
+        plans = app_main.plan_apps(app_main.conceptualize_apps([SOCIAL, SOCIAL]))
+        self.assertIs(plans[0].workflows, plans[1].workflows)
+        self.assertIs(plans[0].architecture.features, plans[1].architecture.features)
+        with self.assertRaises(TypeError):
+            plans[0].workflows["messaging"] = "changed"
+        apps = app_main.execute_app_plans(plans)
+        self.assertIs(apps[0].authentication, app_main.AUTHENTICATION)
+        self.assertIs(apps[0].backend, apps[1].backend)
+
+    def test_records_are_slotted_and_frozen(self):
+        plans = app_main.plan_apps(app_main.conceptualize_apps([SOCIAL]))
+        app = app_main.execute_app_plans(plans)[0]
+        self.assertFalse(hasattr(app, "__dict__"))
+        with self.assertRaises(AttributeError):
+            app.features = ()
+        results = app_main.test_apps([app])
+        self.assertEqual(dict(results[0].feature_tests), {
+            "authentication": "authentication test passed", "messaging": "messaging test passed"})
+        self.assertEqual(app_main.as_dict(app_main.launch_apps(results)[0])["deployment_status"],
+                         app_main.DEPLOYMENT_STATUS)
+
+    def test_invalid_app_is_named_by_position(self):
+        with self.assertRaisesRegex(ValueError, r"^App 1: Invalid input"):
+            app_main.run_batch([SOCIAL, {"name": "Empty", "features": []}])
+
+    def test_non_mapping_app_spec_is_rejected(self):
+        with self.assertRaisesRegex(ValueError,
+                                    r"^App 1: Invalid input: an app spec must be a mapping"):
+            app_main.run_batch([SOCIAL, ["authentication"]])
+
+    def test_main_leaves_stdin_open(self):
+        stdin = io.StringIO('{"name": "A", "features": ["messaging"]}\n')
+        with mock.patch.object(sys, "stdin", stdin), redirect_stdout(io.StringIO()), \
+                redirect_stderr(io.StringIO()):
+            self.assertEqual(app_main.main(["-"]), 0)
+        self.assertFalse(stdin.closed)
+
+    def test_plan_and_build_follow_the_requested_features(self):
+        concept = app_main.conceptualize_app({"features": ["messaging", "custom"]}, False)
+        plan = app_main.plan_app(concept, False)
+        self.assertEqual(dict(plan.workflows), {"messaging": "WebSocket-based real-time messaging"})
+        app = app_main.execute_app_plan(plan, False)
+        self.assertEqual(list(app.modules), ["messaging"])
+        self.assertIsNone(app.authentication)
+        composition = app_main.compose_features(frozenset({"messaging", "custom"}))
+        self.assertEqual(composition.unknown, ("custom",))
+
+    def test_unknown_features_are_reported(self):
+        concept = app_main.conceptualize_app({"features": ["messaging", "custom"]}, False)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            plan = app_main.plan_app(concept)
+        self.assertEqual(plan.unknown, ("custom",))
+        self.assertIn("No module registered for: custom", out.getvalue())
+        app = app_main.add_authentication(app_main.execute_app_plan(plan, False), False)
+        self.assertEqual(app.unknown, ("custom",))
+        results = app_main.test_app(app, False)
+        self.assertEqual(results.feature_tests["custom"], "custom not built: no module registered")
+        self.assertEqual(results.feature_tests["messaging"], "messaging test passed")
+
+    def test_feature_combinations_are_composed_once(self):
+        app_main.compose_features.cache_clear()
+        inputs = [{"features": ["authentication", "messaging"]},
+                  {"features": ["messaging", "authentication"]}] * 50
+        plans = app_main.plan_apps(app_main.conceptualize_apps(inputs))
+        info = app_main.compose_features.cache_info()
+        self.assertEqual((info.misses, info.currsize), (1, 1))
+        self.assertIs(plans[0].modules, plans[1].modules)
+
+    def test_registering_a_feature_extends_new_plans(self):
+        with mock.patch.dict(app_main.FEATURES):
+            app_main.register_feature("payments", workflows={"checkout": "Stripe checkout"},
+                                      build={"provider": "Stripe"})
+            concept = app_main.conceptualize_app({"features": ["payments"]}, False)
+            plan = app_main.plan_app(concept, False)
+            self.assertEqual(dict(plan.modules["payments"]), {"provider": "Stripe"})
+            with self.assertRaises(ValueError):
+                app_main.register_feature("payments")
+        app_main.compose_features.cache_clear()
+
+    def test_stream_pulls_one_input_at_a_time(self):
+        pulled = []
+
+        def inputs():
+            for i in range(1000):
+                pulled.append(i)
+                yield SOCIAL
+
+        stream = app_main.stream_pipeline(inputs())
+        self.assertEqual(pulled, [])
+        self.assertEqual(next(stream), app_main.run_batch([SOCIAL])[0])
+        self.assertEqual(pulled, [0])
+
+    def test_stream_turns_failures_into_error_records(self):
+        lines = ['{"name": "A", "features": ["messaging"]}\n', "oops\n", "\n", '{"name": "B"}\n',
+                 "[1]\n", '{"features": [{"name": "x"}]}\n']
+        results = list(app_main.stream_pipeline(app_main.read_jsonl(lines)))
+        self.assertIs(results[0], app_main.LAUNCHED)
+        self.assertEqual([(r.index, r.stage) for r in results[1:]],
+                         [(1, "input"), (2, "conceptualize"), (3, "input"), (4, "conceptualize")])
+
+    def test_stream_jsonl_writes_one_line_per_input(self):
+        out = io.StringIO()
+        counts = app_main.stream_jsonl(['{"name": "A", "features": ["x"]}', '{"features": []}'],
+                                       out)
+        self.assertEqual(counts, (1, 1))
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn('"regions": ["us-east-1", "eu-west-1"]', lines[0])
+        self.assertIn('"stage": "conceptualize"', lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
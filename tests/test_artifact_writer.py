@@ -0,0 +1,87 @@
+import importlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import artifact_writer  # type: ignore
+from artifact_writer import ArtifactWriter, write_atomic  # type: ignore
+from cli_interface import run_phase2_wizard  # type: ignore
+
+
+class TestArtifactWriter(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_flush_writes_all_files_and_reports_throughput(self):
+        writer = ArtifactWriter(workers=4)
+        for i in range(20):
+            writer.add(self.root / f"screen_{i}" / "user_flow.md", f"# Screen {i}\n")
+        report = writer.flush()
+        self.assertEqual(report["files"], 20)
+        self.assertEqual(report["bytes"], sum(len(f"# Screen {i}\n") for i in range(20)))
+        self.assertEqual((self.root / "screen_7" / "user_flow.md").read_text(encoding="utf-8"),
+                         "# Screen 7\n")
+        self.assertEqual(len(writer), 0)
+
+    def test_failed_write_leaves_no_temp_files(self):
+        (self.root / "taken.md").mkdir()  # The write starts, then os.replace fails
+        writer = ArtifactWriter(workers=2)
+        writer.add(self.root / "ok.md", "fine")
+        writer.add(self.root / "taken.md", "unreachable")
+        with self.assertRaises(OSError):
+            writer.flush()
+        leftovers = [p.name for p in self.root.iterdir() if p.name.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+    def test_written_files_get_the_usual_mode(self):
+        umask = os.umask(0)
+        os.umask(umask)
+        kept = self.root / "kept.md"
+        kept.write_text("old", encoding="utf-8")
+        kept.chmod(0o640)
+        writer = ArtifactWriter(workers=2)
+        writer.add(self.root / "new.md", "new")
+        writer.add(kept, "new")
+        writer.flush()
+        self.assertEqual((self.root / "new.md").stat().st_mode & 0o777, 0o666 & ~umask)
+        self.assertEqual(kept.stat().st_mode & 0o777, 0o640)
+
+    def test_import_leaves_the_umask_alone(self):
+        with mock.patch("os.umask", side_effect=AssertionError("umask changed")):
+            importlib.reload(artifact_writer)
+
+    def test_failed_chmod_leaves_no_temp_file(self):
+        with mock.patch("os.chmod", side_effect=PermissionError("denied")):
+            with self.assertRaises(PermissionError):
+                write_atomic(str(self.root / "doc.md"), b"data")
+        self.assertEqual(list(self.root.iterdir()), [])
+
+    def test_phase2_wizard_writes_seven_files_per_screen(self):
+        phase1 = self.root / "phase1_concept_strategy" / "deliverables"
+        phase1.mkdir(parents=True)
+        for name in ("home_screen", "settings"):
+            (phase1 / f"{name}.md").write_text("# Doc\n", encoding="utf-8")
+
+        with redirect_stdout(io.StringIO()):
+            report = run_phase2_wizard(self.root, workers=3)
+
+        self.assertEqual(report["files"], 2 * 7 + 1)
+        phase2 = self.root / "phase2_development_planning"
+        self.assertTrue((phase2 / "screen_flows" / "home_screen.mmd").is_file())
+        self.assertEqual(len(list((phase2 / "deliverables" / "settings").iterdir())), 6)
+        self.assertIn("- [ ] Settings:", (phase2 / "task_board.md").read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
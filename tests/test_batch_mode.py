@@ -0,0 +1,81 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import cli_interface  # type: ignore
+
+
+class TestBatchMode(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _answers(self, data):
+        path = self.root / "answers.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+    def test_batch_runs_all_phases_without_prompts(self):
+        path = self._answers([
+            {"project_root": "shop", "app_name": "Shop", "must_haves": ["Cart", "Checkout"]},
+            {"project_root": "blog", "app_name": "Blog"},
+        ])
+        with mock.patch("builtins.input", side_effect=AssertionError("prompted")), \
+                mock.patch("os.system", side_effect=AssertionError("spawned")), \
+                redirect_stdout(io.StringIO()):
+            results = cli_interface.run_batch(path)
+
+        self.assertEqual([r["app_name"] for r in results], ["Shop", "Blog"])
+        shop = self.root / "shop"
+        deliverables = shop / "phase1_concept_strategy" / "deliverables"
+        problem = (deliverables / "01_problem_statement.md").read_text(encoding="utf-8")
+        self.assertIn("- Must‑haves: Cart, Checkout", problem)
+        self.assertTrue((shop / "phase2_development_planning" / "task_board.md").is_file())
+        self.assertTrue((shop / "phase3_ai_execution" / "codebase" / "main.py").is_file())
+        self.assertTrue((shop / "phase4_testing_iteration" / "test_results.md").is_file())
+        self.assertTrue((self.root / "blog" / "phase5_launch_growth" / "trust_safety.md").is_file())
+        self.assertEqual(set(results[0]["timings"]),
+                         {"phase1", "phase2", "phase3", "phase4", "phase5", "total"})
+
+    def test_single_answer_set_with_explicit_root(self):
+        path = self._answers({"app_name": "Solo"})
+        with redirect_stdout(io.StringIO()):
+            results = cli_interface.run_batch(path, self.root / "solo")
+        self.assertEqual(results[0]["project_root"], str((self.root / "solo").resolve()))
+
+    def test_root_override_rejected_for_many_answer_sets(self):
+        path = self._answers([{"app_name": "A"}, {"app_name": "B"}])
+        with self.assertRaises(ValueError):
+            cli_interface.run_batch(path, self.root)
+
+    def test_answer_sets_without_root_are_rejected(self):
+        path = self._answers([{"app_name": "A", "project_root": "a"}, {"app_name": "B"}])
+        with mock.patch.object(cli_interface, "run_headless") as run_headless, \
+                self.assertRaisesRegex(ValueError, r"\[1\] have no project_root"):
+            cli_interface.run_batch(path)
+        run_headless.assert_not_called()
+
+    def test_headless_run_never_defaults_to_the_repository(self):
+        with self.assertRaises(ValueError):
+            cli_interface.run_headless({"app_name": "Solo"})
+
+    def test_root_override_rejected_with_workers(self):
+        path = self._answers([{"app_name": "A", "project_root": str(self.root / "a")}])
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            cli_interface.main(["batch", str(path), "--root", str(self.root), "--workers", "2"])
+        self.assertFalse((self.root / "a").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
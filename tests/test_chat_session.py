@@ -0,0 +1,109 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import chat_session  # type: ignore
+from chat_session import ChatSession  # type: ignore
+
+
+def scripted(lines):
+    """An async reader that replays ``lines`` and then reports end of input."""
+    queue = list(lines)
+
+    async def read_line(prompt):
+        await asyncio.sleep(0)
+        return queue.pop(0) if queue else None
+    return read_line
+
+
+class TestChatSession(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _session(self, lines, root=None):
+        out = []
+        return ChatSession(scripted(lines), out.append, root or self.root), out
+
+    def test_view_progress_then_exit(self):
+        session, out = self._session(["2", "3"])
+        asyncio.run(session.run())
+        text = "".join(out)
+        self.assertIn("Phase 1: Concept & Strategy", text)
+        self.assertIn("[no progress]", text)
+        self.assertIn("Goodbye!", text)
+
+    def test_phase_generation_runs_as_background_job(self):
+        answers = ["Shop", "", "", "", "", ""]
+        session, out = self._session(["1", *answers, "4", "3"])
+        asyncio.run(session.run())
+        text = "".join(out)
+        self.assertIn("Started Phase 1: Concept & Strategy in the background (job", text)
+        self.assertEqual(session.jobs[0].status, "done")
+        self.assertIn("Let’s capture", text)
+        problem = self.root / "phase1_concept_strategy" / "deliverables" / "01_problem_statement.md"
+        self.assertIn("- App name: Shop", problem.read_text(encoding="utf-8"))
+
+    def test_resume_picks_the_next_phase(self):
+        first, _ = self._session(["1", "", "", "", "", "", "", "3"])
+        asyncio.run(first.run())
+        second, out = self._session(["1", "3"])
+        asyncio.run(second.run())
+        self.assertIn("Started Phase 2: Development Planning", "".join(out))
+        self.assertTrue((self.root / "phase2_development_planning" / "task_board.md").is_file())
+
+    def test_sessions_share_one_event_loop(self):
+        other = self.root / "other"
+
+        async def both():
+            a, out_a = self._session(["2", "invalid", "3"])
+            b, out_b = self._session(["2", "3"], other)
+            await asyncio.gather(a.run(), b.run())
+            return "".join(out_a), "".join(out_b)
+
+        text_a, text_b = asyncio.run(both())
+        self.assertIn("Invalid choice", text_a)
+        self.assertIn("Goodbye!", text_b)
+
+    def test_stdout_is_restored_after_the_session(self):
+        before = sys.stdout
+        session, _ = self._session(["2", "3"])
+        asyncio.run(session.run())
+        self.assertIs(sys.stdout, before)
+
+    def test_failed_job_reports_its_traceback(self):
+        def broken():
+            raise RuntimeError("disk full")
+
+        async def scenario():
+            session, out = self._session([])
+            session._router = chat_session._install_router()
+            try:
+                session.start_job("Broken", broken)
+                await session.close()
+            finally:
+                chat_session._uninstall_router()
+            return session, "".join(out)
+
+        session, text = asyncio.run(scenario())
+        self.assertEqual(session.jobs[0].status, "failed")
+        self.assertIn("Broken failed: disk full", text)
+        self.assertIn("Traceback (most recent call last)", text)
+        self.assertIn("RuntimeError: disk full", session.jobs[0].output.getvalue())
+
+    def test_end_of_input_exits(self):
+        session, out = self._session([])
+        asyncio.run(session.run())
+        self.assertIn("Input interrupted", "".join(out))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+from guide_store import GuideStore, Step, iter_steps  # type: ignore
+
+SAMPLE_STEPS = """# Phase 4
+
+## How This Step Works
+- Not a step
+
+## Step 1 – Prepare Test Environment
+**Short description:** Set up everything needed for testing.
+- Ensure environments are live.
+- Connect CI/CD.
+
+---
+
+## Step 2 – Edge Cases
+**Short description:** Test the edges.
+- Identify edge cases.
+### Edge Cases (Expanded)
+- Test boundary values.
+
+## Progress Updates
+- Not part of step 2
+"""
+
+
+class TestGuideStore(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.guide = os.path.join(self._tmp.name, "phase_1.md")
+        self.cache = os.path.join(self._tmp.name, "cache", "guides.json")
+        self._write("# Phase 1 – Concept\n\n## Step 1 – Mission\n- Describe it\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, text):
+        with open(self.guide, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_outline_is_parsed_once_and_cached(self):
+        store = GuideStore()
+        outline = store.get(self.guide)
+        self.assertEqual(outline["title"], "Phase 1 – Concept")
+        self.assertEqual(outline["headings"], [[1, "Phase 1 – Concept"], [2, "Step 1 – Mission"]])
+        self.assertIs(store.get(self.guide), outline)
+        self.assertEqual(store.stats, {"hits": 1, "parses": 1})
+
+    def test_changed_guide_is_reparsed(self):
+        store = GuideStore()
+        store.get(self.guide)
+        self._write("# Renamed guide with a longer body\n")
+        self.assertEqual(store.get(self.guide)["title"], "Renamed guide with a longer body")
+        self.assertEqual(store.stats["parses"], 2)
+
+    def test_disk_cache_is_shared_between_stores(self):
+        GuideStore(self.cache).get(self.guide)
+        fresh = GuideStore(self.cache)
+        outline = fresh.get(self.guide)
+        self.assertEqual(outline["title"], "Phase 1 – Concept")
+        self.assertEqual(outline["steps"], [Step("1", "Mission", 3, "", ("Describe it",))])
+        self.assertEqual(fresh.stats, {"hits": 1, "parses": 0})
+
+    def test_missing_guide_returns_none(self):
+        self.assertIsNone(GuideStore().get(os.path.join(self._tmp.name, "missing.md")))
+
+    def test_preview_is_truncated(self):
+        self._write("".join(f"line {i}\n" for i in range(40)))
+        outline = GuideStore(preview_lines=30).get(self.guide)
+        self.assertEqual(len(outline["preview"]), 30)
+        self.assertTrue(outline["truncated"])
+
+
+class TestIterSteps(unittest.TestCase):
+
+    def test_step_headings_descriptions_and_directives(self):
+        steps = list(iter_steps(SAMPLE_STEPS.splitlines(keepends=True)))
+        self.assertEqual([s.heading for s in steps], [
+            "Step 1 – Prepare Test Environment",
+            "Step 2 – Edge Cases",
+        ])
+        self.assertEqual(steps[0].description, "Set up everything needed for testing.")
+        self.assertEqual(steps[0].directives, ("Ensure environments are live.", "Connect CI/CD."))
+        self.assertEqual(steps[0].line, 6)
+        self.assertEqual(steps[1].directives, ("Identify edge cases.", "Test boundary values."))
+
+    def test_is_lazy(self):
+        """Steps are yielded as soon as the next section starts."""
+        lines = iter(SAMPLE_STEPS.splitlines())
+        steps = iter_steps(lines)
+        self.assertEqual(next(steps).number, "1")
+        self.assertIn("## Progress Updates", list(lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import unittest
+
+TOOLS = os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools'))
+
+# Cumulative `-X importtime` budget for `import cli_interface`, best of RUNS
+IMPORT_BUDGET_MS = float(os.environ.get("AI_BUILDER_IMPORT_BUDGET_MS", "60"))
+RUNS = 3
+
+# Only needed once a command generates, resets or profiles something
+DEFERRED_MODULES = ("concurrent.futures", "tempfile", "hashlib", "datetime", "dataclasses",
+                    "cProfile", "tracemalloc", "yaml", "asyncio", "argparse")
+
+
+def _python(*args):
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    return subprocess.run([sys.executable, *args], cwd=TOOLS, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_heavy_modules_load_on_first_use(self):
+        code = ("import sys, cli_interface; "
+                f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))")
+        self.assertEqual(_python("-c", code).stdout.strip(), "")
+
+    def test_phases_load_lazily(self):
+        code = ("import cli_interface; "
+                "print(cli_interface._PHASES is None, len(list(cli_interface.PHASES)))")
+        loaded_lazily, count = _python("-c", code).stdout.split()
+        self.assertEqual(loaded_lazily, "True")
+        self.assertGreater(int(count), 0)
+
+    def test_import_stays_within_budget(self):
+        _python("-c", "import cli_interface")  # Warm __pycache__ so compiling is not measured
+        timings = []
+        for _ in range(RUNS):
+            lines = _python("-X", "importtime", "-c", "import cli_interface").stderr.splitlines()
+            (line,) = [line for line in lines if line.rstrip().endswith("| cli_interface")]
+            timings.append(int(line.split("|")[1]) / 1000)
+        self.assertLess(min(timings), IMPORT_BUDGET_MS,
+                        f"import cli_interface took {min(timings):.1f} ms "
+                        f"(budget {IMPORT_BUDGET_MS:.0f} ms)")
+
+
+if __name__ == "__main__":
+    unittest.main()
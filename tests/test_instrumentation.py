@@ -0,0 +1,92 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import cli_interface  # type: ignore
+import instrumentation  # type: ignore
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        tracer = instrumentation.TRACER
+        self._saved = (tracer.level, tracer.trace_path, tracer.record)
+        tracer.reset()
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        tracer = instrumentation.TRACER
+        tracer.level, tracer.trace_path, tracer.record = self._saved
+        tracer.reset()
+        for key in ("AI_BUILDER_LOG_LEVEL", "AI_BUILDER_TRACE"):
+            os.environ.pop(key, None)
+        self._tmp.cleanup()
+
+    def test_disabled_logging_and_spans_do_no_work(self):
+        instrumentation.configure(level="WARNING", record=False)
+        instrumentation.TRACER.trace_path = None
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted while disabled")
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            instrumentation.debug("value %s", Exploding())
+            instrumentation.info("value %s", Exploding())
+            instrumentation.warning("shown %d", 3)
+        self.assertEqual(out.getvalue(), "[WARNING] shown 3\n")
+        self.assertIs(instrumentation.span("x"), instrumentation.NULL_SPAN)
+
+    def test_nested_spans_are_exported_as_one_tree(self):
+        trace = os.path.join(self._tmp.name, "trace.jsonl")
+        instrumentation.configure(trace_path=trace)
+        with instrumentation.span("run", project="shop"):
+            with instrumentation.span("run.step") as step:
+                step.set(files=2)
+            with self.assertRaises(ValueError):
+                with instrumentation.span("run.fail"):
+                    raise ValueError("boom")
+        with instrumentation.span("other"):
+            pass
+
+        with open(trace, encoding="utf-8") as f:
+            trees = [json.loads(line) for line in f]
+        self.assertEqual([t["name"] for t in trees], ["run", "other"])
+        run = trees[0]
+        self.assertEqual(run["attrs"], {"project": "shop"})
+        self.assertEqual([c["name"] for c in run["children"]], ["run.step", "run.fail"])
+        self.assertEqual(run["children"][0]["attrs"], {"files": 2})
+        self.assertEqual(run["children"][1]["error"], "ValueError: boom")
+        self.assertGreaterEqual(run["seconds"], run["children"][0]["seconds"])
+
+        rows = {row[0]: row for row in instrumentation.TRACER.summary_rows()}
+        self.assertEqual(rows["run.fail"][5], 1)
+        self.assertIn("run.step", instrumentation.summary_table())
+
+    def test_cli_traces_phases_and_steps(self):
+        answers = os.path.join(self._tmp.name, "answers.json")
+        trace = os.path.join(self._tmp.name, "trace.jsonl")
+        with open(answers, "w", encoding="utf-8") as f:
+            json.dump({"app_name": "Shop", "project_root": "proj"}, f)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            cli_interface.main(["batch", answers, "--trace", trace, "--log-level", "warning"])
+
+        self.assertNotIn("[DEBUG]", out.getvalue())
+        self.assertIn("phase3.codebase", out.getvalue())
+        with open(trace, encoding="utf-8") as f:
+            (tree,) = [json.loads(line) for line in f]
+        phases = [c["name"] for c in tree["children"]]
+        self.assertEqual(phases, ["phase1", "phase2", "phase3", "phase4", "phase5"])
+        phase4 = tree["children"][3]
+        self.assertIn("phase4.write", [c["name"] for c in phase4["children"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import io
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import path_checker  # type: ignore
+import reference_index  # type: ignore
+
+
+class TestPathChecker(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        os.makedirs(os.path.join(self.root, "assets"))
+        self._write("assets/logo.png", b"png")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, data):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_reports_missing_references_only(self):
+        doc = self._write("doc.md", b"ok: path/to/assets/logo.png\n"
+                                    b"bad: `path/to/assets/missing.png`, path/to/x.txt\n")
+        issues = list(path_checker.scan_paths(self.root))
+        self.assertEqual(issues, [
+            path_checker.PathIssue(doc, 2, "assets/missing.png", None),
+            path_checker.PathIssue(doc, 2, "x.txt", None),
+        ])
+
+    def test_binary_and_ignored_directories_are_skipped(self):
+        self._write("image.bin", b"\0\0path/to/missing")
+        self._write(".git/config", b"path/to/missing")
+        self._write("__pycache__/mod.txt", b"path/to/missing")
+        self.assertEqual(list(path_checker.scan_paths(self.root)), [])
+
+    def test_lines_split_across_chunks(self):
+        data = b"x" * 10 + b"\npath/to/missing_one\n" + b"y" * 25 + b" path/to/missing_two"
+        with mock.patch.object(reference_index, "CHUNK_SIZE", 7):
+            lines = list(reference_index.iter_lines(io.BytesIO(data)))
+        self.assertEqual([n for n, _ in lines], [1, 2, 3])
+        self.assertEqual(lines[1][1], b"path/to/missing_one")
+        self.assertTrue(lines[2][1].endswith(b"path/to/missing_two"))
+
+    def test_overlong_lines_are_truncated(self):
+        data = b"a" * 50 + b"\nshort\n"
+        with mock.patch.object(reference_index, "CHUNK_SIZE", 8), \
+                mock.patch.object(reference_index, "MAX_LINE", 16):
+            lines = list(reference_index.iter_lines(io.BytesIO(data)))
+        self.assertEqual(lines[1], (2, b"short"))
+        self.assertLessEqual(len(lines[0][1]), 16)
+
+    def test_scan_is_lazy(self):
+        self._write("a.md", b"path/to/missing_a\n")
+        self._write("b.md", b"path/to/missing_b\n")
+        issues = path_checker.scan_paths(self.root)
+        self.assertIn(next(issues).reference, {"missing_a", "missing_b"})
+
+    def test_issues_arrive_before_the_whole_tree_is_scanned(self):
+        self._write("a.md", b"path/to/missing_a\n")
+        self._write("b.md", b"path/to/missing_b\n")
+        release = threading.Event()
+        released = []
+        scan_file = reference_index.scan_file
+
+        def slow_scan(path, marker):
+            if path.endswith("b.md"):
+                released.append(release.wait(2))
+            return scan_file(path, marker)
+
+        with mock.patch.object(reference_index, "scan_file", slow_scan):
+            issues = path_checker.scan_paths(self.root, persist=False)
+            try:
+                self.assertEqual(next(issues).reference, "missing_a")  # b.md is still being read
+            finally:
+                release.set()
+            self.assertEqual([issue.reference for issue in issues], ["missing_b"])
+        self.assertEqual(released, [True])  # Released by the consumer, not by the timeout
+
+
+if __name__ == "__main__":
+    unittest.main()
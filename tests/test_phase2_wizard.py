@@ -0,0 +1,86 @@
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+from cli_interface import run_phase2_wizard  # type: ignore
+
+
+class TestIncrementalPhase2(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.phase1 = self.root / "phase1_concept_strategy" / "deliverables"
+        self.phase1.mkdir(parents=True)
+        self.phase2 = self.root / "phase2_development_planning"
+        for name in ("home", "profile", "settings"):
+            self._write_source(name, f"# {name}\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write_source(self, name, text):
+        (self.phase1 / f"{name}.md").write_text(text, encoding="utf-8")
+
+    def _run(self, **kwargs):
+        with redirect_stdout(io.StringIO()):
+            return run_phase2_wizard(self.root, workers=2, **kwargs)
+
+    def test_rerun_without_changes_writes_nothing(self):
+        self.assertEqual(self._run()["files"], 3 * 7 + 1)
+        report = self._run()
+        self.assertEqual(report["files"], 0)
+        self.assertEqual(report["skipped"], 3)
+
+    def test_editing_one_source_touches_only_its_screen(self):
+        self._run()
+        board_mtime = (self.phase2 / "task_board.md").stat().st_mtime_ns
+        time.sleep(0.01)
+        self._write_source("profile", "# profile\n\nNow with more detail.\n")
+        report = self._run()
+        self.assertEqual(report["files"], 7)
+        self.assertEqual(report["skipped"], 2)
+        self.assertEqual((self.phase2 / "task_board.md").stat().st_mtime_ns, board_mtime)
+
+    def test_removed_source_deletes_its_outputs(self):
+        self._run()
+        (self.phase1 / "settings.md").unlink()
+        report = self._run()
+        self.assertEqual(report["removed"], 7)
+        self.assertFalse((self.phase2 / "deliverables" / "settings").exists())
+        self.assertFalse((self.phase2 / "screen_flows" / "settings.mmd").exists())
+        self.assertNotIn("Settings", (self.phase2 / "task_board.md").read_text(encoding="utf-8"))
+
+    def test_removing_every_source_removes_the_task_board(self):
+        self._run()
+        for name in ("home", "profile", "settings"):
+            (self.phase1 / f"{name}.md").unlink()
+        self.assertIsNone(self._run())
+        self.assertFalse((self.phase2 / "task_board.md").exists())
+        self.assertFalse((self.phase2 / "deliverables" / "home").exists())
+
+    def test_missing_output_is_regenerated(self):
+        self._run()
+        (self.phase2 / "deliverables" / "home" / "data_flow.md").unlink()
+        self.assertEqual(self._run()["files"], 7)
+
+    def test_force_regenerates_everything(self):
+        self._run()
+        self.assertEqual(self._run(force=True)["files"], 3 * 7 + 1)
+
+    def test_force_still_removes_outputs_of_deleted_sources(self):
+        self._run()
+        (self.phase1 / "settings.md").unlink()
+        report = self._run(force=True)
+        self.assertEqual((report["files"], report["removed"]), (2 * 7 + 1, 7))
+        self.assertFalse((self.phase2 / "deliverables" / "settings").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
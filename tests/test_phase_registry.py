@@ -0,0 +1,76 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+from phase_registry import PhaseRegistry  # type: ignore
+from workspace_index import WorkspaceIndex  # type: ignore
+
+DEFAULT_CONFIG = os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools/phases.json'))
+
+
+class TestPhaseRegistry(unittest.TestCase):
+
+    def test_default_config_has_one_entry_per_phase(self):
+        registry = PhaseRegistry.from_config(DEFAULT_CONFIG, "/root", "/brain")
+        self.assertEqual(registry.indices(), [1, 2, 3, 4, 5])
+        self.assertEqual(registry.get(3)["title"], "Phase 3: AI Execution")
+        self.assertEqual(registry.get(3)["folder"], os.path.join("/root", "phase3_ai_execution"))
+
+    def test_duplicate_index_is_rejected(self):
+        registry = PhaseRegistry()
+        registry.register(1, "Phase 1", "/a", "/a.md", {"direct_files": True})
+        with self.assertRaises(ValueError):
+            registry.register(1, "Phase 1 again", "/b", "/b.md", {})
+
+    def test_unknown_progress_signal_is_rejected(self):
+        with self.assertRaises(ValueError):
+            PhaseRegistry().register(1, "Phase 1", "/a", "/a.md", {"glob": "*.md"})
+
+    def test_iteration_is_ordered_by_index(self):
+        registry = PhaseRegistry()
+        registry.register(2, "Two", "/2", "/2.md", {})
+        registry.register(1, "One", "/1", "/1.md", {})
+        self.assertEqual([p["title"] for p in registry], ["One", "Two"])
+        with self.assertRaises(KeyError):
+            registry.get(7)
+
+    def test_progress_spec_is_evaluated_against_index(self):
+        with tempfile.TemporaryDirectory() as root:
+            folder = os.path.join(root, "phase4_testing_iteration")
+            os.makedirs(folder)
+            config = os.path.join(root, "phases.json")
+            with open(config, "w", encoding="utf-8") as f:
+                json.dump([{
+                    "index": 4, "title": "Phase 4", "folder": "phase4_testing_iteration",
+                    "guide": "phase_4.md", "progress": {"files": ["test_results.md"]},
+                }], f)
+            phase = PhaseRegistry.from_config(config, root, root).get(4)
+
+            index = WorkspaceIndex(root)
+            index.scan([folder])
+            self.assertFalse(phase["progress_check"](index, phase["folder"]))
+            with open(os.path.join(folder, "test_results.md"), "w", encoding="utf-8") as f:
+                f.write("# Test Results\n")
+            self.assertTrue(phase["progress_check"](index, phase["folder"]))
+
+    def test_phase1_progress_counts_wizard_deliverables(self):
+        # The Phase 1 wizard writes into deliverables/, not the phase folder itself
+        with tempfile.TemporaryDirectory() as root:
+            phase = PhaseRegistry.from_config(DEFAULT_CONFIG, root, root).get(1)
+            deliverables = os.path.join(phase["folder"], "deliverables")
+            os.makedirs(deliverables)
+            index = WorkspaceIndex(root)
+            index.scan([phase["folder"]])
+            self.assertFalse(phase["progress_check"](index, phase["folder"]))
+            problem = os.path.join(deliverables, "01_problem_statement.md")
+            with open(problem, "w", encoding="utf-8") as f:
+                f.write("# Problem Statement\n")
+            index.scan([phase["folder"]])
+            self.assertTrue(phase["progress_check"](index, phase["folder"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
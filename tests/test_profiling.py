@@ -0,0 +1,108 @@
+import io
+import json
+import os
+import pstats
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '../phases/phase3_ai_execution/codebase')))
+import cli_interface  # type: ignore
+import main as app_main  # type: ignore
+import profiling  # type: ignore
+
+
+def _busy(seconds):
+    chunks = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        chunks.append(bytearray(64))
+    return len(chunks)
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.out = self._tmp.name
+
+    def tearDown(self):
+        profiling.stop()
+        self._tmp.cleanup()
+
+    def test_sections_write_pstats_allocations_and_collapsed_stacks(self):
+        with profiling.Profiler(self.out, interval=0.001) as profiler:
+            for _ in range(2):
+                with profiler.section("work"):
+                    _busy(0.02)
+                    with profiler.section("nested"):  # No-op inside another section
+                        _busy(0.01)
+
+        self.assertEqual(list(profiler.sections), ["work"])
+        self.assertEqual(profiler.sections["work"].calls, 2)
+        self.assertEqual(sorted(os.listdir(self.out)),
+                         ["stacks.collapsed", "work.alloc.txt", "work.pstats"])
+
+        functions = {func[2] for func in pstats.Stats(os.path.join(self.out, "work.pstats")).stats}
+        self.assertIn("_busy", functions)
+        with open(os.path.join(self.out, "work.alloc.txt"), encoding="utf-8") as f:
+            self.assertTrue(f.readline().startswith("Section: work (2 calls"))
+        with open(os.path.join(self.out, "stacks.collapsed"), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            self.assertTrue(stack.startswith("work;"))
+            self.assertNotIn("(profiling.py", stack)
+            self.assertGreater(int(count), 0)
+        self.assertTrue(any("_busy (test_profiling.py" in line for line in lines))
+
+    def test_profiled_is_a_no_op_without_a_running_profiler(self):
+        wrapped = profiling.profiled("busy")(_busy)
+        self.assertGreater(wrapped(0.001), 0)
+        profiler = profiling.start(self.out, interval=0)
+        wrapped(0.001)
+        self.assertIs(profiling.stop()[0], profiler)
+        self.assertEqual(profiler.sections["busy"].calls, 1)
+        self.assertIsNone(profiling.stop())
+
+    def test_cli_profiles_each_wizard(self):
+        answers = os.path.join(self.out, "answers.json")
+        with open(answers, "w", encoding="utf-8") as f:
+            json.dump({"app_name": "Shop", "project_root": "proj"}, f)
+        reports = os.path.join(self.out, "profile")
+        with redirect_stdout(io.StringIO()):
+            cli_interface.main(["batch", answers, "--profile", reports])
+        for index in range(1, 6):
+            self.assertTrue(os.path.isfile(os.path.join(reports, f"phase{index}_wizard.pstats")))
+        self.assertTrue(os.path.isfile(os.path.join(reports, "stacks.collapsed")))
+
+    def test_pooled_batch_profiles_each_project_in_its_worker(self):
+        answers = os.path.join(self.out, "answers.json")
+        with open(answers, "w", encoding="utf-8") as f:
+            json.dump([{"app_name": "Shop", "project_root": "shop"},
+                       {"app_name": "Blog", "project_root": "blog"}], f)
+        reports = os.path.join(self.out, "profile")
+        with redirect_stdout(io.StringIO()):
+            cli_interface.main(["batch", answers, "--workers", "2", "--profile", reports])
+        for folder in ("000_shop", "001_blog"):
+            for index in range(1, 6):
+                report = os.path.join(reports, folder, f"phase{index}_wizard.pstats")
+                self.assertTrue(os.path.isfile(report))
+
+    def test_app_workflow_profiles_each_stage(self):
+        reports = os.path.join(self.out, "profile")
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(io.StringIO()):
+            self.assertEqual(app_main.main(["--profile", reports]), 0)
+        self.assertIn("launch_status", json.loads(out.getvalue()))
+        for name, _ in app_main.STAGES:
+            self.assertTrue(os.path.isfile(os.path.join(reports, f"{name}.alloc.txt")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import progress_scoring  # type: ignore
+from progress_scoring import parse_document, score_document, score_file, score_files  # type: ignore
+
+PERSONAS = """# User Personas
+Last updated: 2026-01-01
+
+## Primary persona
+- Who: Busy parents
+- Goals: Plan meals fast
+
+## Secondary persona
+- Who: {done}
+"""
+
+
+class TestProgressScoring(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_criteria_levels(self):
+        complete = PERSONAS.replace("{done}", "Grandparents\n- Goals: Share recipes")
+        self.assertEqual(score_file(self._write("02_user_personas.md", complete)), 100)
+        placeholders = PERSONAS.replace("{done}", "To be decided\n- Goals: To be decided")
+        self.assertEqual(score_file(self._write("02_user_personas.md", placeholders)), 75)
+        path = self._write("02_user_personas.md", "# User Personas\nTBD\n")
+        self.assertEqual(score_file(path), 25)
+        self.assertEqual(score_file(os.path.join(self.dir, "missing.md")), 0)
+        self.assertEqual(score_file(self._write("script.py", "print('hi')\n")), 100)
+
+    def test_only_template_fields_count_as_placeholders(self):
+        self.assertTrue(progress_scoring.is_placeholder("- Screen: {screen_name}"))
+        line = "GET /users/{user_id} returns the profile"
+        self.assertFalse(progress_scoring.is_placeholder(line))
+        self.assertFalse(progress_scoring.is_placeholder("Escaped braces: {{screen_name}}"))
+        self.assertIn("screen_name", progress_scoring.template_fields())
+
+    def test_template_headings_are_required(self):
+        doc = parse_document("02_user_personas.md",
+                             "# User Personas\n## Primary persona\n- Who: anyone\n")
+        self.assertEqual(progress_scoring.score_headings(doc), 2 / 3)
+        doc = parse_document("notes.md", "# Notes\n## Ideas\n- one\n")
+        self.assertEqual(progress_scoring.score_headings(doc), 1.0)
+
+    def test_fenced_headings_are_not_sections(self):
+        doc = parse_document("notes.md", "# Notes\n```\n## not a heading\n```\n")
+        self.assertEqual(doc.sections, ())
+
+    def test_plugins_change_scores_and_fingerprint(self):
+        before = progress_scoring.fingerprint()
+        with mock.patch.dict(progress_scoring.SCORERS):
+            progress_scoring.register_scorer("never", weight=10)(lambda doc: 0.0)
+            self.assertNotEqual(progress_scoring.fingerprint(), before)
+            doc = parse_document("notes.md", "# Notes\n## A\ntext\n")
+            self.assertEqual(score_document(doc), 25)
+            with self.assertRaises(ValueError):
+                progress_scoring.register_scorer("never")(lambda doc: 1.0)
+        self.assertEqual(progress_scoring.fingerprint(), before)
+
+    def test_parallel_scores_match_serial(self):
+        paths = [self._write(f"doc{i}.md", "# Doc\n## Part\n" + ("TBD\n" if i % 3 else "real\n"))
+                 for i in range(8)]
+        with mock.patch.object(progress_scoring, "PARALLEL_THRESHOLD", 4):
+            parallel = score_files(paths, workers=2)
+        self.assertEqual(parallel, score_files(paths, workers=1))
+        self.assertEqual(parallel[:3], [100, 25, 25])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import cli_interface  # type: ignore
+from project_pool import generate_from_answers, generate_projects  # type: ignore
+
+
+class TestProjectPool(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_projects_are_generated_in_parallel_and_isolated(self):
+        jobs = [(self.root / f"client_{i}", {"app_name": f"App {i}"}) for i in range(4)]
+        results = generate_projects(jobs, workers=2)
+        self.assertEqual([r["app_name"] for r in results], [f"App {i}" for i in range(4)])
+        for i in range(4):
+            client = self.root / f"client_{i}"
+            deliverables = client / "phase1_concept_strategy" / "deliverables"
+            problem = deliverables / "01_problem_statement.md"
+            self.assertIn(f"- App name: App {i}", problem.read_text(encoding="utf-8"))
+            self.assertTrue((client / "phase5_launch_growth" / "monetization.md").is_file())
+            log = client / ".builder_cache" / "generate.log"
+            self.assertIn("Phase 5", log.read_text(encoding="utf-8"))
+
+    def test_failure_is_reported_per_project(self):
+        blocked = self.root / "blocked"
+        blocked.mkdir()
+        (blocked / "phase1_concept_strategy").write_text("a file, not a folder", encoding="utf-8")
+        results = generate_projects([(blocked, {}), (self.root / "fine", {})], workers=1)
+        self.assertIn("error", results[0])
+        self.assertNotIn("error", results[1])
+
+    def test_pooled_projects_run_their_tests_in_process(self):
+        with mock.patch.object(cli_interface, "run_phase4_wizard") as phase4:
+            generate_projects([(self.root / "a", {})], workers=1)
+        phase4.assert_called_once_with(str(self.root / "a"), workers=1)
+
+    def test_duplicate_roots_are_rejected(self):
+        with self.assertRaises(ValueError):
+            generate_projects([(self.root / "a", {}), (self.root / "a", {})])
+
+    def test_answers_file_requires_project_roots(self):
+        path = self.root / "answers.json"
+        path.write_text(json.dumps([{"app_name": "No root"}]), encoding="utf-8")
+        with self.assertRaises(ValueError), redirect_stdout(io.StringIO()):
+            generate_from_answers(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+from project_validator import validate_paths  # type: ignore
+from reference_index import iter_links  # type: ignore
+
+GUIDE = """# Guide
+See [`guide`](other.md) and [missing](nope.md "title").
+Also [section](#anchor), [web](https://example.com) and [up](../outside_missing.md).
+Two links: [a](sub/a.md#part) [b](sub/b.md)
+```
+[in a fence](fenced_missing.md)
+```
+Inline `[code](code_missing.md)` is ignored.
+"""
+
+
+class TestProjectValidator(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self._tmp.name, "project")
+        os.makedirs(os.path.join(self.root, "docs", "sub"))
+        os.makedirs(os.path.join(self.root, ".git"))
+        for name, text in (("docs/guide.md", GUIDE), ("docs/other.md", "# Other\n"),
+                           ("docs/sub/a.md", "# A\n"), (".git/HEAD.md", "[x](gone.md)\n")):
+            with open(os.path.join(self.root, name), "w", encoding="utf-8") as f:
+                f.write(text)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_every_link_on_a_line_is_found(self):
+        links = [target for _, target in iter_links(GUIDE.splitlines())]
+        self.assertEqual(links, ["other.md", "nope.md", "../outside_missing.md", "sub/a.md#part",
+                                 "sub/b.md"])
+
+    def test_broken_links_are_reported_relative_to_their_file(self):
+        with redirect_stdout(io.StringIO()) as out:
+            broken = validate_paths(self.root, workers=2)
+        guide = os.path.join(self.root, "docs", "guide.md")
+        self.assertEqual(sorted(broken), [
+            (guide, 2, "nope.md"),
+            (guide, 3, "../outside_missing.md"),
+            (guide, 4, "sub/b.md"),
+        ])
+        self.assertIn(f"Broken link in {guide}:2: nope.md", out.getvalue())
+
+    def test_clean_tree_has_no_broken_links(self):
+        os.remove(os.path.join(self.root, "docs", "guide.md"))
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(validate_paths(self.root), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import reference_index  # type: ignore
+from reference_index import ReferenceIndex, build_index, scan_file  # type: ignore
+
+
+class TestReferenceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self._write("docs/guide.md",
+                    "[ok](other.md) [bad](gone.md)\nsee path/to/docs/missing.txt\n")
+        self._write("docs/other.md", "# Other\n")
+        self._write("notes.txt", "path/to/docs/other.md and [not a link](gone.md)\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_links_and_paths_come_from_one_read(self):
+        _, refs = scan_file(os.path.join(self.root, "docs", "guide.md"))
+        self.assertEqual(refs, {"links": [[1, "other.md"], [1, "gone.md"]],
+                                "paths": [[2, "docs/missing.txt"]]})
+        _, refs = scan_file(os.path.join(self.root, "notes.txt"))
+        # Recorded, but only reported for .md files
+        self.assertEqual(refs["links"], [[1, "gone.md"]])
+
+    def test_binary_files_are_only_read_to_the_first_chunk(self):
+        path = os.path.join(self.root, "asset.bin")
+        with open(path, "wb") as f:
+            f.write(b"\0" * 8 + b"path/to/missing" * 100)
+        with mock.patch.object(reference_index, "CHUNK_SIZE", 8):
+            digest, refs = scan_file(path)
+        self.assertIsNone(refs)
+        self.assertEqual(digest, hashlib.sha256(b"\0" * 8).hexdigest())
+
+    def test_queries(self):
+        index = build_index(self.root, persist=False)
+        guide = os.path.join(self.root, "docs", "guide.md")
+        self.assertEqual(index.broken_links(), [(guide, 1, "gone.md")])
+        self.assertEqual(index.broken_paths(), [(guide, 2, "docs/missing.txt")])
+
+    def test_only_changed_files_are_rescanned(self):
+        first = build_index(self.root)
+        self.assertEqual(first.stats["scanned"], 3)
+        index_path = ReferenceIndex.default_path(self.root)
+        self.assertEqual(os.listdir(os.path.dirname(index_path)), [os.path.basename(index_path)])
+
+        second = build_index(self.root)
+        self.assertEqual(second.stats, {"stat_hits": 3, "hash_hits": 0, "scanned": 0})
+        self.assertEqual(second.broken_links(), first.broken_links())
+
+        self._write("docs/guide.md", "[fixed](other.md)\n")
+        self._write("docs/copy.md", "# Other\n")
+        third = build_index(self.root)
+        self.assertEqual(third.stats, {"stat_hits": 2, "hash_hits": 1, "scanned": 1})
+        self.assertEqual(third.broken_links(), [])
+
+    def test_same_content_is_reported_by_extension(self):
+        self._write("a.txt", "[x](gone.md)\n")
+        self._write("b.md", "[x](gone.md)\n")
+        index = build_index(self.root, persist=False)
+        self.assertEqual(index.stats["hash_hits"], 1)
+        self.assertIn((os.path.join(self.root, "b.md"), 1, "gone.md"), index.broken_links())
+        broken = [path for path, _, _ in index.broken_links()]
+        self.assertNotIn(os.path.join(self.root, "a.txt"), broken)
+
+    def test_deleted_files_leave_the_index(self):
+        build_index(self.root)
+        os.remove(os.path.join(self.root, "docs", "other.md"))
+        index = build_index(self.root)
+        self.assertNotIn(os.path.join("docs", "other.md"), index.files)
+        self.assertEqual(len(index.broken_links()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
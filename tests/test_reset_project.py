@@ -0,0 +1,101 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import cli_interface  # type: ignore
+import generation_manifest  # type: ignore
+from reset_project import main  # type: ignore
+
+
+class TestResetProject(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "notes.md").write_text("mine\n", encoding="utf-8")
+        with redirect_stdout(io.StringIO()):
+            cli_interface.run_headless({"app_name": "Shop"}, self.root)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _tree(self):
+        return sorted(p.relative_to(self.root).as_posix() for p in self.root.rglob("*")
+                      if ".builder_cache" not in p.parts)
+
+    def test_manifest_lists_every_generated_path(self):
+        manifest = generation_manifest.load_manifest(self.root)
+        self.assertIn(".builder_cache/phase2_manifest.json", manifest["files"])
+        generated = {p for p in manifest["files"] | manifest["dirs"]
+                     if not p.startswith(".builder_cache/")}
+        self.assertEqual(self._tree(), sorted(generated | {"notes.md"}))
+        self.assertIn("phase2_development_planning/deliverables/02_user_personas/user_flow.md",
+                      manifest["files"])
+
+    def test_dry_run_reports_without_deleting(self):
+        before = self._tree()
+        report = generation_manifest.reset(self.root, dry_run=True)
+        manifest = generation_manifest.load_manifest(self.root)
+        self.assertEqual(report["files"], len(manifest["files"]))
+        self.assertEqual(report["bytes"],
+                         sum((self.root / f).stat().st_size for f in manifest["files"]))
+        self.assertEqual(self._tree(), before)
+
+    def test_reset_removes_exactly_the_generated_paths(self):
+        extra = self.root / "phase3_ai_execution" / "codebase" / "handwritten.py"
+        extra.write_text("keep = True\n", encoding="utf-8")
+        (self.root / "phase5_launch_growth" / "monetization.md").unlink()
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["--root", str(self.root), "--yes", "--workers", "4"]), 0)
+        self.assertEqual(self._tree(), ["notes.md", "phase3_ai_execution",
+                                        "phase3_ai_execution/codebase",
+                                        "phase3_ai_execution/codebase/handwritten.py"])
+
+        extra.unlink()
+        report = generation_manifest.reset(self.root)
+        self.assertEqual((report["files"], report["dirs"]), (0, 2))
+        self.assertEqual(self._tree(), ["notes.md"])
+        self.assertFalse(generation_manifest.manifest_path(self.root).exists())
+
+    def test_tampered_manifest_cannot_reach_outside_the_root(self):
+        with tempfile.TemporaryDirectory() as outside:
+            victim = Path(outside) / "victim.txt"
+            victim.write_text("keep\n", encoding="utf-8")
+            (self.root / "link").symlink_to(outside)
+            path = generation_manifest.manifest_path(self.root)
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data["files"] += [os.path.relpath(victim, self.root), "link/victim.txt"]
+            data["dirs"] += ["link", os.path.relpath(outside, self.root)]
+            path.write_text(json.dumps(data), encoding="utf-8")
+
+            report = generation_manifest.reset(self.root)
+            self.assertEqual(report["outside"], 4)
+            self.assertTrue(victim.is_file())
+            self.assertTrue((self.root / "link").is_symlink())
+            self.assertFalse(generation_manifest.manifest_path(self.root).exists())
+
+    def test_phase2_forgets_outputs_it_removes(self):
+        screen = "phase2_development_planning/deliverables/02_user_personas"
+        manifest = generation_manifest.load_manifest(self.root)
+        self.assertIn(f"{screen}/user_flow.md", manifest["files"])
+        (self.root / "phase1_concept_strategy" / "deliverables" / "02_user_personas.md").unlink()
+        with redirect_stdout(io.StringIO()):
+            report = cli_interface.run_phase2_wizard(self.root)
+        self.assertGreater(report["removed"], 0)
+        manifest = generation_manifest.load_manifest(self.root)
+        self.assertFalse([p for p in manifest["files"] | manifest["dirs"] if p.startswith(screen)])
+
+    def test_paths_outside_the_root_are_not_recorded(self):
+        generation_manifest.record(self.root, files=[self.root.parent / "elsewhere.md", "../x.md"])
+        manifest = generation_manifest.load_manifest(self.root)
+        self.assertFalse(any(".." in f for f in manifest["files"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import cli_interface  # type: ignore
+import suite_runner  # type: ignore
+
+UNIT = '''import time
+import unittest
+
+
+class TestMath(unittest.TestCase):
+    def test_adds(self):
+        print("noise that should be buffered")
+        self.assertEqual(1 + 1, 2)
+
+    def test_breaks(self):
+        self.assertEqual(1 + 1, 3)
+
+    @unittest.skip("not yet")
+    def test_later(self):
+        pass
+
+    def test_slow(self):
+        time.sleep(0.05)
+
+
+def test_plain_function():
+    assert True
+'''
+
+E2E = '''import unittest
+
+
+class TestFlow(unittest.TestCase):
+    def test_flow(self):
+        raise RuntimeError("server down")
+'''
+
+
+class TestSuiteRunner(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        tests = self.root / "phase3_ai_execution" / "tests"
+        tests.mkdir(parents=True)
+        (tests / "unit_tests.py").write_text(UNIT, encoding="utf-8")
+        (tests / "e2e_tests.py").write_text(E2E, encoding="utf-8")
+        (tests / "test_broken_import.py").write_text("import does_not_exist\n", encoding="utf-8")
+        (tests / "helpers.py").write_text("VALUE = 1\n", encoding="utf-8")
+        (self.root / "tests").mkdir()
+        (self.root / "tests" / "test_top.py").write_text(
+            "import unittest\n\n\nclass TestTop(unittest.TestCase):\n"
+            "    def test_ok(self):\n        self.assertTrue(True)\n", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_runs_every_test_across_workers(self):
+        summary = suite_runner.run_tests(self.root, workers=2)
+        self.assertEqual((summary["files"], summary["workers"]), (4, 2))
+        statuses = {r["id"]: r["status"] for r in summary["results"]}
+        self.assertEqual(statuses, {
+            "phase3_ai_execution/tests/e2e_tests.py::TestFlow.test_flow": "error",
+            "phase3_ai_execution/tests/test_broken_import.py::<import>": "error",
+            "phase3_ai_execution/tests/unit_tests.py::TestMath.test_adds": "passed",
+            "phase3_ai_execution/tests/unit_tests.py::TestMath.test_breaks": "failed",
+            "phase3_ai_execution/tests/unit_tests.py::TestMath.test_later": "skipped",
+            "phase3_ai_execution/tests/unit_tests.py::TestMath.test_slow": "passed",
+            "phase3_ai_execution/tests/unit_tests.py::test_plain_function": "passed",
+            "tests/test_top.py::TestTop.test_ok": "passed",
+        })
+        self.assertEqual((summary["passed"], summary["failed"], summary["errors"],
+                          summary["skipped"]), (4, 1, 2, 1))
+        by_id = {r["id"]: r for r in summary["results"]}
+        flow = by_id["phase3_ai_execution/tests/e2e_tests.py::TestFlow.test_flow"]
+        self.assertEqual(flow["category"], "e2e")
+        self.assertIn("server down", flow["message"])
+        broken = by_id["phase3_ai_execution/tests/test_broken_import.py::<import>"]
+        self.assertIn("ModuleNotFoundError", broken["message"])
+        slow = by_id["phase3_ai_execution/tests/unit_tests.py::TestMath.test_slow"]
+        self.assertGreaterEqual(slow["seconds"], 0.05)
+
+        with open(summary["durations_file"], encoding="utf-8") as f:
+            durations = json.load(f)
+        self.assertGreaterEqual(durations["phase3_ai_execution/tests/unit_tests.py"], 0.05)
+
+    def test_phase4_writes_results_and_bug_report(self):
+        with redirect_stdout(io.StringIO()):
+            summary = cli_interface.run_phase4_wizard(self.root, workers=2)
+        self.assertEqual(summary["tests"], 8)
+        phase4 = self.root / "phase4_testing_iteration"
+        results = (phase4 / "test_results.md").read_text(encoding="utf-8")
+        self.assertIn("**8 tests** in 4 files: 4 passed, 1 failed, 2 errors, 1 skipped", results)
+        self.assertIn("## Slowest Tests\n\n| Test | Seconds | Status |", results)
+        slowest = results.split("## Slowest Tests")[1].splitlines()[4]
+        self.assertIn("TestMath.test_slow", slowest)
+        breaks = "phase3_ai_execution/tests/unit_tests.py::TestMath.test_breaks"
+        self.assertIn(f"### `{breaks}` (failed)", results)
+        self.assertNotIn("noise that should be buffered", results)
+        bugs = (phase4 / "bug_report.md").read_text(encoding="utf-8")
+        self.assertIn("- `phase3_ai_execution/tests/e2e_tests.py::TestFlow.test_flow` (error): "
+                      "RuntimeError: server down", bugs)
+        self.assertIn(suite_runner.SECURITY_NOTE, bugs)
+        self.assertNotIn("No critical vulnerabilities", bugs)
+
+    def test_workers_are_not_forked_from_a_threaded_process(self):
+        self.assertIsNone(suite_runner._mp_context())
+        with ThreadPoolExecutor(max_workers=1) as pool:  # Like a chat session's job
+            context = pool.submit(suite_runner._mp_context).result()
+            summary = pool.submit(suite_runner.run_tests, self.root, 2).result()
+        self.assertNotEqual(context.get_start_method(), "fork")
+        self.assertEqual((summary["tests"], summary["passed"]), (8, 4))
+
+    def test_reused_workers_do_not_leak_modules_between_files(self):
+        root = self.root / "isolated"
+        for folder, value in (("phase3_ai_execution/tests", 1), ("tests", 2)):
+            (root / folder).mkdir(parents=True)
+            (root / folder / "helpers.py").write_text(f"VALUE = {value}\n", encoding="utf-8")
+            (root / folder / "test_value.py").write_text(
+                "import sys\nimport unittest\n\nimport helpers\n\nsys.path.append('leaked')\n\n\n"
+                "class TestValue(unittest.TestCase):\n    def test_value(self):\n"
+                f"        self.assertEqual(helpers.VALUE, {value})\n"
+                "        self.assertEqual(sys.path.count('leaked'), 1)\n", encoding="utf-8")
+        summary = suite_runner.run_tests(root, workers=1)
+        self.assertEqual((summary["tests"], summary["passed"]), (2, 2), summary["results"])
+
+    def test_project_without_tests(self):
+        empty = self.root / "empty"
+        with redirect_stdout(io.StringIO()):
+            summary = cli_interface.run_phase4_wizard(empty)
+        self.assertEqual((summary["files"], summary["tests"]), (0, 0))
+        results_file = empty / "phase4_testing_iteration" / "test_results.md"
+        results = results_file.read_text(encoding="utf-8")
+        self.assertIn("No tests found", results)
+
+
+if __name__ == "__main__":
+    unittest.main()
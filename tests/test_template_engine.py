@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+from template_engine import TemplateLibrary, compile_template  # type: ignore
+
+SHIPPED_TEMPLATES = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                 '../templates_examples/deliverables'))
+
+
+class TestCompileTemplate(unittest.TestCase):
+
+    def test_fields_are_substituted(self):
+        render = compile_template("# User Flow for {screen_name}\n\n{screen_desc}\n")
+        self.assertEqual(render.fields, {"screen_name", "screen_desc"})
+        self.assertEqual(render({"screen_name": "Home", "screen_desc": "Landing"}),
+                         "# User Flow for Home\n\nLanding\n")
+
+    def test_escaped_braces_and_constant_templates(self):
+        self.assertEqual(compile_template("{{literal}} {x}")({"x": 1}), "{literal} 1")
+        self.assertEqual(compile_template("# CI/CD Workflows\n")(), "# CI/CD Workflows\n")
+
+    def test_missing_field_names_the_template(self):
+        render = compile_template("{app_name}", "phase1/x.md")
+        with self.assertRaisesRegex(KeyError, "phase1/x.md"):
+            render({})
+
+    def test_format_specs_are_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_template("{score:.2f}")
+
+
+class TestTemplateLibrary(unittest.TestCase):
+
+    def test_templates_are_compiled_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "phase2"))
+            path = os.path.join(tmp, "phase2", "doc.md.tmpl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("# {title}\n")
+            library = TemplateLibrary(tmp)
+            self.assertEqual(library.render("phase2/doc.md", {"title": "A"}), "# A\n")
+            os.remove(path)
+            self.assertEqual(library.render("phase2/doc.md", {"title": "B"}), "# B\n")
+            self.assertEqual(library.names(), [])
+
+    def test_render_batch_merges_shared_context(self):
+        library = TemplateLibrary(SHIPPED_TEMPLATES)
+        out = dict(library.render_batch(
+            [("a", "phase2/user_flow.md", {"screen_name": "Settings"}),
+             ("b", "phase2/data_flow.md", None)],
+            shared={"screen_name": "Home", "screen_desc": "desc"},
+        ))
+        self.assertEqual(out["a"], "# User Flow for Settings\n\ndesc\n")
+        self.assertEqual(out["b"], "# Data Flow for Home\n\ndesc\n")
+
+    def test_shipped_templates_all_compile(self):
+        library = TemplateLibrary(SHIPPED_TEMPLATES)
+        names = library.names()
+        self.assertIn("phase1/01_problem_statement.md", names)
+        for name in names:
+            library.get(name)
+
+
+if __name__ == "__main__":
+    unittest.main()
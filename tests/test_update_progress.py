@@ -0,0 +1,81 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+import update_progress  # type: ignore
+
+
+class TestUpdateProgress(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.report = os.path.join(self.root, "project_overview", "MASTER_GOAL_PROGRESS.md")
+        self.cache = os.path.join(self.root, ".builder_cache", "progress_cache.json")
+        os.makedirs(os.path.dirname(self.report))
+        for name in ("a.md", "docs/b.md", ".git/HEAD", "__pycache__/x.pyc"):
+            self._write(name, f"# {name}\n\n## Summary\nDone.\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _run(self):
+        return update_progress.update_progress(self.root, self.report, self.cache)
+
+    def test_report_lists_project_files_only(self):
+        summary = self._run()
+        self.assertEqual((summary["files"], summary["evaluated"]), (2, 2))
+        with open(self.report, encoding="utf-8") as f:
+            report = f.read()
+        self.assertIn("Overall Progress: 100.00%", report)
+        self.assertIn("- a.md: 100%\n- docs/b.md: 100%\n", report)
+        self.assertNotIn(".git", report)
+        self.assertNotIn("MASTER_GOAL_PROGRESS", report)
+
+    def test_only_changed_files_are_evaluated(self):
+        self._run()
+        with mock.patch.object(update_progress, "evaluate_file_progress",
+                               return_value=50) as evaluate:
+            summary = self._run()
+            self.assertEqual(evaluate.call_count, 0)
+            self.assertFalse(summary["written"])
+
+            self._write("docs/b.md", "changed content")
+            summary = self._run()
+        self.assertEqual(evaluate.call_count, 1)
+        self.assertEqual(summary["overall"], 75.0)
+
+    def test_removed_files_rewrite_the_report(self):
+        self._run()
+        os.remove(os.path.join(self.root, "a.md"))
+        summary = self._run()
+        self.assertEqual((summary["files"], summary["removed"], summary["written"]), (1, 1, True))
+
+    def test_failed_write_leaves_no_temp_files(self):
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self._run()
+            update_progress.save_cache(self.cache, {})  # Swallows the error
+        self.assertEqual(os.listdir(os.path.dirname(self.report)), [])
+        self.assertEqual(os.listdir(os.path.dirname(self.cache)), [])
+
+    def test_empty_tree(self):
+        with tempfile.TemporaryDirectory() as empty:
+            report = os.path.join(empty, "progress.md")
+            summary = update_progress.update_progress(empty, report, None)
+            self.assertEqual(summary["overall"], 0.0)
+            with open(report, encoding="utf-8") as f:
+                self.assertIn("Overall Progress: 0.00%", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools')))
+from workspace_index import WorkspaceIndex  # type: ignore
+
+
+def _touch(path, text="x"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+class TestWorkspaceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.index_path = os.path.join(self.root, ".builder_cache", "progress_index.json")
+        self.phase3 = os.path.join(self.root, "phase3_ai_execution")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_detects_nested_files_and_ignores_hidden(self):
+        """Hidden files do not count as progress; nested visible files do."""
+        _touch(os.path.join(self.phase3, "codebase", ".DS_Store"))
+        index = WorkspaceIndex(self.root)
+        index.scan([self.phase3])
+        self.assertFalse(index.any_files(os.path.join(self.phase3, "codebase")))
+
+        _touch(os.path.join(self.phase3, "codebase", "app", "main.py"))
+        index.scan([self.phase3])
+        self.assertTrue(index.any_files(os.path.join(self.phase3, "codebase")))
+        self.assertFalse(index.has_direct_files(os.path.join(self.phase3, "codebase")))
+        self.assertFalse(index.any_files(os.path.join(self.phase3, "tests")))
+
+    def test_missing_folder_has_no_progress(self):
+        index = WorkspaceIndex(self.root)
+        index.scan([os.path.join(self.root, "phase5_launch_growth")])
+        self.assertFalse(index.any_files(os.path.join(self.root, "phase5_launch_growth")))
+
+    def test_persisted_index_only_relists_changed_dirs(self):
+        """A reloaded index reuses every directory whose mtime is unchanged."""
+        for name in ("codebase", "tests", "configs"):
+            _touch(os.path.join(self.phase3, name, "file.txt"))
+        first = WorkspaceIndex(self.root, self.index_path)
+        first.scan([self.phase3])
+        first.save()
+        self.assertEqual(first.stats["listed"], 4)
+
+        second = WorkspaceIndex(self.root, self.index_path)
+        self.assertTrue(second.load())
+        second.scan([self.phase3])
+        self.assertEqual(second.stats, {"listed": 0, "reused": 4})
+        self.assertTrue(second.any_files(os.path.join(self.phase3, "tests")))
+
+        time.sleep(0.01)
+        _touch(os.path.join(self.phase3, "tests", "test_new.py"))
+        second.scan([self.phase3])
+        self.assertEqual(second.stats["listed"], 1)
+
+    def test_removed_directory_drops_out_of_index(self):
+        _touch(os.path.join(self.phase3, "tests", "test_main.py"))
+        index = WorkspaceIndex(self.root)
+        index.scan([self.phase3])
+        os.remove(os.path.join(self.phase3, "tests", "test_main.py"))
+        os.rmdir(os.path.join(self.phase3, "tests"))
+        index.scan([self.phase3])
+        self.assertFalse(index.any_files(os.path.join(self.phase3, "tests")))
+        self.assertNotIn("phase3_ai_execution/tests", index.dirs)
+
+
+if __name__ == "__main__":
+    unittest.main()
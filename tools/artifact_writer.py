@@ -0,0 +1,137 @@
+"""
+Batched, atomic artifact writer.
+
+Wizards render every document up front, queue it with ``add()`` and call
+``flush()`` once. Parent directories are created first, then the files are
+written by a thread pool. Each file goes to a hidden temp file in its target
+directory and is moved into place with os.replace, so an interrupted run
+leaves either the previous version or the complete new one, never half a file.
+The result keeps the mode of the file it replaces; new files get the mode
+open() would have given them (0o666 less the umask).
+"""
+
+import os
+import threading
+import time
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_UMASK_LOCK = threading.Lock()
+_UMASK = None
+
+
+def _umask() -> int:
+    """
+    The process umask, read on first use. Linux reports it in
+    /proc/self/status; elsewhere os.umask can only query it by setting it, so
+    it is set and restored under a lock.
+    """
+    global _UMASK
+    with _UMASK_LOCK:
+        if _UMASK is None:
+            try:
+                with open("/proc/self/status", encoding="ascii") as f:
+                    _UMASK = next(int(line.split()[1], 8) for line in f
+                                  if line.startswith("Umask:"))
+            except (OSError, StopIteration, ValueError, IndexError):
+                _UMASK = os.umask(0)
+                os.umask(_UMASK)
+        return _UMASK
+
+
+def write_atomic(path: str, data: bytes, fsync: bool = False) -> int:
+    """Write ``data`` to ``path`` via temp-file-and-rename. Returns bytes written."""
+    import tempfile  # Deferred with the thread pool: read-only commands never write
+
+    directory, name = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except OSError:
+            mode = 0o666 & ~_umask()
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp creates 0600 and os.replace keeps it
+            os.chmod(f.fileno() if os.chmod in os.supports_fd else tmp, mode)
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return len(data)
+
+
+def make_dirs(path: str) -> list[str]:
+    """os.makedirs(path, exist_ok=True), returning the directories it created (outermost first)."""
+    missing = []
+    current = os.path.abspath(path)
+    while not os.path.isdir(current):
+        missing.append(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+    os.makedirs(path, exist_ok=True)
+    return missing[::-1]
+
+
+class ArtifactWriter:
+    """Collects rendered artifacts and flushes them in parallel."""
+
+    def __init__(self, workers: int | None = None, fsync: bool = False, encoding: str = "utf-8"):
+        self.workers = max(1, workers or DEFAULT_WORKERS)
+        self.fsync = fsync
+        self.encoding = encoding
+        self._pending: dict[str, bytes] = {}
+
+    def add(self, path, content: str) -> None:
+        """Queue ``content`` for ``path``; a later add for the same path wins."""
+        self._pending[os.path.abspath(path)] = content.encode(self.encoding)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> dict:
+        """
+        Write every queued artifact and return a throughput report:
+        ``{"files", "bytes", "seconds", "files_per_sec", "mb_per_sec", "workers"}``
+        plus the written ``paths`` and the ``created_dirs`` it had to make.
+        The first write error is re-raised after the remaining writes finish.
+        """
+        pending, self._pending = self._pending, {}
+        start = time.perf_counter()
+        created_dirs = []
+        for directory in sorted({os.path.dirname(p) for p in pending}):
+            created_dirs += make_dirs(directory)
+
+        total = 0
+        if self.workers == 1 or len(pending) < 2:
+            for path, data in pending.items():
+                total += write_atomic(path, data, self.fsync)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(write_atomic, p, d, self.fsync) for p, d in pending.items()]
+            errors = [f.exception() for f in futures if f.exception() is not None]
+            if errors:
+                raise errors[0]
+            total = sum(f.result() for f in futures)
+
+        seconds = time.perf_counter() - start
+        return {
+            "files": len(pending),
+            "bytes": total,
+            "seconds": seconds,
+            "files_per_sec": len(pending) / seconds if seconds else 0.0,
+            "mb_per_sec": total / 1_000_000 / seconds if seconds else 0.0,
+            "workers": self.workers,
+            "paths": list(pending),
+            "created_dirs": created_dirs,
+        }
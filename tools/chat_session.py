@@ -0,0 +1,293 @@
+"""
+Asyncio chat sessions for the AI App Builder.
+
+A ChatSession talks to one operator through an async ``read_line(prompt)``
+and a ``write(text)`` callable, so the same menu works on a console or a
+network connection. Long-running work never blocks the event loop:
+
+- "Start or resume a phase" asks any Phase 1 questions in the chat, then
+  generates the next phase as a background job (a worker thread) and returns
+  to the menu at once; the session is told when the job finishes, with the
+  traceback if it failed. Unlike chat_interface(), it does not walk through
+  the guides step by step: that walkthrough blocks on input() per step.
+- "View progress" runs the workspace analysis in a worker thread, so other
+  sessions hosted by the same process keep being served meanwhile.
+
+Since jobs run on threads, Phase 4's test pool starts its workers without
+fork (see suite_runner), which could deadlock in a multithreaded process.
+
+serve() hosts one session per TCP connection in a single process.
+"""
+
+import asyncio
+import io
+import itertools
+import sys
+import threading
+import traceback
+
+try:
+    from . import cli_interface
+except ImportError:
+    import cli_interface
+
+MENU = """What would you like to do next?
+1) Start or resume a phase
+2) View progress
+3) Exit
+4) Background jobs"""
+
+# Project roots with a generation job in flight, shared by every session
+_BUSY_ROOTS: set[str] = set()
+
+# sys.stdout is routed per thread only while at least one session runs
+_ROUTER_LOCK = threading.Lock()
+_ROUTER_USERS = 0
+
+
+class _ThreadStdout:
+    """sys.stdout proxy that sends a worker thread's prints to its own buffer."""
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def capture(self, buffer) -> None:
+        self._local.target = buffer
+
+    def release(self) -> None:
+        self._local.target = None
+
+    def write(self, text):
+        return (getattr(self._local, "target", None) or self._default).write(text)
+
+    def flush(self):
+        target = getattr(self._local, "target", None) or self._default
+        target.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._default, name)
+
+
+def _install_router() -> _ThreadStdout:
+    """Route sys.stdout per thread; pair every call with _uninstall_router()."""
+    global _ROUTER_USERS
+    with _ROUTER_LOCK:
+        if not isinstance(sys.stdout, _ThreadStdout):
+            sys.stdout = _ThreadStdout(sys.stdout)
+        _ROUTER_USERS += 1
+        return sys.stdout
+
+
+def _uninstall_router() -> None:
+    """Put the original sys.stdout back once the last session has ended."""
+    global _ROUTER_USERS
+    with _ROUTER_LOCK:
+        _ROUTER_USERS -= 1
+        if _ROUTER_USERS == 0 and isinstance(sys.stdout, _ThreadStdout):
+            sys.stdout = sys.stdout._default
+
+
+class Job:
+    """A background generation job and the output it printed."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, title: str):
+        self.id = next(self._ids)
+        self.title = title
+        self.output = io.StringIO()
+        self.task: asyncio.Task | None = None
+        self.traceback = ""
+
+    @property
+    def status(self) -> str:
+        if self.task is None or not self.task.done():
+            return "running"
+        if self.task.cancelled():
+            return "cancelled"
+        return "failed" if self.task.exception() else "done"
+
+
+class ChatSession:
+    """One operator's menu loop; many can run concurrently on one event loop."""
+
+    def __init__(self, read_line, write, project_root=None):
+        self.read_line = read_line
+        self.write = write
+        self.project_root = cli_interface._project_dir(project_root)
+        self.jobs: list[Job] = []
+        self._router: _ThreadStdout | None = None
+
+    def say(self, text: str = "") -> None:
+        self.write(text + "\n")
+
+    async def run(self) -> None:
+        self._router = _install_router()
+        try:
+            await self._menu()
+        finally:
+            await self.close()
+            self._router = None
+            _uninstall_router()
+
+    async def _menu(self) -> None:
+        self.say("Welcome to the AI App Builder Chat Interface!\n")
+        self.say("I’m here to guide you through planning, building, testing, "
+                 "and launching your app.\n")
+        while True:
+            self.say(MENU)
+            line = await self.read_line("> ")
+            if line is None:
+                self.say("[ERROR] Input interrupted. Exiting chat interface.")
+                break
+            choice = line.strip()
+            if choice == "1":
+                await self.start_next_phase()
+            elif choice == "2":
+                await self.show_progress()
+            elif choice == "3":
+                self.say("Goodbye! If you need help again, just start the chat.")
+                break
+            elif choice == "4":
+                self.show_jobs()
+            else:
+                self.say("Invalid choice. Please select 1, 2, 3, or 4.\n")
+
+    async def close(self) -> None:
+        """Wait for this session's background jobs before leaving."""
+        pending = [job.task for job in self.jobs if job.status == "running"]
+        if pending:
+            self.say(f"Waiting for {len(pending)} background job(s) to finish...")
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def show_progress(self) -> None:
+        self.say("\nHere’s your current progress:\n")
+        try:
+            _, summaries = await asyncio.to_thread(cli_interface.analyze_workspace, None,
+                                                   self.project_root)
+        except Exception as e:
+            self.say(f"[ERROR] Failed to analyze progress: {e}")
+            return
+        for s in summaries:
+            status = "progress found" if s["has_progress"] else "no progress"
+            self.say(f"- {s['title']} — {s['guide_heading']} [{status}]")
+        self.say()
+
+    def show_jobs(self) -> None:
+        if not self.jobs:
+            self.say("No background jobs yet.\n")
+            return
+        for job in self.jobs:
+            self.say(f"- job {job.id}: {job.title} [{job.status}]")
+            if job.traceback:
+                self.say(f"  {job.traceback.strip().splitlines()[-1]}")
+        self.say()
+
+    async def ask_phase1(self) -> dict:
+        self.say("\nLet’s capture the basics. Press Enter to skip any question.\n")
+        answers = {}
+        for key, question, _ in cli_interface.PHASE1_QUESTIONS:
+            line = await self.read_line(f"{question} ")
+            answers[key] = (line or "").strip()
+        return answers
+
+    async def start_next_phase(self) -> Job | None:
+        if self.project_root in _BUSY_ROOTS:
+            self.say("A generation job is already running for this project. Check option 4.\n")
+            return None
+        last_index, _ = await asyncio.to_thread(cli_interface.analyze_workspace, None,
+                                                self.project_root)
+        indices = cli_interface.PHASES.indices()
+        remaining = [i for i in indices if i > last_index]
+        if not remaining:
+            self.say("Every phase already has progress. Nothing left to generate.\n")
+            return None
+        phase = cli_interface.PHASES.get(remaining[0])
+        answers = await self.ask_phase1() if phase["index"] == 1 else None
+        if self.project_root in _BUSY_ROOTS:  # Another session started one while we asked
+            self.say("A generation job is already running for this project. Check option 4.\n")
+            return None
+        return self.start_job(phase["title"], cli_interface.run_phase_wizard,
+                              phase["index"], self.project_root, answers)
+
+    def start_job(self, title: str, func, *args) -> Job:
+        """
+        Run ``func(*args)`` in a worker thread and return immediately. Only
+        valid while run() is active, which routes the job's prints to it.
+        """
+        router = self._router
+        if router is None:
+            raise RuntimeError("start_job() needs a running session")
+        job = Job(title)
+        root = self.project_root
+        _BUSY_ROOTS.add(root)
+
+        def target():
+            router.capture(job.output)
+            try:
+                return func(*args)
+            except BaseException:
+                job.traceback = traceback.format_exc()
+                job.output.write(job.traceback)
+                raise
+            finally:
+                router.release()
+
+        def finished(task):
+            _BUSY_ROOTS.discard(root)
+            if job.status == "failed":
+                self.say(f"\n[job {job.id}] {title} failed: {task.exception()}\n{job.traceback}")
+            else:
+                self.say(f"\n[job {job.id}] {title} {job.status}.")
+
+        job.task = asyncio.ensure_future(asyncio.to_thread(target))
+        job.task.add_done_callback(finished)
+        self.jobs.append(job)
+        self.say(f"Started {title} in the background (job {job.id}).\n")
+        return job
+
+
+async def _console_read(prompt: str):
+    def read():
+        try:
+            return input(prompt)
+        except EOFError:
+            return None
+    return await asyncio.to_thread(read)
+
+
+def _console_write(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+async def run_console(project_root=None) -> None:
+    """Run a single chat session on this terminal."""
+    await ChatSession(_console_read, _console_write, project_root).run()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, project_root=None) -> None:
+    """Host one chat session per TCP connection until cancelled."""
+
+    async def handle(reader, writer):
+        async def read_line(prompt):
+            writer.write(prompt.encode("utf-8"))
+            await writer.drain()
+            line = await reader.readline()
+            return line.decode("utf-8").rstrip("\r\n") if line else None
+
+        def write(text):
+            writer.write(text.encode("utf-8"))
+
+        try:
+            await ChatSession(read_line, write, project_root).run()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    async with server:
+        await server.serve_forever()
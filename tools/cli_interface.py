@@ -8,19 +8,72 @@ Behavior:
 - Reads headings/previews from copilot_brain/*.md as the single source of truth.
 - If progress exists: asks to resume from the next phase, then prompts for mode (Auto/Manual).
 - If no progress exists: asks goal, then mode, then shows previews.
-- Never writes/creates/deletes files in this flow.
+- Never writes/creates/deletes project files in this flow (only a progress
+  index cache under .builder_cache/).
 
 This implements the discussion-approved UX without any generation steps.
+
+Headless: `cli_interface.py batch answers.json [--root DIR] [--workers N]` runs
+Phases 1–5 end to end from pre-supplied Phase 1 answers, with no prompts.
+Every answer set names its project_root (or a single one gets --root); a
+headless run never generates into this repository. --workers fans the
+answer sets out over a process pool (see project_pool.py).
+`cli_interface.py chat` runs the asyncio chat session; `serve` hosts one
+session per TCP connection in a single process (see chat_session.py).
+
+Any command takes --log-level, --trace FILE and --summary to show the wizards'
+step messages and time their phases and steps (see instrumentation.py), and
+--profile DIR to write cProfile, tracemalloc and collapsed-stack reports per
+phase and wizard (see profiling.py).
 """
 
+import json
 import os
 import sys
-from textwrap import dedent
+import time
 from pathlib import Path
-from datetime import datetime
+
+try:
+    from . import generation_manifest, profiling, suite_runner
+    from .artifact_writer import ArtifactWriter, write_atomic
+    from .guide_store import GuideStore, parse_guide
+    from .instrumentation import configure, debug, error, info, span, summary_table, traced, warning
+    from .phase_registry import PhaseRegistry
+    from .template_engine import TemplateLibrary
+    from .workspace_index import WorkspaceIndex
+except ImportError:
+    import generation_manifest
+    import profiling
+    import suite_runner
+    from artifact_writer import ArtifactWriter, write_atomic
+    from guide_store import GuideStore, parse_guide
+    from instrumentation import configure, debug, error, info, span, summary_table, traced, warning
+    from phase_registry import PhaseRegistry
+    from template_engine import TemplateLibrary
+    from workspace_index import WorkspaceIndex
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 BRAIN = os.path.join(ROOT, "copilot_brain")
+CACHE_DIR = os.path.join(ROOT, ".builder_cache")
+PROGRESS_INDEX = os.path.join(CACHE_DIR, "progress_index.json")
+PHASES_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "phases.json")
+
+# Parsed guide outlines, shared by headings, previews and phase execution
+GUIDES = GuideStore(os.path.join(CACHE_DIR, "guides.json"))
+
+# Deliverable templates; set AI_BUILDER_TEMPLATES to use another template set
+TEMPLATES_DIR = os.environ.get("AI_BUILDER_TEMPLATES",
+                               os.path.join(ROOT, "templates_examples", "deliverables"))
+TEMPLATES = TemplateLibrary(TEMPLATES_DIR)
+
+PHASE2_SCREEN_DOCS = (
+    "user_flow.md",
+    "data_flow.md",
+    "state_flow.md",
+    "api_service_flow.md",
+    "error_exception_flow.md",
+    "security_privacy_flow.md",
+)
 
 PHASE2_DELIVERABLES = os.path.join(ROOT, "phases/phase2_development_planning/deliverables")
 PHASE2_SCREEN_FLOWS = os.path.join(ROOT, "phases/phase2_development_planning/screen_flows")
@@ -36,126 +89,96 @@ def _any_files(path: str) -> bool:
     return False
 
 
-def _phase2_progress(phase2_root: str) -> bool:
-    if not os.path.isdir(phase2_root):
-        return False
-    deliv = os.path.join(phase2_root, "deliverables")
-    flows = os.path.join(phase2_root, "screen_flows")
-    return _any_files(deliv) or _any_files(flows)
-
-
 def clear():
-    try:
-        os.system("clear")
-    except Exception:
-        pass
+    # ANSI clear instead of spawning `clear`; a no-op when output is not a terminal
+    if sys.stdout.isatty():
+        print("\033[2J\033[H", end="", flush=True)
 
 
 def read_first_heading(path: str) -> str:
-    if not os.path.isfile(path):
-        return "(guide not found)"
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip().startswith("#"):
-                    return line.strip().lstrip("#").strip()
-        return "(guide loaded)"
+        outline = GUIDES.get(path)
     except Exception:
         return "(guide unreadable)"
+    if outline is None:
+        return "(guide not found)"
+    return outline["title"] or "(guide loaded)"
 
 
 def read_preview(path: str, lines: int = 30) -> str:
-    if not os.path.isfile(path):
-        return "Guide not found."
-    out = []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for _ in range(lines):
-                line = f.readline()
-                if not line:
-                    break
-                out.append(line.rstrip("\n"))
-            if f.readline():
-                out.append("... (guide continues)")
+        if lines <= GUIDES.preview_lines:
+            outline = GUIDES.get(path)
+        elif os.path.isfile(path):
+            outline = parse_guide(path, lines)  # Longer than the cached preview
+        else:
+            outline = None
     except Exception as e:
         return f"(unable to read guide: {e})"
+    if outline is None:
+        return "Guide not found."
+    out = outline["preview"][:lines]
+    if len(outline["preview"]) > lines or outline["truncated"]:
+        out.append("... (guide continues)")
     return "\n".join(out)
 
 
-PHASES = [
-    {
-        "index": 1,
-        "title": "Phase 1: Concept & Strategy",
-        "folder": os.path.join(ROOT, "phase1_concept_strategy"),
-        "guide": os.path.join(BRAIN, "phase_1_concept_strategy.md"),
-        # Progress signal: any non-hidden file in Phase 1 folder
-        "progress_check": lambda p: any(
-            os.path.isfile(os.path.join(p, f)) for f in os.listdir(p) if not f.startswith(".")
-        ) if os.path.isdir(p) else False,
-    },
-    {
-        "index": 2,
-        "title": "Phase 2: Development Planning",
-        "folder": os.path.join(ROOT, "phase2_development_planning"),
-        "guide": os.path.join(BRAIN, "phase_2_dev_planning.md"),
-        # Progress signals: dynamic artifacts only (deliverables/* or screen_flows/*)
-        "progress_check": lambda p: _phase2_progress(p),
-    },
-    {
-        "index": 3,
-        "title": "Phase 3: AI Execution",
-        "folder": os.path.join(ROOT, "phase3_ai_execution"),
-        "guide": os.path.join(BRAIN, "phase_3_ai_execution.md"),
-        # Progress signals: any files inside codebase/ or tests/
-        "progress_check": lambda p: _any_files(os.path.join(p, "codebase")) or _any_files(os.path.join(p, "tests")),
-    },
-    {
-        "index": 4,
-        "title": "Phase 4: Testing & Iteration",
-        "folder": os.path.join(ROOT, "phase4_testing_iteration"),
-        "guide": os.path.join(BRAIN, "phase_4_testing_iteration.md"),
-        # Progress signals: files in tests subfolders or key md outputs
-        "progress_check": lambda p: (
-            _any_files(os.path.join(p, "tests", "unit")) or
-            _any_files(os.path.join(p, "tests", "integration")) or
-            _any_files(os.path.join(p, "tests", "e2e")) or
-            _any_files(os.path.join(p, "tests", "load")) or
-            _any_files(os.path.join(p, "tests", "security")) or
-            any(os.path.isfile(os.path.join(p, name)) for name in ("test_results.md", "bug_report.md", "ci_cd_logs.md"))
-        ),
-    },
-    {
-        "index": 5,
-        "title": "Phase 5: Launch & Growth",
-        "folder": os.path.join(ROOT, "phase5_launch_growth"),
-        "guide": os.path.join(BRAIN, "phase_5_launch_growth.md"),
-        # Progress signals: files in known subfolders or key md outputs
-        "progress_check": lambda p: (
-            any(
-                _any_files(os.path.join(p, d))
-                for d in ("launch_materials", "marketing", "monetization", "retention", "trust_safety")
-            ) or
-            any(
-                os.path.isfile(os.path.join(p, name))
-                for name in ("appstore_metadata.md", "marketing_funnel.md", "monetization.md", "retention_systems.md", "trust_safety.md")
-            )
-        ),
-    },
-]
-
-
-def analyze_workspace():
-    """Return a default summary for all phases without checking progress."""
+_PHASES = None
+
+
+def phases() -> PhaseRegistry:
+    """One definition per phase, loaded from tools/phases.json on first use."""
+    global _PHASES
+    if _PHASES is None:
+        _PHASES = PhaseRegistry.from_config(PHASES_CONFIG, ROOT, BRAIN)
+    return _PHASES
+
+
+def __getattr__(name):
+    # cli_interface.PHASES keeps working for callers without loading it at import
+    if name == "PHASES":
+        return phases()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@profiling.profiled("analyze_workspace")
+def analyze_workspace(index: WorkspaceIndex | None = None, project_root=None):
+    """
+    Summarize every phase and whether its folder already holds progress.
+
+    All phase folders are indexed in a single pass; the index is persisted
+    under .builder_cache/ so later calls only re-list directories whose mtime
+    changed. ``project_root`` analyzes another project instead of ROOT.
+    Returns (last_index, summaries) where last_index is the highest phase
+    index with progress, or 0 when nothing has been generated yet.
+    """
+    root = _project_dir(project_root)
+    folders = {ph["index"]: os.path.join(root, os.path.relpath(ph["folder"], ROOT))
+               for ph in phases()}
+    if index is None:
+        index_path = (PROGRESS_INDEX if root == ROOT
+                      else os.path.join(root, ".builder_cache", "progress_index.json"))
+        index = WorkspaceIndex(root, index_path)
+        index.load()
+    index.scan(folders.values())
+    try:
+        index.save()
+    except OSError:
+        pass  # A read-only workspace still gets an in-memory answer
+
+    last_index = 0
     summaries = []
-    for ph in PHASES:
-        heading = read_first_heading(ph["guide"])
+    for ph in phases():
+        has_progress = bool(ph["progress_check"](index, folders[ph["index"]]))
+        if has_progress:
+            last_index = max(last_index, ph["index"])
         summaries.append({
             "index": ph["index"],
             "title": ph["title"],
-            "guide_heading": heading,
-            "has_progress": False,  # Always assume no progress
+            "guide_heading": read_first_heading(ph["guide"]),
+            "has_progress": has_progress,
         })
-    return 0, summaries  # Always start from scratch
+    return last_index, summaries
 
 
 def prompt_yes_no(prompt: str, default_yes: bool = True) -> bool:
@@ -183,13 +206,15 @@ def prompt_choice(prompt: str, choices: list[str]) -> int:
 
 def continue_from_phase(idx: int):
     # Show preview of current and subsequent phases; do not modify files
-    for current in range(idx, 6):
-        ph = next(p for p in PHASES if p["index"] == current)
+    registry = phases()
+    remaining = [i for i in registry.indices() if i >= idx]
+    for current in remaining:
+        ph = registry.get(current)
         clear()
         print(ph["title"])
         print(f"Guide: {os.path.relpath(ph['guide'], ROOT)}\n")
         print(read_preview(ph["guide"]))
-        if current < 5:
+        if current != remaining[-1]:
             input("\nPress Enter to proceed to the next phase preview...")
     clear()
     print("You’ve reached the end of the preview flow. Generation steps will run during actual execution.")
@@ -203,221 +228,351 @@ def _ask(prompt, default=""):
         return default
 
 
-def analyze_phase1_outputs(project_root: Path):
-    """
-    Analyze Phase 1 outputs to determine required screens and their descriptions.
-    """
-    phase1_dir = project_root / "phase1_concept_strategy" / "deliverables"
-    screens = []
+def _answer(answers, key, prompt, default=""):
+    """Take ``key`` from pre-supplied answers, or ask interactively when there are none."""
+    if answers is None:
+        return _ask(prompt, default)
+    value = answers.get(key)
+    if isinstance(value, (list, tuple)):
+        value = ", ".join(str(v) for v in value)
+    value = str(value).strip() if value is not None else ""
+    return value if value else default
 
+
+def _project_dir(project_root=None) -> str:
+    return str(Path(project_root).resolve()) if project_root is not None else ROOT
+
+
+def _phase1_screens(project_root: Path):
+    """Return (source_file, screen_name, screen_desc) for each Phase 1 deliverable."""
+    phase1_dir = project_root / "phase1_concept_strategy" / "deliverables"
     if not phase1_dir.exists():
         print("Phase 1 deliverables not found. Please complete Phase 1 first.")
-        return screens
+        return []
 
     # Example logic: infer screens from deliverables
-    for file in phase1_dir.glob("*.md"):
+    screens = []
+    for file in sorted(phase1_dir.glob("*.md")):
         screen_name = file.stem.replace("_", " ").title()
         screen_desc = f"Generated from {file.name}"  # Placeholder description
-        screens.append((screen_name, screen_desc))
-
+        screens.append((file, screen_name, screen_desc))
     return screens
 
 
-def run_phase2_wizard(project_root: Path):
+def analyze_phase1_outputs(project_root: Path):
+    """
+    Analyze Phase 1 outputs to determine required screens and their descriptions.
+    """
+    return [(name, desc) for _, name, desc in _phase1_screens(project_root)]
+
+
+def _render_phase2_screen(phase2_dir: Path, screen_name: str, screen_desc: str) -> dict:
+    """Render the flow and six deliverables for one screen, keyed by output path."""
+    slug = screen_name.lower().replace(" ", "_")
+    screen_dir = phase2_dir / "deliverables" / slug
+    items = [(phase2_dir / "screen_flows" / f"{slug}.mmd", "phase2/screen_flow.mmd", None)]
+    items += [(screen_dir / doc, f"phase2/{doc}", None) for doc in PHASE2_SCREEN_DOCS]
+    context = {"screen_name": screen_name, "screen_desc": screen_desc}
+    return dict(TEMPLATES.render_batch(items, shared=context))
+
+
+def _load_phase2_manifest(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("sources", {}) if data.get("version") == 1 else {}
+
+
+def _remove_outputs(project_root: Path, outputs) -> int:
+    """
+    Delete generated files (and directories left empty) and drop them from the
+    generation manifest. Returns files removed.
+    """
+    removed = 0
+    removed_dirs = []
+    for rel in outputs:
+        path = project_root / rel
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+        try:
+            path.parent.rmdir()
+            removed_dirs.append(path.parent)
+        except OSError:
+            pass  # Not empty or already gone
+    if outputs:
+        generation_manifest.forget(project_root, files=outputs, dirs=removed_dirs)
+    return removed
+
+
+def _render_changed_screens(project_root: Path, phase2_dir: Path, screens, previous: dict,
+                            writer: ArtifactWriter, force: bool):
+    """
+    Queue outputs for every screen whose Phase 1 source changed or lost an
+    output (every screen when ``force``). Returns the new manifest sources and
+    the number of screens skipped as unchanged.
+    """
+    from hashlib import sha256  # Deferred: only Phase 2 hashes sources
+
+    current = {}
+    skipped = 0
+    for source, screen_name, screen_desc in screens:
+        key = source.relative_to(project_root).as_posix()
+        digest = sha256(source.read_bytes()).hexdigest()
+        entry = previous.get(key)
+        if (not force and entry and entry["hash"] == digest
+                and all((project_root / o).is_file() for o in entry["outputs"])):
+            current[key] = entry
+            skipped += 1
+            continue
+        rendered = _render_phase2_screen(phase2_dir, screen_name, screen_desc)
+        for path, content in rendered.items():
+            writer.add(path, content)
+        current[key] = {
+            "hash": digest,
+            "screen": screen_name,
+            "outputs": [p.relative_to(project_root).as_posix() for p in rendered],
+        }
+    return current, skipped
+
+
+def _stale_outputs(previous: dict, current: dict) -> list:
+    """Outputs of screens whose Phase 1 source disappeared."""
+    live = {o for entry in current.values() for o in entry["outputs"]}
+    return [
+        o for key, entry in previous.items() if key not in current
+        for o in entry["outputs"] if o not in live
+    ]
+
+
+def _queue_task_board(writer: ArtifactWriter, task_board_file: Path, screens, previous: dict,
+                      current: dict, force: bool) -> None:
+    """The task board lists every screen, so it only changes with the screen set."""
+    screen_set_changed = sorted(e["screen"] for e in current.values()) != sorted(
+        e["screen"] for e in previous.values())
+    if force or screen_set_changed or not task_board_file.is_file():
+        writer.add(task_board_file, TEMPLATES.render("phase2/task_board.md", {
+            "screen_list": "\n".join(f"- [ ] {name}: {desc}" for _, name, desc in screens),
+        }))
+
+
+def _save_phase2_manifest(manifest_file: Path, sources: dict) -> None:
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    manifest = json.dumps({"version": 1, "sources": sources}, indent=2)
+    write_atomic(str(manifest_file), manifest.encode("utf-8"))
+
+
+@traced("phase2")
+@profiling.profiled("phase2_wizard")
+def run_phase2_wizard(project_root: Path, workers: int | None = None, force: bool = False):
     """
     Generate Phase 2 deliverables: screen flows, detailed docs, and a task board.
+
+    Generation is incremental: .builder_cache/phase2_manifest.json maps each
+    Phase 1 source to its content hash and the outputs derived from it. Only
+    screens whose source changed (or whose outputs are missing) are rendered,
+    and outputs of screens whose source disappeared are deleted. ``force``
+    re-renders every screen; stale outputs are still removed. Documents are
+    flushed by an ArtifactWriter using ``workers`` threads. Returns the
+    writer's report plus skipped/removed counts.
     """
     project_root = Path(project_root).resolve()
     phase2_dir = project_root / "phase2_development_planning"
-    screen_flows_dir = phase2_dir / "screen_flows"
-    deliverables_dir = phase2_dir / "deliverables"
     task_board_file = phase2_dir / "task_board.md"
-
-    # Ensure directories exist
-    screen_flows_dir.mkdir(parents=True, exist_ok=True)
-    deliverables_dir.mkdir(parents=True, exist_ok=True)
+    manifest_file = project_root / ".builder_cache" / "phase2_manifest.json"
 
     # Dynamically determine screens from Phase 1 outputs
-    screens = analyze_phase1_outputs(project_root)
+    screens = _phase1_screens(project_root)
+    previous = _load_phase2_manifest(manifest_file)
+
+    writer = ArtifactWriter(workers=workers)
+    with span("phase2.render") as step:
+        current, skipped = _render_changed_screens(project_root, phase2_dir, screens, previous,
+                                                   writer, force)
+        step.set(screens=len(screens), skipped=skipped)
+
+    removed = _remove_outputs(project_root, _stale_outputs(previous, current))
+
     if not screens:
         print("No screens detected. Skipping Phase 2.")
-        return
-
-    # Generate screen flows
-    for screen_name, screen_desc in screens:
-        flow_file = screen_flows_dir / f"{screen_name.lower().replace(' ', '_')}.mmd"
-        flow_file.write_text(f"""graph TD
-    Start --> {screen_name}
-    {screen_name} --> End
-""", encoding="utf-8")
-
-    # Generate deliverables
-    for screen_name, screen_desc in screens:
-        screen_dir = deliverables_dir / screen_name.lower().replace(" ", "_")
-        screen_dir.mkdir(parents=True, exist_ok=True)
-        (screen_dir / "user_flow.md").write_text(f"# User Flow for {screen_name}\n\n{screen_desc}", encoding="utf-8")
-        (screen_dir / "data_flow.md").write_text(f"# Data Flow for {screen_name}\n\n{screen_desc}", encoding="utf-8")
-        (screen_dir / "state_flow.md").write_text(f"# State Flow for {screen_name}\n\n{screen_desc}", encoding="utf-8")
-        (screen_dir / "api_service_flow.md").write_text(f"# API/Service Flow for {screen_name}\n\n{screen_desc}", encoding="utf-8")
-        (screen_dir / "error_exception_flow.md").write_text(f"# Error/Exception Flow for {screen_name}\n\n{screen_desc}", encoding="utf-8")
-        (screen_dir / "security_privacy_flow.md").write_text(f"# Security/Privacy Flow for {screen_name}\n\n{screen_desc}", encoding="utf-8")
-
-    # Generate task board
-    task_board_file.write_text("""# Phase 2 Task Board
-
-## Screens
-""" + "\n".join(f"- [ ] {name}: {desc}" for name, desc in screens), encoding="utf-8")
+        if previous:
+            # The task board lists the screens just removed, so it goes with them
+            _remove_outputs(project_root, [task_board_file.relative_to(project_root).as_posix()])
+            _save_phase2_manifest(manifest_file, {})
+        return None
+
+    _queue_task_board(writer, task_board_file, screens, previous, current, force)
+
+    with span("phase2.write") as step:
+        report = writer.flush()
+        step.set(files=report["files"], bytes=report["bytes"])
+    _save_phase2_manifest(manifest_file, current)
+    generation_manifest.record_report(project_root, report)
+    generation_manifest.record(project_root, files=[manifest_file])
+    report.update(skipped=skipped, removed=removed)
 
     print("\nPhase 2 deliverables created:")
-    print(f"- Screen flows in: {screen_flows_dir}")
-    print(f"- Deliverables in: {deliverables_dir}")
+    print(f"- Screen flows in: {phase2_dir / 'screen_flows'}")
+    print(f"- Deliverables in: {phase2_dir / 'deliverables'}")
     print(f"- Task board: {task_board_file}")
+    print(f"- Wrote {report['files']} files ({report['bytes']} bytes) in {report['seconds']:.3f}s "
+          f"({report['files_per_sec']:.0f} files/s, {report['workers']} workers); "
+          f"{skipped} unchanged screens skipped, {removed} stale files removed")
+    return report
+
+
+def _log_phase_completion(root: str, title: str) -> None:
+    """
+    Append a completion line to the project's MASTER_GOAL_PROGRESS.md
+    (recorded in the generation manifest if we create it).
+    """
+    progress_file = os.path.join(root, "MASTER_GOAL_PROGRESS.md")
+    created = not os.path.exists(progress_file)
+    with open(progress_file, "a") as f:
+        f.write("\n{} completed on {}\n".format(title, time.strftime("%Y-%m-%d %H:%M:%S")))
+    if created:
+        generation_manifest.record(root, files=[progress_file])
 
 
-def run_phase3_wizard():
+@traced("phase3")
+@profiling.profiled("phase3_wizard")
+def run_phase3_wizard(project_root=None):
     """
     Automates Phase 3: AI Execution.
     - Generates code, tests, and CI/CD workflows based on Phase 2 outputs.
     - Updates progress tracking files.
+    Works on ``project_root`` (defaults to this repository's root).
     """
-    print("[DEBUG] Starting Phase 3: AI Execution...")
+    root = _project_dir(project_root)
+    debug("Starting Phase 3: AI Execution...")
 
     # Step 1: Analyze Phase 2 Outputs
-    phase2_folder = os.path.join(ROOT, "phase2_development_planning")
-    print(f"[DEBUG] Checking if Phase 2 folder exists: {phase2_folder}")
-    if not os.path.isdir(phase2_folder):
-        print("[DEBUG] Phase 2 outputs not found. Please complete Phase 2 first.")
-        return
-
-    print("[DEBUG] Analyzing Phase 2 deliverables...")
-    deliverables_folder = os.path.join(phase2_folder, "deliverables")
-    screen_flows_folder = os.path.join(phase2_folder, "screen_flows")
-
-    print(f"[DEBUG] Checking deliverables folder: {deliverables_folder}")
-    print(f"[DEBUG] Checking screen flows folder: {screen_flows_folder}")
-
-    if not _any_files(deliverables_folder):
-        print("[DEBUG] No files found in deliverables folder.")
-    if not _any_files(screen_flows_folder):
-        print("[DEBUG] No files found in screen flows folder.")
-
-    if not _any_files(deliverables_folder) or not _any_files(screen_flows_folder):
-        print("[DEBUG] Phase 2 deliverables are incomplete. Please ensure all deliverables are finalized.")
-        return
+    with span("phase3.analyze_phase2"):
+        phase2_folder = os.path.join(root, "phase2_development_planning")
+        debug("Checking if Phase 2 folder exists: %s", phase2_folder)
+        if not os.path.isdir(phase2_folder):
+            warning("Phase 2 outputs not found. Please complete Phase 2 first.")
+            return
+
+        debug("Analyzing Phase 2 deliverables...")
+        deliverables_folder = os.path.join(phase2_folder, "deliverables")
+        screen_flows_folder = os.path.join(phase2_folder, "screen_flows")
+
+        debug("Checking deliverables folder: %s", deliverables_folder)
+        debug("Checking screen flows folder: %s", screen_flows_folder)
+
+        has_deliverables = _any_files(deliverables_folder)
+        has_screen_flows = _any_files(screen_flows_folder)
+        if not has_deliverables:
+            debug("No files found in deliverables folder.")
+        if not has_screen_flows:
+            debug("No files found in screen flows folder.")
+
+        if not has_deliverables or not has_screen_flows:
+            warning("Phase 2 deliverables are incomplete. "
+                    "Please ensure all deliverables are finalized.")
+            return
 
     # Step 2: Generate Codebase
-    phase3_folder = os.path.join(ROOT, "phase3_ai_execution")
+    phase3_folder = os.path.join(root, "phase3_ai_execution")
     codebase_folder = os.path.join(phase3_folder, "codebase")
-    print(f"[DEBUG] Creating codebase folder: {codebase_folder}")
-    os.makedirs(codebase_folder, exist_ok=True)
-    print("[DEBUG] Generating codebase...")
-    # Placeholder for code generation logic
-    with open(os.path.join(codebase_folder, "main.py"), "w") as f:
-        f.write("# Main application code\n")
+    writer = ArtifactWriter()
+    with span("phase3.codebase"):
+        debug("Creating codebase folder: %s", codebase_folder)
+        debug("Generating codebase...")
+        # Placeholder for code generation logic
+        writer.add(os.path.join(codebase_folder, "main.py"), TEMPLATES.render("phase3/main.py"))
 
     # Step 3: Generate Tests
     tests_folder = os.path.join(phase3_folder, "tests")
-    print(f"[DEBUG] Creating tests folder: {tests_folder}")
-    os.makedirs(tests_folder, exist_ok=True)
-    print("[DEBUG] Generating tests...")
-    # Placeholder for test generation logic
-    with open(os.path.join(tests_folder, "test_main.py"), "w") as f:
-        f.write("# Unit tests for main application\n")
+    with span("phase3.tests"):
+        debug("Creating tests folder: %s", tests_folder)
+        debug("Generating tests...")
+        # Placeholder for test generation logic
+        writer.add(os.path.join(tests_folder, "test_main.py"),
+                   TEMPLATES.render("phase3/test_main.py"))
 
     # Step 4: Generate CI/CD Workflows
-    print("[DEBUG] Generating CI/CD workflows...")
-    with open(os.path.join(phase3_folder, "ci_cd_workflows.md"), "w") as f:
-        f.write("# CI/CD Workflows\n")
+    with span("phase3.ci_cd"):
+        debug("Generating CI/CD workflows...")
+        writer.add(os.path.join(phase3_folder, "ci_cd_workflows.md"),
+                   TEMPLATES.render("phase3/ci_cd_workflows.md"))
+    with span("phase3.write") as step:
+        report = writer.flush()
+        step.set(files=report["files"], bytes=report["bytes"])
+        generation_manifest.record_report(root, report)
 
     # Step 5: Update Progress
-    print("[DEBUG] Updating progress tracking...")
-    progress_file = os.path.join(ROOT, "MASTER_GOAL_PROGRESS.md")
-    with open(progress_file, "a") as f:
-        f.write("\nPhase 3: AI Execution completed on {}\n".format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+    with span("phase3.progress"):
+        debug("Updating progress tracking...")
+        _log_phase_completion(root, "Phase 3: AI Execution")
 
-    print("[DEBUG] Phase 3: AI Execution completed successfully!")
+    info("Phase 3: AI Execution completed successfully!")
 
 
-# Add Phase 3 to the CLI
-PHASES.append({
-    "index": 3,
-    "title": "Phase 3: AI Execution",
-    "folder": os.path.join(ROOT, "phase3_ai_execution"),
-    "guide": os.path.join(BRAIN, "phase_3_ai_execution.md"),
-    "progress_check": lambda p: _any_files(os.path.join(p, "codebase")) or _any_files(os.path.join(p, "tests")),
-})
+# (answer key, question, default) for the Phase 1 Q&A
+PHASE1_QUESTIONS = (
+    ("app_name", "What is the app/product name?", "My App"),
+    ("audience", "Who is the main audience? (e.g., 'busy parents', 'small shops')",
+     "General users"),
+    ("top_goals", "Top 3 goals? (comma separated)", "Goal A, Goal B, Goal C"),
+    ("pain_points", "Top pain points you want to fix? (comma separated)", "Pain 1, Pain 2, Pain 3"),
+    ("must_haves", "Must‑have features? (comma separated)", "Feature 1, Feature 2"),
+    ("success_metrics", "How will you measure success? (comma separated)",
+     "Daily active users, Task completion rate"),
+)
 
 
-def run_phase1_wizard(project_root: Path) -> dict:
+@traced("phase1")
+@profiling.profiled("phase1_wizard")
+def run_phase1_wizard(project_root: Path, answers: dict | None = None) -> dict:
     """
     Simple Q&A to create Phase 1 deliverables.
+    With ``answers`` (keys: app_name, audience, top_goals, pain_points,
+    must_haves, success_metrics; lists or comma separated strings) nothing is
+    prompted and missing keys fall back to the defaults.
     Returns a summary dict with created files and key info.
     """
     project_root = Path(project_root).resolve()
     out_dir = project_root / "phase1_concept_strategy" / "deliverables"
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    print("\nLet’s capture the basics. Press Enter to skip any question.\n")
-    app_name = _ask("What is the app/product name?", "My App")
-    audience = _ask("Who is the main audience? (e.g., 'busy parents', 'small shops')", "General users")
-    top_goals = _ask("Top 3 goals? (comma separated)", "Goal A, Goal B, Goal C")
-    pain_points = _ask("Top pain points you want to fix? (comma separated)", "Pain 1, Pain 2, Pain 3")
-    must_haves = _ask("Must‑have features? (comma separated)", "Feature 1, Feature 2")
-    success_metrics = _ask("How will you measure success? (comma separated)", "Daily active users, Task completion rate")
 
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+    if answers is None:
+        print("\nLet’s capture the basics. Press Enter to skip any question.\n")
+    values = {key: _answer(answers, key, question, default)
+              for key, question, default in PHASE1_QUESTIONS}
+    app_name = values["app_name"]
+    audience = values["audience"]
+    top_goals = values["top_goals"]
+    pain_points = values["pain_points"]
+    must_haves = values["must_haves"]
+    success_metrics = values["success_metrics"]
+
+    timestamp = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime())
+    context = {
+        "timestamp": timestamp,
+        "app_name": app_name,
+        "audience": audience,
+        "top_goals": top_goals,
+        "pain_points": pain_points,
+        "must_haves": must_haves,
+        "success_metrics": success_metrics,
+    }
 
-    # Problem Statement
+    # Problem Statement, User Personas, Success Criteria
     problem_md = out_dir / "01_problem_statement.md"
-    problem_md.write_text(f"""# Problem Statement
-Last updated: {timestamp}
-
-- App name: {app_name}
-- Audience: {audience}
-
-## Problem
-- People experience: {pain_points}
-
-## Why now
-- This matters because: {top_goals}
-
-## Scope
-- Must‑haves: {must_haves}
-- Out of scope: To be decided
-""", encoding="utf-8")
-
-    # User Personas
     personas_md = out_dir / "02_user_personas.md"
-    personas_md.write_text(f"""# User Personas
-Last updated: {timestamp}
-
-## Primary persona
-- Who: {audience}
-- Goals: {top_goals}
-- Pain points: {pain_points}
-
-## Secondary persona
-- Who: To be decided
-- Goals: To be decided
-- Pain points: To be decided
-""", encoding="utf-8")
-
-    # Success Criteria
     success_md = out_dir / "03_success_criteria.md"
-    success_md.write_text(f"""# Success Criteria
-Last updated: {timestamp}
-
-## Product success metrics
-- {success_metrics}
-
-## Experience acceptance criteria
-- Users can complete the core flow in under 2 minutes
-- New users understand the value within 1 session
-
-## Technical acceptance criteria
-- App runs without errors on supported platforms
-- Core actions complete within acceptable time
-""", encoding="utf-8")
+    writer = ArtifactWriter()
+    for path, text in TEMPLATES.render_batch([
+        (problem_md, "phase1/01_problem_statement.md", None),
+        (personas_md, "phase1/02_user_personas.md", None),
+        (success_md, "phase1/03_success_criteria.md", None),
+    ], shared=context):
+        writer.add(path, text)
+    generation_manifest.record_report(project_root, writer.flush())
 
     created = [str(problem_md), str(personas_md), str(success_md)]
     return {
@@ -449,20 +604,31 @@ def run_write_mode(project_root: Path):
 
 def execute_phase(phase):
     """Execute a single phase by reading steps from the guide."""
+    with profiling.section(f"phase{phase['index']}"):
+        _execute_phase(phase)
+
+
+def _execute_phase(phase):
     print(f"\nStarting {phase['title']}...")
     guide_path = phase['guide']
 
-    if not os.path.isfile(guide_path):
+    outline = GUIDES.get(guide_path)
+    if outline is None:
         print(f"Guide not found for {phase['title']}. Skipping...")
         return
 
-    with open(guide_path, "r", encoding="utf-8") as guide:
-        steps = [line.strip() for line in guide if line.startswith("Step")]
+    steps = outline["steps"]
 
     total_steps = len(steps)
     for i, step in enumerate(steps, start=1):
-        print(f"\n{step}")
-        print(f"Instruction: Follow the directive in the guide.")
+        print(f"\n{step.heading}")
+        if step.description:
+            print(step.description)
+        if step.directives:
+            for directive in step.directives:
+                print(f"- {directive}")
+        else:
+            print("Instruction: Follow the directive in the guide.")
         input(f"Step {i} of {total_steps} complete ✅. Press Enter to continue...")
 
     print(f"\n{phase['title']} complete ✅\n")
@@ -473,144 +639,148 @@ def initiate():
     print("AI Apps Builder")
     print("Your friendly guide to plan, build, test, and launch your app.\n")
 
-    for phase in PHASES:
+    for phase in phases():
         execute_phase(phase)
 
     print("\nAll phases executed successfully!\n")
 
 
-def run_phase4_wizard():
+@traced("phase4")
+@profiling.profiled("phase4_wizard")
+def run_phase4_wizard(project_root=None, workers: int | None = None):
     """
     Automates Phase 4: Testing & Iteration.
-    - Runs unit, integration, and e2e tests.
-    - Generates test results, bug reports, and CI/CD logs.
+    - Runs the project's tests (see suite_runner.py) across ``workers``
+      processes and reports them by category: unit, integration and e2e.
+    - Writes test results (durations, failures, slowest tests), a bug report
+      listing failing tests, and CI/CD logs.
+    Works on ``project_root`` (defaults to this repository's root).
+    Returns the suite_runner summary.
     """
-    print("[DEBUG] Starting Phase 4: Testing & Iteration...")
+    root = _project_dir(project_root)
+    debug("Starting Phase 4: Testing & Iteration...")
 
     # Step 1: Prepare Test Environment
-    print("[DEBUG] Preparing test environment...")
-    # Simulate environment setup
-    print("[INFO] Test environment prepared successfully.")
-
-    # Step 2: Run Unit & Component Tests
-    print("[DEBUG] Running unit and component tests...")
-    # Simulate running tests
-    print("[INFO] All unit and component tests passed.")
-    phase4_folder = os.path.join(ROOT, "phase4_testing_iteration")
-    os.makedirs(phase4_folder, exist_ok=True)
+    with span("phase4.environment") as step:
+        debug("Preparing test environment...")
+        test_files = suite_runner.discover(root)
+        step.set(files=len(test_files))
+        info("Test environment prepared: %d test files found.", len(test_files))
+
+    # Step 2: Run Unit & Component Tests (every category runs in the same sharded pass)
+    with span("phase4.run_tests") as step:
+        debug("Running tests...")
+        summary = suite_runner.run_tests(root, workers=workers)
+        failing = summary["failed"] + summary["errors"]
+        step.set(tests=summary["tests"], failed=failing, workers=summary["workers"])
+    by_category = {}
+    for result in summary["results"]:
+        by_category.setdefault(result["category"], []).append(result)
+    for category, label in (("unit", "Unit and component"), ("integration", "Integration and API"),
+                            ("e2e", "End-to-end")):
+        tally = suite_runner.counts(by_category.get(category, ()))
+        info("%s tests: %d passed, %d failed, %d errors, %d skipped.", label,
+             tally["passed"], tally["failed"], tally["error"], tally["skipped"])
+    if failing:
+        warning("%d of %d tests did not pass.", failing, summary["tests"])
+    fields = suite_runner.report_fields(summary)
+    phase4_folder = os.path.join(root, "phase4_testing_iteration")
+    writer = ArtifactWriter()
     test_results_file = os.path.join(phase4_folder, "test_results.md")
-    with open(test_results_file, "w") as f:
-        f.write("# Test Results\n\nAll unit and component tests passed.\n")
-
-    # Step 3: Run Integration & API Tests
-    print("[DEBUG] Running integration and API tests...")
-    # Simulate running tests
-    print("[INFO] All integration and API tests passed.")
-
-    # Step 4: Run End-to-End (E2E) Tests
-    print("[DEBUG] Running end-to-end tests...")
-    # Simulate running tests
-    print("[INFO] All end-to-end tests passed.")
-
-    # Step 5: Load & Stress Testing
-    print("[DEBUG] Running load and stress tests...")
-    # Simulate running tests
-    print("[INFO] Load and stress tests completed successfully.")
-
-    # Step 6: Security & Compliance Testing
-    print("[DEBUG] Running security and compliance tests...")
-    bug_report_file = os.path.join(phase4_folder, "bug_report.md")
-    with open(bug_report_file, "w") as f:
-        f.write("# Bug Report\n\nNo critical vulnerabilities found.\n")
-    print("[INFO] Security and compliance tests passed.")
+    writer.add(test_results_file, TEMPLATES.render("phase4/test_results.md", fields))
 
-    # Generate CI/CD Logs
-    print("[DEBUG] Generating CI/CD logs...")
-    ci_cd_logs_file = os.path.join(phase4_folder, "ci_cd_logs.md")
-    with open(ci_cd_logs_file, "w") as f:
-        f.write("# CI/CD Logs\n\nAll workflows executed successfully.\n")
-    print("[INFO] CI/CD logs generated.")
+    # Step 3: Load & Stress Testing (simulated: the project has no load suite)
+    with span("phase4.load_tests"):
+        info("Load and stress tests: not run (simulated step, no load suite configured).")
 
-    # Update Progress
-    print("[DEBUG] Updating progress tracking...")
-    progress_file = os.path.join(ROOT, "MASTER_GOAL_PROGRESS.md")
-    with open(progress_file, "a") as f:
-        f.write("\nPhase 4: Testing & Iteration completed on {}\n".format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+    # Step 4: Security & Compliance Testing (simulated: the bug report lists the failing tests)
+    with span("phase4.security_tests"):
+        bug_report_file = os.path.join(phase4_folder, "bug_report.md")
+        writer.add(bug_report_file, TEMPLATES.render("phase4/bug_report.md", fields))
+        info("Security and compliance tests: not run (simulated step, no security suite "
+             "configured); %d failing tests listed in the bug report.", failing)
 
-    print("[DEBUG] Phase 4: Testing & Iteration completed successfully!")
+    # Generate CI/CD Logs
+    with span("phase4.ci_cd_logs"):
+        debug("Generating CI/CD logs...")
+        ci_cd_logs_file = os.path.join(phase4_folder, "ci_cd_logs.md")
+        writer.add(ci_cd_logs_file, TEMPLATES.render("phase4/ci_cd_logs.md"))
+    with span("phase4.write") as step:
+        report = writer.flush()
+        step.set(files=report["files"], bytes=report["bytes"])
+        generation_manifest.record_report(root, report)
+        if summary["durations_file"]:
+            generation_manifest.record(root, files=[summary["durations_file"]])
+    info("CI/CD logs generated.")
 
+    # Update Progress
+    with span("phase4.progress"):
+        debug("Updating progress tracking...")
+        _log_phase_completion(root, "Phase 4: Testing & Iteration")
 
-# Add Phase 4 to the CLI
-PHASES.append({
-    "index": 4,
-    "title": "Phase 4: Testing & Iteration",
-    "folder": os.path.join(ROOT, "phase4_testing_iteration"),
-    "guide": os.path.join(BRAIN, "phase_4_testing_iteration.md"),
-    "progress_check": lambda p: _any_files(os.path.join(p, "tests")) or _any_files(os.path.join(p, "test_results.md")),
-})
+    info("Phase 4: Testing & Iteration completed successfully!")
+    return summary
 
 
-def run_phase5_wizard():
+@traced("phase5")
+@profiling.profiled("phase5_wizard")
+def run_phase5_wizard(project_root=None):
     """
     Automates Phase 5: Launch & Growth.
     - Generates launch materials, marketing plans, and growth strategies.
     - Updates progress tracking files.
+    Works on ``project_root`` (defaults to this repository's root).
     """
-    print("[DEBUG] Starting Phase 5: Launch & Growth...")
+    root = _project_dir(project_root)
+    debug("Starting Phase 5: Launch & Growth...")
 
     # Step 1: Final Pre-Launch Checklist
-    print("[DEBUG] Preparing pre-launch checklist...")
-    phase5_folder = os.path.join(ROOT, "phase5_launch_growth")
-    os.makedirs(phase5_folder, exist_ok=True)
-    appstore_metadata_file = os.path.join(phase5_folder, "appstore_metadata.md")
-    with open(appstore_metadata_file, "w") as f:
-        f.write("# App Store Metadata\n\nPlaceholder content for app store metadata.\n")
+    with span("phase5.pre_launch"):
+        debug("Preparing pre-launch checklist...")
+        phase5_folder = os.path.join(root, "phase5_launch_growth")
+        writer = ArtifactWriter()
+        appstore_metadata_file = os.path.join(phase5_folder, "appstore_metadata.md")
+        writer.add(appstore_metadata_file, TEMPLATES.render("phase5/appstore_metadata.md"))
 
     # Step 2: Deployment to Production
-    print("[DEBUG] Deploying to production...")
-    # Placeholder for deployment logic
+    with span("phase5.deploy"):
+        debug("Deploying to production...")
+        # Placeholder for deployment logic
 
     # Step 3: Distribution & App Store Submission
-    print("[DEBUG] Submitting to app stores...")
-    # Placeholder for app store submission logic
+    with span("phase5.app_stores"):
+        debug("Submitting to app stores...")
+        # Placeholder for app store submission logic
 
     # Step 4: Marketing Funnel Setup
-    print("[DEBUG] Setting up marketing funnel...")
-    marketing_funnel_file = os.path.join(phase5_folder, "marketing_funnel.md")
-    with open(marketing_funnel_file, "w") as f:
-        f.write("# Marketing Funnel\n\nPlaceholder content for marketing funnel.\n")
+    with span("phase5.marketing"):
+        debug("Setting up marketing funnel...")
+        marketing_funnel_file = os.path.join(phase5_folder, "marketing_funnel.md")
+        writer.add(marketing_funnel_file, TEMPLATES.render("phase5/marketing_funnel.md"))
 
     # Step 5: Monetization Rollout
-    print("[DEBUG] Rolling out monetization...")
-    monetization_file = os.path.join(phase5_folder, "monetization.md")
-    with open(monetization_file, "w") as f:
-        f.write("# Monetization\n\nPlaceholder content for monetization strategies.\n")
+    with span("phase5.monetization"):
+        debug("Rolling out monetization...")
+        monetization_file = os.path.join(phase5_folder, "monetization.md")
+        writer.add(monetization_file, TEMPLATES.render("phase5/monetization.md"))
 
     # Generate Retention and Trust & Safety Files
-    retention_file = os.path.join(phase5_folder, "retention_systems.md")
-    trust_safety_file = os.path.join(phase5_folder, "trust_safety.md")
-    with open(retention_file, "w") as f:
-        f.write("# Retention Systems\n\nPlaceholder content for retention systems.\n")
-    with open(trust_safety_file, "w") as f:
-        f.write("# Trust & Safety\n\nPlaceholder content for trust and safety.\n")
+    with span("phase5.retention"):
+        retention_file = os.path.join(phase5_folder, "retention_systems.md")
+        trust_safety_file = os.path.join(phase5_folder, "trust_safety.md")
+        writer.add(retention_file, TEMPLATES.render("phase5/retention_systems.md"))
+        writer.add(trust_safety_file, TEMPLATES.render("phase5/trust_safety.md"))
+    with span("phase5.write") as step:
+        report = writer.flush()
+        step.set(files=report["files"], bytes=report["bytes"])
+        generation_manifest.record_report(root, report)
 
     # Update Progress
-    print("[DEBUG] Updating progress tracking...")
-    progress_file = os.path.join(ROOT, "MASTER_GOAL_PROGRESS.md")
-    with open(progress_file, "a") as f:
-        f.write("\nPhase 5: Launch & Growth completed on {}\n".format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-
-    print("[DEBUG] Phase 5: Launch & Growth completed successfully!")
-
+    with span("phase5.progress"):
+        debug("Updating progress tracking...")
+        _log_phase_completion(root, "Phase 5: Launch & Growth")
 
-# Add Phase 5 to the CLI
-PHASES.append({
-    "index": 5,
-    "title": "Phase 5: Launch & Growth",
-    "folder": os.path.join(ROOT, "phase5_launch_growth"),
-    "guide": os.path.join(BRAIN, "phase_5_launch_growth.md"),
-    "progress_check": lambda p: _any_files(os.path.join(p, "appstore_metadata.md")),
-})
+    info("Phase 5: Launch & Growth completed successfully!")
 
 
 def chat_interface(test_inputs=None):
@@ -618,7 +788,7 @@ def chat_interface(test_inputs=None):
     Chat-driven interface for interacting with the app-building guide.
     Provides a seamless, conversational workflow for all phases.
     """
-    print("[DEBUG] Starting chat interface...")
+    debug("Starting chat interface...")
     print("Welcome to the AI App Builder Chat Interface!\n")
     print("I’m here to guide you through planning, building, testing, and launching your app.\n")
 
@@ -626,11 +796,11 @@ def chat_interface(test_inputs=None):
 
     # Exit immediately if test_inputs is empty
     if test_inputs is not None and len(test_inputs) == 0:
-        print("[DEBUG] No test inputs provided. Exiting chat interface.")
+        debug("No test inputs provided. Exiting chat interface.")
         return
 
     while True:
-        print("[DEBUG] Displaying main menu...")
+        debug("Displaying main menu...")
         print("What would you like to do next?")
         print("1) Start or resume a phase")
         print("2) View progress")
@@ -638,7 +808,7 @@ def chat_interface(test_inputs=None):
 
         if test_inputs:
             if input_index >= len(test_inputs):
-                print("[DEBUG] No more test inputs. Exiting.")
+                debug("No more test inputs. Exiting.")
                 break
             choice = test_inputs[input_index]
             input_index += 1
@@ -647,44 +817,216 @@ def chat_interface(test_inputs=None):
             try:
                 choice = input("> ").strip()
             except EOFError:
-                print("[ERROR] Input interrupted. Exiting chat interface.")
+                error("Input interrupted. Exiting chat interface.")
                 break
 
-        print(f"[DEBUG] User selected option: {choice}")
+        debug("User selected option: %s", choice)
         if choice == "1":
-            print("\n[DEBUG] User chose to start or resume a phase.")
-            print("Let’s analyze your progress and resume from where you left off.\n")
-            try:
-                initiate()
-            except Exception as e:
-                print(f"[ERROR] Failed to initiate phase: {e}")
+            debug("User chose to start or resume a phase.")
+            print("\nLet’s analyze your progress and resume from where you left off.\n")
+            with span("chat.resume"):
+                try:
+                    initiate()
+                except Exception as e:
+                    error("Failed to initiate phase: %s", e)
         elif choice == "2":
-            print("\n[DEBUG] User chose to view progress.")
-            print("Here’s your current progress:\n")
-            try:
-                _, summaries = analyze_workspace()
-                for s in summaries:
-                    status = "progress found" if s["has_progress"] else "no progress"
-                    print(f"- {s['title']} — {s['guide_heading']} [{status}]")
-                print()
-            except Exception as e:
-                print(f"[ERROR] Failed to analyze progress: {e}")
+            debug("User chose to view progress.")
+            print("\nHere’s your current progress:\n")
+            with span("chat.progress"):
+                try:
+                    _, summaries = analyze_workspace()
+                    for s in summaries:
+                        status = "progress found" if s["has_progress"] else "no progress"
+                        print(f"- {s['title']} — {s['guide_heading']} [{status}]")
+                    print()
+                except Exception as e:
+                    error("Failed to analyze progress: %s", e)
         elif choice == "3":
-            print("[DEBUG] User chose to exit.")
+            debug("User chose to exit.")
             print("Goodbye! If you need help again, just start the chat.")
             break
         else:
-            print("[DEBUG] Invalid choice entered.")
+            debug("Invalid choice entered.")
             print("Invalid choice. Please select 1, 2, or 3.\n")
 
 
-def main():
-    # If run with 'initiate' argument, or no args, always initiate
-    if len(sys.argv) == 1 or (len(sys.argv) > 1 and sys.argv[1].lower() == "initiate"):
-        initiate()
+def load_answers(path) -> list[dict]:
+    """
+    Load headless answer sets from a JSON or YAML file. The file holds one
+    mapping of Phase 1 answers or a list of them; each may also name its
+    ``project_root`` (relative paths resolve against the file's folder).
+    """
+    path = Path(path).resolve()
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("YAML answer files need PyYAML (pip install pyyaml); "
+                               "use JSON otherwise.") from None
+        data = yaml.safe_load(text)
     else:
-        # For any other args, still default to initiate to keep UX simple
-        initiate()
+        data = json.loads(text)
+    entries = data if isinstance(data, list) else [data]
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: each answer set must be a mapping")
+        if entry.get("project_root"):
+            entry["project_root"] = str((path.parent / entry["project_root"]).resolve())
+    return entries
+
+
+def run_phase_wizard(index: int, project_root=None, answers: dict | None = None, **options):
+    """
+    Run the generation wizard for phase ``index`` without prompts. ``options``
+    (e.g. ``workers``) are passed on to the Phase 2–5 wizards.
+    """
+    if index == 1:
+        return run_phase1_wizard(_project_dir(project_root), answers=answers or {})
+    wizards = {2: run_phase2_wizard, 3: run_phase3_wizard, 4: run_phase4_wizard,
+               5: run_phase5_wizard}
+    if index not in wizards:
+        raise KeyError(f"No wizard for phase {index}")
+    return wizards[index](_project_dir(project_root), **options)
+
+
+def run_headless(answers: dict, project_root=None, test_workers: int | None = None) -> dict:
+    """
+    Run Phases 1–5 end to end for ``project_root`` (default: the answers'
+    ``project_root``) without any prompts; one of them is required.
+    ``test_workers`` sizes Phase 4's test pool (default: one per CPU).
+    Returns the project root, app name and per-phase timings in seconds.
+    """
+    project_root = project_root or answers.get("project_root")
+    if not project_root:
+        raise ValueError("A headless run needs a project_root; "
+                         "it never generates into the builder repository")
+    root = _project_dir(project_root)
+    timings = {}
+    started = time.perf_counter()
+    summary = None
+    with span("project", root=root):
+        for index in range(1, 6):
+            t0 = time.perf_counter()
+            options = {"workers": test_workers} if index == 4 and test_workers else {}
+            result = run_phase_wizard(index, root, answers, **options)
+            timings[f"phase{index}"] = time.perf_counter() - t0
+            if index == 1:
+                summary = result
+
+    timings["total"] = time.perf_counter() - started
+    return {"project_root": root, "app_name": summary["app_name"], "timings": timings}
+
+
+def run_batch(answers_path, project_root=None) -> list[dict]:
+    """Headless batch mode: generate one project per answer set in ``answers_path``."""
+    entries = load_answers(answers_path)
+    if project_root is not None and len(entries) > 1:
+        raise ValueError("--root only applies to a single answer set; "
+                         "set project_root per entry instead")
+    if project_root is None:
+        missing = [i for i, entry in enumerate(entries) if not entry.get("project_root")]
+        if missing:
+            raise ValueError(f"Answer sets {missing} have no project_root")
+    started = time.perf_counter()
+    results = [run_headless(entry, project_root) for entry in entries]
+    elapsed = time.perf_counter() - started
+    rate = len(results) / elapsed * 60 if elapsed else 0.0
+    print(f"\nGenerated {len(results)} project(s) in {elapsed:.2f}s ({rate:.1f} projects/min)")
+    return results
+
+
+def main(argv=None):
+    """
+    Entry point. Options before or after the command apply to any command:
+    --log-level (DEBUG shows the wizards' step messages), --trace FILE
+    (append span trees as JSONL), --summary (print per-span timings at the
+    end) and --profile DIR (see profiling.py; with batch --workers each
+    project's worker writes its own reports to a subfolder of DIR).
+    """
+    import argparse
+    argv = sys.argv[1:] if argv is None else argv
+    options = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    options.add_argument("--log-level", choices=("DEBUG", "INFO", "WARNING", "ERROR"),
+                         type=str.upper)
+    options.add_argument("--trace", metavar="FILE", help="append span trees to this JSONL file")
+    options.add_argument("--summary", action="store_true",
+                         help="print a span timing table at the end")
+    options.add_argument("--profile", metavar="DIR",
+                         help="profile phases and wizards; write .pstats, allocation and "
+                              "collapsed-stack files to DIR")
+    opts, argv = options.parse_known_args(argv)
+    # Exported so batch --workers processes log and trace the same way
+    if opts.log_level:
+        os.environ["AI_BUILDER_LOG_LEVEL"] = opts.log_level
+    if opts.trace:
+        opts.trace = os.path.abspath(opts.trace)
+        os.environ["AI_BUILDER_TRACE"] = opts.trace
+    tracer = configure(level=opts.log_level, trace_path=opts.trace, record=opts.summary or None)
+    if opts.profile:
+        profiling.start(opts.profile)
+    try:
+        _dispatch(argv, profile_dir=opts.profile)
+    finally:
+        if opts.profile:
+            profiler, written = profiling.stop()
+            print("\n" + profiler.summary_table())
+            print(f"Wrote {len(written)} profile files to {profiler.output_dir}")
+        if opts.summary or opts.trace:
+            print("\n" + summary_table())
+            if tracer.trace_path:
+                print(f"Span trees appended to {tracer.trace_path}")
+
+
+def _dispatch(argv, profile_dir=None):
+    if argv and argv[0].lower() == "batch":
+        import argparse
+        parser = argparse.ArgumentParser(
+            prog="cli_interface.py batch",
+            description="Run Phases 1–5 headless from an answers file.")
+        parser.add_argument("answers", help="JSON or YAML file with Phase 1 answers")
+        parser.add_argument("--root",
+                            help="project folder to generate into (single answer set only)")
+        parser.add_argument("--workers", type=int, help="generate answer sets across N processes")
+        args = parser.parse_args(argv[1:])
+        if args.workers and args.root:
+            parser.error("--root cannot be combined with --workers; "
+                         "give each answer set its own project_root")
+        if args.workers:
+            try:
+                from .project_pool import generate_from_answers
+            except ImportError:
+                from project_pool import generate_from_answers
+            # Each project is profiled in its own worker process, into a subfolder
+            generate_from_answers(args.answers, args.workers, profile_dir)
+        else:
+            run_batch(args.answers, args.root)
+        return
+    if argv and argv[0].lower() in ("chat", "serve"):
+        import argparse
+        import asyncio
+        try:
+            from . import chat_session
+        except ImportError:
+            import chat_session
+        parser = argparse.ArgumentParser(
+            prog=f"cli_interface.py {argv[0].lower()}",
+            description="Async chat session (chat) or multi-session server (serve).")
+        parser.add_argument("--root", help="project folder the session works on")
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        args = parser.parse_args(argv[1:])
+        if argv[0].lower() == "chat":
+            asyncio.run(chat_session.run_console(args.root))
+        else:
+            print(f"Serving chat sessions on {args.host}:{args.port} (Ctrl+C to stop)")
+            try:
+                asyncio.run(chat_session.serve(args.host, args.port, args.root))
+            except KeyboardInterrupt:
+                pass
+        return
+    # 'initiate', no args, or anything else: keep UX simple and initiate
+    initiate()
 
 
 if __name__ == "__main__":
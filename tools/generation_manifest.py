@@ -0,0 +1,176 @@
+"""
+Manifest of everything the wizards generated in a project.
+
+Every wizard records the files it wrote and the directories it had to create
+in <project_root>/.builder_cache/generated.json. reset() deletes exactly
+those paths: files are unlinked on a thread pool, then the recorded
+directories are removed deepest first, but only once empty, so anything the
+user added inside a generated folder survives. Paths outside the project root
+are never touched: each path is resolved (following symlinks) and checked
+again before it is deleted, so a hand-edited manifest cannot reach out of the
+project. A dry run reports what would go without deleting anything.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    from .artifact_writer import DEFAULT_WORKERS, write_atomic
+except ImportError:
+    from artifact_writer import DEFAULT_WORKERS, write_atomic
+
+MANIFEST_VERSION = 1
+
+_LOCK = threading.Lock()  # Wizards for one project may run on several threads
+
+
+def manifest_path(project_root) -> Path:
+    return Path(project_root).resolve() / ".builder_cache" / "generated.json"
+
+
+def load_manifest(project_root) -> dict:
+    """Return ``{"files": set, "dirs": set}`` of project-relative posix paths."""
+    try:
+        data = json.loads(manifest_path(project_root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = {}
+    if data.get("version") != MANIFEST_VERSION:
+        data = {}
+    return {"files": set(data.get("files", ())), "dirs": set(data.get("dirs", ()))}
+
+
+def _save_manifest(project_root, manifest: dict) -> None:
+    path = manifest_path(project_root)
+    if not manifest["files"] and not manifest["dirs"]:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": MANIFEST_VERSION, "files": sorted(manifest["files"]),
+            "dirs": sorted(manifest["dirs"])}
+    write_atomic(str(path), json.dumps(data, indent=1).encode("utf-8"))
+
+
+def _relative(root: Path, paths) -> set:
+    rel = set()
+    for p in paths:
+        p = Path(os.path.abspath(root / p))
+        if p != root and p.is_relative_to(root):
+            rel.add(p.relative_to(root).as_posix())
+    return rel
+
+
+def record(project_root, files=(), dirs=()) -> None:
+    """Add generated ``files`` and created ``dirs`` (absolute or root-relative) to the manifest."""
+    root = Path(project_root).resolve()
+    files, dirs = _relative(root, files), _relative(root, dirs)
+    if not files and not dirs:
+        return
+    with _LOCK:
+        manifest = load_manifest(root)
+        if files <= manifest["files"] and dirs <= manifest["dirs"]:
+            return
+        manifest["files"] |= files
+        manifest["dirs"] |= dirs
+        _save_manifest(root, manifest)
+
+
+def record_report(project_root, report: dict) -> None:
+    """Record the paths of an ArtifactWriter.flush() report."""
+    record(project_root, report.get("paths", ()), report.get("created_dirs", ()))
+
+
+def forget(project_root, files=(), dirs=()) -> None:
+    """Drop ``files`` and ``dirs`` a wizard deleted itself from the manifest."""
+    root = Path(project_root).resolve()
+    files, dirs = _relative(root, files), _relative(root, dirs)
+    with _LOCK:
+        manifest = load_manifest(root)
+        if not (files & manifest["files"]) and not (dirs & manifest["dirs"]):
+            return
+        manifest["files"] -= files
+        manifest["dirs"] -= dirs
+        _save_manifest(root, manifest)
+
+
+def _inside(root: Path, path: Path) -> bool:
+    """True if ``path`` resolves (symlinks included) to somewhere below ``root``."""
+    try:
+        resolved = path.resolve()
+    except (OSError, RuntimeError):
+        return False
+    return resolved != root and resolved.is_relative_to(root)
+
+
+def _file_size(path: Path):
+    try:
+        st = path.lstat()
+    except OSError:
+        return None
+    return st.st_size
+
+
+def reset(project_root, dry_run: bool = False, workers: int | None = None) -> dict:
+    """
+    Delete every recorded file, then every recorded directory left empty.
+    Returns ``{"files", "dirs", "bytes", "missing", "kept_dirs", "outside", "seconds",
+    "dry_run"}``; with ``dry_run`` the counts say what would be deleted. Recorded
+    paths that resolve outside the project are counted in ``outside``, left alone
+    and dropped from the manifest.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    root = Path(project_root).resolve()
+    start = time.perf_counter()
+    with _LOCK:
+        manifest = load_manifest(root)
+        recorded = len(manifest["files"]) + len(manifest["dirs"])
+        files = [root / rel for rel in sorted(manifest["files"]) if _inside(root, root / rel)]
+        dirs = sorted((root / rel for rel in manifest["dirs"] if _inside(root, root / rel)),
+                      key=lambda p: len(p.parts), reverse=True)
+
+        workers = max(1, workers or DEFAULT_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            sizes = list(pool.map(_file_size, files))
+        present = [(p, size) for p, size in zip(files, sizes) if size is not None]
+        report = {
+            "files": len(present),
+            "dirs": sum(p.is_dir() for p in dirs),
+            "bytes": sum(size for _, size in present),
+            "missing": len(files) - len(present),
+            "kept_dirs": 0,
+            "outside": recorded - len(files) - len(dirs),
+            "dry_run": dry_run,
+        }
+        if not dry_run:
+            def unlink(path):
+                if not _inside(root, path):  # Re-checked right before deleting
+                    return
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(unlink, (p for p, _ in present)))
+            kept = set()
+            for directory in dirs:
+                if not _inside(root, directory):
+                    continue
+                try:
+                    directory.rmdir()
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    # Holds files we did not generate
+                    kept.add(directory.relative_to(root).as_posix())
+            report["dirs"] -= len(kept)
+            report["kept_dirs"] = len(kept)
+            _save_manifest(root, {"files": set(), "dirs": kept})
+    report["seconds"] = time.perf_counter() - start
+    return report
@@ -0,0 +1,189 @@
+"""
+Cached access to the copilot_brain/*.md guides.
+
+Each guide is parsed once, in a single forward pass over its lines, into an
+outline: title, headings, preview lines and structured steps. Outlines are
+kept in memory and validated against the file's mtime and size, so repeated
+menu interactions only cost a stat per guide. An optional JSON cache on disk
+lets a new process skip parsing as well.
+
+Steps are headings such as ``## Step 3 – Embed Best Practices``. The
+``**Short description:**`` line under a step becomes its description and the
+bullets up to the next heading of the same or a higher level become its
+directives; deeper headings (``### ... (Expanded)``) stay inside the step.
+"""
+
+import json
+import os
+import re
+from collections import namedtuple
+
+try:
+    from .artifact_writer import write_atomic
+except ImportError:
+    from artifact_writer import write_atomic
+
+CACHE_VERSION = 2
+PREVIEW_LINES = 30
+
+_HEADING = re.compile(r"^(#{1,6})\s*(.*?)\s*$")
+_STEP_TITLE = re.compile(r"^Step\s+(\d+[A-Za-z]?)\b\s*(?:[–—:-]\s*)?(.*)$")
+_DESCRIPTION = re.compile(r"^\*\*Short description:?\*\*:?\s*(.*)$", re.IGNORECASE)
+_BULLET = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(.*)$")
+
+
+class Step(namedtuple("Step", "number title line description directives", defaults=("", ()))):
+    """One ``Step N – Title`` section of a guide."""
+    __slots__ = ()
+
+    @property
+    def heading(self) -> str:
+        return f"Step {self.number} – {self.title}" if self.title else f"Step {self.number}"
+
+
+def iter_steps(lines):
+    """
+    Yield a Step for every step section in ``lines`` (any iterable of text
+    lines, e.g. an open file). Only the step being built is held in memory.
+    """
+    current = None
+    directives = []
+    level = 0
+    for n, raw in enumerate(lines, start=1):
+        line = raw.strip()
+        heading = _HEADING.match(line)
+        if heading:
+            depth = len(heading.group(1))
+            step = _STEP_TITLE.match(heading.group(2))
+            if current and (step or depth <= level):
+                yield Step(directives=tuple(directives), **current)
+                current = None
+            if step:
+                current = {"number": step.group(1), "title": step.group(2).strip(),
+                           "line": n, "description": ""}
+                directives = []
+                level = depth
+            continue
+        if current is None:
+            continue
+        desc = _DESCRIPTION.match(line)
+        if desc and not current["description"]:
+            current["description"] = desc.group(1).strip()
+            continue
+        bullet = _BULLET.match(line)
+        if bullet and bullet.group(1).strip():
+            directives.append(bullet.group(1).strip())
+    if current:
+        yield Step(directives=tuple(directives), **current)
+
+
+def parse_guide(path: str, preview_lines: int = PREVIEW_LINES) -> dict:
+    """Stream ``path`` once and return its outline."""
+    headings = []
+    preview = []
+    truncated = False
+
+    def lines(f):
+        nonlocal truncated
+        for n, raw in enumerate(f):
+            line = raw.rstrip("\n")
+            if n < preview_lines:
+                preview.append(line)
+            elif n == preview_lines:
+                truncated = True
+            heading = _HEADING.match(line.strip())
+            if heading:
+                headings.append([len(heading.group(1)), heading.group(2)])
+            yield raw
+
+    with open(path, "r", encoding="utf-8") as f:
+        steps = list(iter_steps(lines(f)))
+    return {
+        "title": headings[0][1] if headings else None,
+        "headings": headings,
+        "preview": preview,
+        "truncated": truncated,
+        "steps": steps,
+    }
+
+
+class GuideStore:
+    """mtime-validated outline cache, optionally persisted to ``cache_path``."""
+
+    def __init__(self, cache_path: str | None = None, preview_lines: int = PREVIEW_LINES):
+        self.cache_path = cache_path
+        self.preview_lines = preview_lines
+        self._entries: dict[str, dict] = {}
+        self._loaded = cache_path is None
+        self.stats = {"hits": 0, "parses": 0}
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not os.path.isfile(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION or data.get("preview_lines") != self.preview_lines:
+            return
+        for path, entry in data.get("guides", {}).items():
+            outline = entry["outline"]
+            outline["steps"] = [
+                Step(**dict(step, directives=tuple(step["directives"])))
+                for step in outline["steps"]
+            ]
+            self._entries[path] = entry
+
+    def _save(self) -> None:
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            data = {
+                "version": CACHE_VERSION,
+                "preview_lines": self.preview_lines,
+                "guides": {
+                    path: dict(entry, outline=dict(
+                        entry["outline"],
+                        steps=[step._asdict() for step in entry["outline"]["steps"]],
+                    ))
+                    for path, entry in self._entries.items()
+                },
+            }
+            # Unique temp name per save: chat sessions may save concurrently
+            write_atomic(self.cache_path, json.dumps(data).encode("utf-8"))
+        except OSError:
+            pass  # The in-memory cache still works without a writable cache dir
+
+    def get(self, path: str) -> dict | None:
+        """
+        Return the outline for ``path``, or None if the guide does not exist.
+        Raises OSError/UnicodeDecodeError if the guide exists but cannot be read.
+        """
+        if not self._loaded:
+            self._load()
+        path = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path):
+            return None
+        entry = self._entries.get(path)
+        if entry and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            self.stats["hits"] += 1
+            return entry["outline"]
+        outline = parse_guide(path, self.preview_lines)
+        self.stats["parses"] += 1
+        self._entries[path] = {"mtime": st.st_mtime_ns, "size": st.st_size, "outline": outline}
+        self._save()
+        return outline
+
+    def invalidate(self, path: str | None = None) -> None:
+        """Drop one cached outline, or all of them."""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(os.path.abspath(path), None)
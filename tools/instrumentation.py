@@ -0,0 +1,242 @@
+"""
+Spans and level-filtered logging for the wizards.
+
+    with span("phase3", project=root):
+        with span("phase3.codebase"):
+            ...
+        debug("Wrote %s", path)
+
+Spans nest through a context variable, so each thread (and each asyncio
+task) builds its own tree. They are only timed while tracing is on; otherwise
+span() hands back a shared no-op context. Log calls below the current level
+return before formatting, so pass arguments %-style rather than as f-strings.
+
+When a top-level span ends, its whole tree is appended as one JSON line to
+the trace file (if any), and every span's duration is folded into per-name
+totals for summary_table(). Defaults come from the environment:
+
+    AI_BUILDER_LOG_LEVEL   DEBUG, INFO (default), WARNING or ERROR
+    AI_BUILDER_TRACE       JSONL file to append span trees to
+"""
+
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVELS = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+_current = contextvars.ContextVar("instrumentation_span", default=None)
+
+
+def parse_level(value) -> int:
+    if isinstance(value, int):
+        return value
+    try:
+        return LEVELS[str(value).upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level {value!r}; use one of {', '.join(LEVELS)}") from None
+
+
+class Span:
+    """One timed step; ``children`` are the spans opened while it was current."""
+
+    __slots__ = ("name", "attrs", "started", "seconds", "error", "children",
+                 "_t0", "_token", "_tracer")
+
+    def __init__(self, tracer, name, attrs):
+        self._tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.children = []
+        self.error = None
+        self.seconds = 0.0
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        parent = _current.get()
+        if parent is not None:
+            parent.children.append(self)
+        self._token = _current.set(self)
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.seconds = time.perf_counter() - self._t0
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current.reset(self._token)
+        self._tracer._finish(self, root=_current.get() is None)
+        return False
+
+    def to_dict(self) -> dict:
+        data = {"name": self.name, "started": self.started, "seconds": self.seconds}
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def set(self, **attrs) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Holds the log level, the trace exporter and the per-span-name totals."""
+
+    def __init__(self, level=INFO, trace_path=None, record=False):
+        self.level = parse_level(level)
+        self.trace_path = trace_path
+        self.record = record
+        self.totals = {}  # name -> [count, total seconds, max seconds, errors]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        return cls(os.environ.get("AI_BUILDER_LOG_LEVEL", "INFO"),
+                   os.environ.get("AI_BUILDER_TRACE") or None)
+
+    @property
+    def tracing(self) -> bool:
+        return self.record or self.trace_path is not None
+
+    # ----- spans -------------------------------------------------------------
+
+    def span(self, name, **attrs):
+        if not self.tracing:
+            return NULL_SPAN
+        return Span(self, name, attrs)
+
+    def _finish(self, span, root):
+        with self._lock:
+            entry = self.totals.get(span.name)
+            if entry is None:
+                entry = self.totals[span.name] = [0, 0.0, 0.0, 0]
+            entry[0] += 1
+            entry[1] += span.seconds
+            entry[2] = max(entry[2], span.seconds)
+            entry[3] += span.error is not None
+            if root and self.trace_path:
+                try:
+                    with open(self.trace_path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(span.to_dict(), default=str) + "\n")
+                except OSError as e:
+                    print(f"[WARNING] Could not write trace to {self.trace_path}: {e}",
+                          file=sys.stderr)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.totals = {}
+
+    # ----- logging -----------------------------------------------------------
+
+    def enabled_for(self, level) -> bool:
+        return level >= self.level
+
+    def log(self, level, message, *args) -> None:
+        if level < self.level:
+            return
+        if args:
+            message = message % args
+        print(f"[{LEVEL_NAMES.get(level, level)}] {message}")
+
+    # ----- reporting ---------------------------------------------------------
+
+    def summary_rows(self) -> list:
+        """(name, count, total seconds, mean seconds, max seconds, errors), slowest total first."""
+        with self._lock:
+            rows = [(name, c, total, total / c, peak, errors)
+                    for name, (c, total, peak, errors) in self.totals.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def summary_table(self) -> str:
+        rows = self.summary_rows()
+        if not rows:
+            return "No spans recorded."
+        width = max(len("span"), max(len(row[0]) for row in rows))
+        lines = [f"{'span':<{width}}  {'count':>6}  {'total s':>9}  {'mean ms':>9}  "
+                 f"{'max ms':>9}  {'errors':>6}"]
+        for name, count, total, mean, peak, errors in rows:
+            lines.append(f"{name:<{width}}  {count:>6}  {total:>9.4f}  {mean * 1000:>9.2f}  "
+                         f"{peak * 1000:>9.2f}  {errors:>6}")
+        return "\n".join(lines)
+
+
+TRACER = Tracer.from_env()
+
+
+def configure(level=None, trace_path=None, record=None) -> Tracer:
+    """Change the shared tracer's level, trace file or in-memory recording."""
+    if level is not None:
+        TRACER.level = parse_level(level)
+    if trace_path is not None:
+        TRACER.trace_path = trace_path or None
+    if record is not None:
+        TRACER.record = record
+    return TRACER
+
+
+def span(name, **attrs):
+    return TRACER.span(name, **attrs)
+
+
+def traced(name):
+    """Decorator: run the function inside ``span(name)``."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.tracing:
+                return func(*args, **kwargs)
+            with TRACER.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def current_span():
+    return _current.get()
+
+
+def debug(message, *args) -> None:
+    if DEBUG >= TRACER.level:
+        TRACER.log(DEBUG, message, *args)
+
+
+def info(message, *args) -> None:
+    if INFO >= TRACER.level:
+        TRACER.log(INFO, message, *args)
+
+
+def warning(message, *args) -> None:
+    TRACER.log(WARNING, message, *args)
+
+
+def error(message, *args) -> None:
+    TRACER.log(ERROR, message, *args)
+
+
+def summary_table() -> str:
+    return TRACER.summary_table()
@@ -1,21 +1,48 @@
 import os
+import sys
+from collections import namedtuple
 
-def check_paths(root_dir):
+try:
+    from .reference_index import DEFAULT_MARKER, ReferenceIndex
+except ImportError:
+    from reference_index import DEFAULT_MARKER, ReferenceIndex
+
+PathIssue = namedtuple('PathIssue', 'filepath line reference error')
+
+
+def scan_paths(root_dir, marker=DEFAULT_MARKER, persist=True):
+    """
+    Yield a PathIssue for each ``marker`` reference under ``root_dir`` that
+    does not exist (resolved against ``root_dir``) and for each file that
+    cannot be read. Answered from the shared reference index, so only files
+    changed since the last run are read again; binary files are skipped.
+    Issues are yielded file by file as the index is updated, and the index
+    is saved once the scan has run to the end.
+    """
+    index_path = ReferenceIndex.default_path(root_dir) if persist else None
+    index = ReferenceIndex(root_dir, index_path, marker)
+    index.load()
+    for rel, error in index.iter_update():
+        if error is not None:
+            yield PathIssue(os.path.join(index.root_dir, rel), None, None, error)
+            continue
+        for filepath, number, reference in index.broken_paths([rel]):
+            yield PathIssue(filepath, number, reference, None)
+    index.save()
+
+
+def check_paths(root_dir, marker=DEFAULT_MARKER):
     """Scan all files in the project and check if referenced paths exist."""
-    for dirpath, _, filenames in os.walk(root_dir):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                    for line in content.splitlines():
-                        if 'path/to/' in line:  # Adjust this to match your path patterns
-                            referenced_path = line.split('path/to/')[1].strip()
-                            if not os.path.exists(referenced_path):
-                                print(f"Broken path in {filepath}: {referenced_path}")
-            except Exception as e:
-                print(f"Error reading {filepath}: {e}")
+    issues = 0
+    for issue in scan_paths(root_dir, marker):
+        issues += 1
+        if issue.error:
+            print(f"Error reading {issue.filepath}: {issue.error}")
+        else:
+            print(f"Broken path in {issue.filepath}:{issue.line}: {issue.reference}")
+    return issues
+
 
 if __name__ == "__main__":
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    check_paths(project_root)
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.exit(1 if check_paths(sys.argv[1] if len(sys.argv) > 1 else project_root) else 0)
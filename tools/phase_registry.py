@@ -0,0 +1,101 @@
+"""
+Phase registry for the AI Apps Builder CLI.
+
+Phases are keyed by their index, so lookups are O(1) and each index can only
+be registered once. A phase's progress signal is described declaratively:
+
+    {"direct_files": true}                 any visible file directly in the folder
+    {"any_files": ["codebase", "tests"]}   any visible file below a subfolder
+    {"files": ["test_results.md"]}         a specific file exists
+
+A phase has progress when any of its signals is met. Signals are evaluated
+against a WorkspaceIndex, so every check shares one scan of the workspace.
+The default phase set lives in phases.json next to this module.
+"""
+
+import json
+import os
+
+
+def progress_check_from_spec(spec: dict):
+    """Build a ``check(index, folder) -> bool`` callable from a progress spec."""
+    unknown = set(spec) - {"direct_files", "any_files", "files"}
+    if unknown:
+        raise ValueError(f"Unknown progress signal(s): {', '.join(sorted(unknown))}")
+    direct = bool(spec.get("direct_files"))
+    subdirs = tuple(spec.get("any_files", ()))
+    files = tuple(spec.get("files", ()))
+
+    def check(index, folder: str) -> bool:
+        if direct and index.has_direct_files(folder):
+            return True
+        if any(index.any_files(os.path.join(folder, d)) for d in subdirs):
+            return True
+        return any(index.is_file(os.path.join(folder, name)) for name in files)
+
+    return check
+
+
+class PhaseRegistry:
+    """Ordered collection of phase definitions keyed by phase index."""
+
+    def __init__(self):
+        self._phases: dict[int, dict] = {}
+
+    def register(self, index: int, title: str, folder: str, guide: str, progress) -> dict:
+        """
+        Register a phase. ``progress`` is a progress spec dict or a
+        ``check(index, folder)`` callable. Raises ValueError on a duplicate index.
+        """
+        if index in self._phases:
+            raise ValueError(f"Phase {index} is already registered "
+                             f"({self._phases[index]['title']})")
+        check = progress if callable(progress) else progress_check_from_spec(progress)
+        phase = {
+            "index": index,
+            "title": title,
+            "folder": folder,
+            "guide": guide,
+            "progress_check": check,
+        }
+        self._phases[index] = phase
+        self._phases = dict(sorted(self._phases.items()))
+        return phase
+
+    def get(self, index: int) -> dict:
+        try:
+            return self._phases[index]
+        except KeyError:
+            raise KeyError(f"No phase registered with index {index}") from None
+
+    def indices(self) -> list[int]:
+        return list(self._phases)
+
+    def __contains__(self, index) -> bool:
+        return index in self._phases
+
+    def __iter__(self):
+        return iter(self._phases.values())
+
+    def __len__(self) -> int:
+        return len(self._phases)
+
+    @classmethod
+    def from_config(cls, path: str, root: str, brain: str) -> "PhaseRegistry":
+        """
+        Load phases from a JSON file holding a list of
+        ``{"index", "title", "folder", "guide", "progress"}`` objects.
+        Folders resolve against ``root`` and guides against ``brain``.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        registry = cls()
+        for entry in entries:
+            registry.register(
+                index=int(entry["index"]),
+                title=entry["title"],
+                folder=os.path.join(root, entry["folder"]),
+                guide=os.path.join(brain, entry["guide"]),
+                progress=entry.get("progress", {}),
+            )
+        return registry
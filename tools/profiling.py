@@ -0,0 +1,323 @@
+"""
+Profiling mode for the CLI entry points (``--profile DIR``).
+
+A Profiler owns one cProfile.Profile per named section (a phase, a wizard or
+a workflow stage); entering the section again keeps adding to the same
+profile. While the profiler runs it also:
+
+- traces allocations with tracemalloc and diffs a snapshot around every
+  section call, so each section gets a top-allocations report plus its peak
+  memory growth;
+- samples the stack of the thread inside a section every ``interval``
+  seconds into collapsed stacks ("section;outer;inner count" per line), the
+  input format of flamegraph.pl, speedscope and inferno.
+
+Sections do not nest: cProfile allows one active profiler, so a section
+entered while another is running (on any thread) is a no-op and its time
+shows up in the outer one. Only the thread that entered a section is
+profiled, and a shared profiler inherited by a forked worker process is
+ignored there (project_pool starts one per project instead). cProfile and
+tracemalloc are only imported once a Profiler is created, so importing this
+module for its decorators costs next to nothing.
+stop() writes, into ``output_dir``:
+
+    <section>.pstats       load with pstats.Stats or snakeviz
+    <section>.alloc.txt    top allocations by net size
+    stacks.collapsed       sampled stacks for every section
+
+    profiler = profiling.start("profile_out")
+    with profiling.section("phase2"):
+        ...
+    profiling.stop()
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+DEFAULT_TOP = 25
+DEFAULT_INTERVAL = 0.002
+
+
+def _label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _stack_depth(frame) -> int:
+    depth = 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+class _SectionStats:
+    __slots__ = ("name", "profile", "calls", "seconds", "peak", "net", "allocations")
+
+    def __init__(self, name):
+        import cProfile
+
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.calls = 0
+        self.seconds = 0.0
+        self.peak = 0
+        self.net = 0
+        self.allocations = {}  # "file:line" -> [size diff, count diff]
+
+
+class _Section:
+    """Context manager for one call of a section."""
+
+    __slots__ = ("_profiler", "_name", "_stats", "_t0", "_before", "_base")
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+        self._stats = None
+
+    def __enter__(self):
+        import tracemalloc
+
+        profiler = self._profiler
+        if profiler._active is not None:
+            return self  # Nested: the outer section keeps collecting
+        before = tracemalloc.take_snapshot() if profiler.memory else None
+        self._stats = profiler._enter(self._name, sys._getframe(1))
+        if self._stats is None:
+            return self
+        self._before = before
+        if profiler.memory:
+            tracemalloc.reset_peak()
+            self._base = tracemalloc.get_traced_memory()[0]
+        self._t0 = time.perf_counter()
+        self._stats.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        import tracemalloc
+
+        stats = self._stats
+        if stats is None:
+            return False
+        stats.profile.disable()
+        stats.seconds += time.perf_counter() - self._t0
+        stats.calls += 1
+        profiler = self._profiler
+        if profiler.memory:
+            stats.peak = max(stats.peak, tracemalloc.get_traced_memory()[1] - self._base)
+        profiler._leave()
+        if profiler.memory:
+            profiler._add_allocations(stats, self._before, tracemalloc.take_snapshot())
+            self._before = None
+        return False
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SECTION = _NullSection()
+
+
+class Profiler:
+    def __init__(self, output_dir, top=DEFAULT_TOP, interval=DEFAULT_INTERVAL, memory=True):
+        import tracemalloc
+
+        self.output_dir = os.path.abspath(output_dir)
+        self.top = top
+        self.interval = interval
+        self.memory = memory
+        self.sections = {}
+        self.stacks = Counter()
+        self._active = None  # (name, thread id, depth of the entering frame)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+        self._started_tracemalloc = False
+        self.pid = os.getpid()
+        self._ignored_files = (os.path.abspath(__file__), tracemalloc.__file__)
+
+    # ----- lifecycle ---------------------------------------------------------
+
+    def start(self):
+        import tracemalloc
+
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.interval:
+            self._sampler = threading.Thread(target=self._sample, name="profiling-sampler",
+                                             daemon=True)
+            self._sampler.start()
+        return self
+
+    def stop(self) -> list:
+        """Stop sampling and tracing, write every report and return the written paths."""
+        import tracemalloc
+
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        return self.write()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # ----- sections ----------------------------------------------------------
+
+    def section(self, name):
+        return _Section(self, name)
+
+    def _enter(self, name, frame):
+        with self._lock:
+            if self._active is not None:
+                return None
+            stats = self.sections.get(name)
+            if stats is None:
+                stats = self.sections[name] = _SectionStats(name)
+            self._active = (name, threading.get_ident(), _stack_depth(frame))
+            return stats
+
+    def _leave(self):
+        with self._lock:
+            self._active = None
+
+    def _add_allocations(self, stats, before, after):
+        for diff in after.compare_to(before, "lineno"):
+            frame = diff.traceback[0]
+            if not (diff.size_diff or diff.count_diff) or frame.filename in self._ignored_files:
+                continue
+            entry = stats.allocations.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+            entry[0] += diff.size_diff
+            entry[1] += diff.count_diff
+            stats.net += diff.size_diff
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            active = self._active
+            if active is None:
+                continue
+            name, thread_id, depth = active
+            frame = sys._current_frames().get(thread_id)
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes.reverse()
+            labels = [_label(code) for code in codes[depth - 1:]
+                      if code.co_filename not in self._ignored_files]
+            self.stacks[";".join([name] + labels)] += 1
+
+    # ----- reports -----------------------------------------------------------
+
+    def write(self) -> list:
+        os.makedirs(self.output_dir, exist_ok=True)
+        written = []
+        for name, stats in self.sections.items():
+            pstats_path = os.path.join(self.output_dir, f"{name}.pstats")
+            stats.profile.dump_stats(pstats_path)
+            written.append(pstats_path)
+            if self.memory:
+                alloc_path = os.path.join(self.output_dir, f"{name}.alloc.txt")
+                with open(alloc_path, "w", encoding="utf-8") as f:
+                    f.write(self.allocation_report(name))
+                written.append(alloc_path)
+        if self.interval:
+            stacks_path = os.path.join(self.output_dir, "stacks.collapsed")
+            with open(stacks_path, "w", encoding="utf-8") as f:
+                for stack, count in sorted(self.stacks.items()):
+                    f.write(f"{stack} {count}\n")
+            written.append(stacks_path)
+        return written
+
+    def allocation_report(self, name) -> str:
+        stats = self.sections[name]
+        lines = [
+            f"Section: {name} ({stats.calls} calls, {stats.seconds:.4f}s)",
+            f"Peak above section start: {stats.peak / 1024:.1f} KiB; "
+            f"net change: {stats.net / 1024:+.1f} KiB",
+            f"Top {self.top} allocation sites by net size:",
+        ]
+        by_size = sorted(stats.allocations.items(), key=lambda item: abs(item[1][0]), reverse=True)
+        top = by_size[:self.top]
+        for site, (size, count) in top:
+            lines.append(f"  {size / 1024:+10.1f} KiB  {count:+8d} blocks  {site}")
+        return "\n".join(lines) + "\n"
+
+    def summary_table(self) -> str:
+        if not self.sections:
+            return "No sections profiled."
+        width = max(len("section"), max(len(name) for name in self.sections))
+        lines = [f"{'section':<{width}}  {'calls':>6}  {'seconds':>9}  "
+                 f"{'peak KiB':>9}  {'net KiB':>9}"]
+        for stats in sorted(self.sections.values(), key=lambda s: s.seconds, reverse=True):
+            lines.append(f"{stats.name:<{width}}  {stats.calls:>6}  {stats.seconds:>9.4f}  "
+                         f"{stats.peak / 1024:>9.1f}  {stats.net / 1024:>+9.1f}")
+        return "\n".join(lines)
+
+
+_PROFILER = None
+
+
+def _shared():
+    """The shared profiler, unless this process only inherited it through fork()."""
+    profiler = _PROFILER
+    return profiler if profiler is not None and profiler.pid == os.getpid() else None
+
+
+def start(output_dir, **options) -> Profiler:
+    """Start the shared profiler that section() and profiled() report to."""
+    global _PROFILER
+    if _shared() is not None:
+        raise RuntimeError("A profiler is already running")
+    _PROFILER = Profiler(output_dir, **options).start()
+    return _PROFILER
+
+
+def running() -> bool:
+    """True while this process's shared profiler is running."""
+    return _shared() is not None
+
+
+def stop():
+    """Stop the shared profiler; returns (profiler, written paths) or None if none was running."""
+    global _PROFILER
+    profiler, _PROFILER = _shared(), None
+    if profiler is None:
+        return None
+    return profiler, profiler.stop()
+
+
+def section(name):
+    profiler = _shared()
+    return NULL_SECTION if profiler is None else profiler.section(name)
+
+
+def profiled(name):
+    """Decorator: run the function as a section of the shared profiler (if one is running)."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _shared()
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.section(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,252 @@
+"""
+File scoring engine behind update_progress.evaluate_file_progress.
+
+A scorer is a plugin registered with ``@register_scorer(name, weight,
+suffixes)``. It receives a parsed Document for files with one of its suffixes
+and returns a completeness ratio in [0, 1], or None to abstain. A file's score is the weighted mean
+of the applicable ratios, snapped down to a PROGRESS_CRITERIA level (100, 75,
+50, 25); a missing file scores 0 and a file no scorer applies to scores 100.
+
+Built-in scorers for Markdown deliverables:
+
+    headings      required headings present (a deliverable's template headings,
+                  otherwise a title plus at least one section)
+    placeholders  share of content lines that are not placeholder text
+                  (TBD, TODO, "to be decided", "...", or an unrendered
+                  ``{field}`` of the deliverable templates)
+    sections      share of sections with real content under them
+
+Scores depend only on file content, the registered scorers and the deliverable
+templates, all of which go into fingerprint(), so callers can cache scores
+keyed by it. score_files() spreads large batches over a process pool; plugins
+must be registered at import time of a module so worker processes see them.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# Same override as cli_interface.TEMPLATES_DIR
+TEMPLATES_DIR = os.environ.get("AI_BUILDER_TEMPLATES",
+                               os.path.join(ROOT, "templates_examples", "deliverables"))
+
+SCORING_VERSION = 2  # Bump when a built-in scorer changes behaviour
+LEVELS = ((0.95, 100), (0.7, 75), (0.4, 50))  # Ratio thresholds; anything lower is 25
+PARALLEL_THRESHOLD = 64  # Smaller batches are scored in-process
+MARKDOWN_SUFFIXES = (".md", ".markdown")
+
+PLACEHOLDER = re.compile(r"to be decided|\bTBD\b|\bTODO\b|lorem ipsum|^[-*]?\s*\.\.\.$",
+                         re.IGNORECASE)
+HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+
+@dataclass(frozen=True)
+class Document:
+    """A file's name and lines, with Markdown headings pre-split into sections."""
+
+    name: str
+    lines: tuple
+    headings: tuple   # (level, text) in file order
+    sections: tuple   # (heading text, body lines) for each level-2+ heading
+
+
+@dataclass(frozen=True)
+class Scorer:
+    name: str
+    weight: float
+    suffixes: tuple
+    func: object
+
+    def applies_to(self, name: str) -> bool:
+        return name.lower().endswith(self.suffixes)
+
+
+SCORERS: dict = {}
+
+
+def register_scorer(name: str, weight: float = 1.0, suffixes=MARKDOWN_SUFFIXES):
+    """Decorator registering ``func(document) -> float | None`` under ``name``."""
+    if weight <= 0:
+        raise ValueError(f"Scorer {name!r} needs a positive weight")
+
+    def decorator(func):
+        if name in SCORERS:
+            raise ValueError(f"Scorer {name!r} is already registered")
+        SCORERS[name] = Scorer(name, weight, tuple(suffixes), func)
+        return func
+
+    return decorator
+
+
+def parse_document(name: str, text: str) -> Document:
+    lines = tuple(text.splitlines())
+    headings = []
+    sections = []
+    body = None
+    in_fence = False
+    for line in lines:
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING.match(line)
+        if match:
+            level, title = len(match.group(1)), match.group(2)
+            headings.append((level, title))
+            if level >= 2:
+                body = []
+                sections.append((title, body))
+            continue
+        if body is not None:
+            body.append(line)
+    return Document(name, lines, tuple(headings),
+                    tuple((title, tuple(body)) for title, body in sections))
+
+
+def _normalize(heading: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", heading.lower()).strip()
+
+
+@lru_cache(maxsize=1)
+def required_headings() -> dict:
+    """Map each deliverable file name to the normalized headings of its template."""
+    required = {}
+    if not os.path.isdir(TEMPLATES_DIR):
+        return required
+    for dirpath, _, filenames in os.walk(TEMPLATES_DIR):
+        for filename in sorted(filenames):
+            if not filename.endswith(".md.tmpl"):
+                continue
+            with open(os.path.join(dirpath, filename), "r", encoding="utf-8") as f:
+                headings = [_normalize(m.group(2)) for m in map(HEADING.match, f) if m]
+            required.setdefault(filename[:-len(".tmpl")], tuple(headings))
+    return required
+
+
+@lru_cache(maxsize=1)
+def template_fields() -> frozenset:
+    """Every ``{field}`` name the deliverable templates use (see template_engine)."""
+    fields = set()
+    for dirpath, _, filenames in os.walk(TEMPLATES_DIR):
+        for filename in filenames:
+            if not filename.endswith(".tmpl"):
+                continue
+            with open(os.path.join(dirpath, filename), "r", encoding="utf-8") as f:
+                text = f.read()
+            try:
+                fields.update(field for _, field, _, _ in Formatter().parse(text) if field)
+            except ValueError:
+                continue  # Not a valid template; the engine rejects it too
+    return frozenset(fields)
+
+
+@lru_cache(maxsize=1)
+def _unrendered_field():
+    fields = template_fields()
+    if not fields:
+        return None
+    names = "|".join(map(re.escape, sorted(fields)))
+    return re.compile(r"(?<!\{)\{(?:" + names + r")\}(?!\})")
+
+
+def is_placeholder(line: str) -> bool:
+    """True for placeholder text or a template field left unrendered."""
+    if PLACEHOLDER.search(line):
+        return True
+    field = _unrendered_field()
+    return field is not None and field.search(line) is not None
+
+
+def _content_lines(lines):
+    return [line for line in lines if line.strip() and not HEADING.match(line)]
+
+
+@register_scorer("headings", weight=1.0)
+def score_headings(doc: Document):
+    present = {_normalize(text) for _, text in doc.headings}
+    expected = required_headings().get(os.path.basename(doc.name))
+    if expected:
+        return sum(h in present for h in expected) / len(expected)
+    has_title = any(level == 1 for level, _ in doc.headings)
+    return (has_title + bool(doc.sections)) / 2
+
+
+@register_scorer("placeholders", weight=1.0)
+def score_placeholders(doc: Document):
+    content = _content_lines(doc.lines)
+    if not content:
+        return 0.0
+    return 1 - sum(is_placeholder(line) for line in content) / len(content)
+
+
+@register_scorer("sections", weight=1.0)
+def score_sections(doc: Document):
+    # No sections: the whole file is one
+    sections = [body for _, body in doc.sections] or [doc.lines]
+    complete = sum(
+        any(not is_placeholder(line) for line in _content_lines(body))
+        for body in sections
+    )
+    return complete / len(sections)
+
+
+def level_for(ratio: float) -> int:
+    for threshold, level in LEVELS:
+        if ratio >= threshold:
+            return level
+    return 25
+
+
+def score_document(doc: Document) -> int:
+    total = weights = 0.0
+    for scorer in SCORERS.values():
+        if not scorer.applies_to(doc.name):
+            continue
+        ratio = scorer.func(doc)
+        if ratio is not None:
+            total += scorer.weight * min(max(ratio, 0.0), 1.0)
+            weights += scorer.weight
+    return level_for(total / weights) if weights else 100
+
+
+def score_file(path) -> int:
+    """Score one file against PROGRESS_CRITERIA; 0 if it does not exist."""
+    path = str(path)
+    if not os.path.isfile(path):
+        return 0
+    if not any(scorer.applies_to(path) for scorer in SCORERS.values()):
+        return 100  # Nothing to judge it by; skip the read
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            text = f.read()
+    except OSError:
+        return 0
+    return score_document(parse_document(path, text))
+
+
+def score_files(paths, workers=None, score=score_file) -> list:
+    """Score ``paths`` in order, over a process pool for large batches."""
+    paths = list(paths)
+    if workers == 1 or len(paths) < PARALLEL_THRESHOLD:
+        return [score(path) for path in paths]
+    chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(score, paths, chunksize=chunksize))
+
+
+def fingerprint() -> str:
+    """Digest of everything a score depends on besides the file itself."""
+    data = {
+        "version": SCORING_VERSION,
+        "levels": LEVELS,
+        "scorers": [(s.name, s.weight, s.suffixes, getattr(s.func, "__module__", ""),
+                     getattr(s.func, "__qualname__", ""))
+                    for s in SCORERS.values()],
+        "required": required_headings(),
+        "fields": sorted(template_fields()),
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,116 @@
+"""
+Generate many projects at once across a process pool.
+
+Each job is a project root plus its Phase 1 answers. Workers run the same
+headless pipeline as `cli_interface.py batch` (Phases 1–5), entirely against
+their own project root, so nothing depends on the module-level ROOT. A
+worker's console output goes to <project_root>/.builder_cache/generate.log
+instead of interleaving on the terminal. With a ``profile_dir`` every project
+is profiled in its own worker and writes its reports to a subfolder named
+after the job (see profiling.py).
+
+Usage:
+    python tools/project_pool.py answers.json [--workers N] [--profile DIR]
+"""
+
+import argparse
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+try:
+    from . import cli_interface, profiling
+except ImportError:
+    import cli_interface
+    import profiling
+
+
+def _generate_one(job):
+    project_root, answers, profile_dir = job
+    root = os.path.abspath(project_root)
+    log_path = os.path.join(root, ".builder_cache", "generate.log")
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    # In-process runs report to the caller's profiler if one is already running
+    profile = profile_dir is not None and not profiling.running()
+    if profile:
+        profiling.start(profile_dir)
+    try:
+        with open(log_path, "w", encoding="utf-8") as log, redirect_stdout(log):
+            # Projects already run one per process; a test pool in each would nest pools
+            return cli_interface.run_headless(answers, root, test_workers=1)
+    except Exception as e:
+        return {
+            "project_root": root,
+            "app_name": answers.get("app_name"),
+            "error": f"{type(e).__name__}: {e}",
+            "traceback": traceback.format_exc(),
+        }
+    finally:
+        if profile:
+            profiling.stop()
+
+
+def generate_projects(jobs, workers: int | None = None, profile_dir=None) -> list[dict]:
+    """
+    Run Phases 1–5 for every ``(project_root, answers)`` job. Results come
+    back in job order; a failed project yields a dict with an ``error`` key
+    instead of stopping the others. ``workers=1`` runs in-process. With
+    ``profile_dir``, job N writes its profile to ``<profile_dir>/<N>_<folder>``.
+    """
+    jobs = [(str(root), dict(answers)) for root, answers in jobs]
+    roots = [os.path.abspath(root) for root, _ in jobs]
+    if len(set(roots)) != len(roots):
+        raise ValueError("Each job needs its own project root")
+    if profile_dir is None:
+        profile_dirs = [None] * len(jobs)
+    else:
+        base = os.path.abspath(profile_dir)
+        profile_dirs = [os.path.join(base, f"{n:03d}_{os.path.basename(root)}")
+                        for n, root in enumerate(roots)]
+    jobs = [(root, answers, d) for (root, answers), d in zip(jobs, profile_dirs)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        return [_generate_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(_generate_one, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+
+def generate_from_answers(answers_path, workers: int | None = None, profile_dir=None) -> list[dict]:
+    """
+    Load answer sets (each naming its ``project_root``) and generate them in
+    parallel, profiling each project into ``profile_dir`` if given.
+    """
+    entries = cli_interface.load_answers(answers_path)
+    missing = [i for i, entry in enumerate(entries) if not entry.get("project_root")]
+    if missing:
+        raise ValueError(f"Answer sets {missing} have no project_root")
+    started = time.perf_counter()
+    results = generate_projects([(e["project_root"], e) for e in entries], workers, profile_dir)
+    elapsed = time.perf_counter() - started
+    failed = [r for r in results if "error" in r]
+    rate = len(results) / elapsed * 60 if elapsed else 0.0
+    print(f"Generated {len(results) - len(failed)} of {len(results)} project(s) in {elapsed:.2f}s "
+          f"({rate:.1f} projects/min, {workers or os.cpu_count()} workers)")
+    for r in failed:
+        print(f"- FAILED {r['project_root']}: {r['error']}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate many projects in parallel.")
+    parser.add_argument("answers",
+                        help="JSON or YAML list of answer sets, each with a project_root")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile each project into a subfolder of DIR")
+    args = parser.parse_args(argv)
+    results = generate_from_answers(args.answers, args.workers, args.profile)
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,28 +1,28 @@
 import os
-import markdown
+import sys
 
-def validate_paths(root_dir):
-    """Check if all referenced paths in the project exist."""
-    for dirpath, _, filenames in os.walk(root_dir):
-        for filename in filenames:
-            if filename == '.DS_Store':
-                continue  # Skip macOS system files
+try:
+    from .reference_index import build_index
+except ImportError:
+    from reference_index import build_index
+
+
+def validate_paths(root_dir, workers=None, persist=True):
+    """
+    Check that every local link in the project's Markdown files exists.
+    Links come from the shared reference index; only Markdown files changed
+    since the last run are read again, on ``workers`` threads.
+    """
+    index = build_index(root_dir, persist=persist, workers=workers)
+    for filepath, error in index.errors:
+        print(f"Error reading {filepath}: {error}")
+    broken = index.broken_links()
+    for filepath, number, link in broken:
+        print(f"Broken link in {filepath}:{number}: {link}")
+    return broken
 
-            filepath = os.path.join(dirpath, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if filename.endswith('.md'):
-                        # Check for links in Markdown files
-                        md = markdown.Markdown()
-                        for line in content.splitlines():
-                            if '(' in line and ')' in line:
-                                link = line.split('(')[-1].split(')')[0]
-                                if not os.path.exists(link):
-                                    print(f"Broken link in {filepath}: {link}")
-            except (UnicodeDecodeError, IOError) as e:
-                print(f"Error reading {filepath}: {e}")
 
 if __name__ == "__main__":
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    validate_paths(project_root)
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    roots = sys.argv[1:] or [project_root]
+    sys.exit(1 if any([validate_paths(root) for root in roots]) else 0)
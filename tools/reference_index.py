@@ -0,0 +1,338 @@
+"""
+Shared reference index for path_checker and project_validator.
+
+One walk of the project records every file and directory path, and for
+each text file its outbound references: Markdown links (``[text](target)``)
+and marker references (``path/to/<ref>``). References are stored by content
+hash, so they cannot depend on the file name: links are recorded for every
+text file and only reported for .md files. Files are tracked by (mtime, size,
+hash), so an update only re-reads files whose stat changed and only re-scans
+files whose hash changed. Both tools then answer their checks as queries against the
+index instead of walking and reading the tree themselves.
+
+Files are read as bytes in CHUNK_SIZE pieces. Binary files (a NUL byte in the
+first chunk) are neither scanned nor read further: their hash covers only that
+first chunk, which is enough since binary content never has references.
+The index is saved with artifact_writer.write_atomic, so concurrent runs of
+both tools never share a temp file.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import unquote
+
+try:
+    from .artifact_writer import write_atomic
+except ImportError:
+    from artifact_writer import write_atomic
+
+INDEX_VERSION = 2
+
+# Directories that never hold project documents (update_progress skips them too)
+IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', '.builder_cache', '.pytest_cache', '.mypy_cache',
+    '.venv', 'venv', 'node_modules',
+})
+
+CHUNK_SIZE = 64 * 1024
+MAX_LINE = 1024 * 1024  # Longer lines are only scanned up to this many bytes
+DEFAULT_MARKER = 'path/to/'
+
+LINK_PATTERN = re.compile(r'!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+INLINE_CODE = re.compile(r'`[^`]*`')
+EXTERNAL = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//|#)')
+_REFERENCE_END = re.compile(rb'[\s\'"`)\]>,;]')
+
+
+# ----- streaming scanners ---------------------------------------------------
+
+def is_binary(block):
+    """Treat a file as binary if its first block contains a NUL byte."""
+    return b'\0' in block
+
+
+def iter_lines(f, first_block=b''):
+    """
+    Yield (line number, bytes) from a binary file read in CHUNK_SIZE pieces,
+    starting with ``first_block`` if it was already read. Lines longer than
+    MAX_LINE are yielded truncated and the rest of them is skipped.
+    """
+    carry = b''
+    number = 0
+    skipping = False
+    chunk = first_block or f.read(CHUNK_SIZE)
+    while chunk:
+        if skipping:
+            newline = chunk.find(b'\n')
+            if newline == -1:
+                chunk = f.read(CHUNK_SIZE)
+                continue
+            chunk = chunk[newline + 1:]
+            skipping = False
+        lines = (carry + chunk).split(b'\n')
+        carry = lines.pop()
+        for line in lines:
+            number += 1
+            yield number, line
+        if len(carry) > MAX_LINE:
+            number += 1
+            yield number, carry[:MAX_LINE]
+            carry = b''
+            skipping = True
+        chunk = f.read(CHUNK_SIZE)
+    if carry:
+        yield number + 1, carry
+
+
+def iter_references(lines, marker):
+    """Yield (line number, reference) for every ``marker`` (bytes) occurrence."""
+    for number, line in lines:
+        start = line.find(marker)
+        while start != -1:
+            rest = line[start + len(marker):]
+            end = _REFERENCE_END.search(rest)
+            reference = rest[:end.start()] if end else rest
+            if reference:
+                yield number, reference.decode('utf-8', errors='replace')
+            start = line.find(marker, start + len(marker))
+
+
+def iter_links(lines):
+    """Yield (line number, target) for every local Markdown link outside code."""
+    in_fence = False
+    for number, line in enumerate(lines, start=1):
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence
+            continue
+        if in_fence or '](' not in line:
+            continue
+        for match in LINK_PATTERN.finditer(INLINE_CODE.sub('``', line)):
+            target = match.group(1)
+            if not EXTERNAL.match(target):
+                yield number, target
+
+
+class _HashingReader:
+    def __init__(self, f, digest):
+        self._f = f
+        self._digest = digest
+
+    def read(self, size):
+        data = self._f.read(size)
+        self._digest.update(data)
+        return data
+
+
+def scan_file(path, marker=DEFAULT_MARKER):
+    """
+    Read ``path`` once. Returns (sha256, refs) where refs is
+    ``{"links": [[line, target], ...], "paths": [[line, ref], ...]}``, or
+    None for a binary file, whose sha256 covers only its first chunk.
+    """
+    digest = hashlib.sha256()
+    marker_bytes = marker.encode('utf-8')
+    with open(path, 'rb') as f:
+        reader = _HashingReader(f, digest)
+        first = reader.read(CHUNK_SIZE)
+        if is_binary(first):
+            return digest.hexdigest(), None
+
+        paths = []
+
+        def decoded():
+            for number, line in iter_lines(reader, first):
+                if marker_bytes in line:
+                    found = iter_references([(number, line)], marker_bytes)
+                    paths.extend([n, ref] for n, ref in found)
+                yield line.decode('utf-8', errors='replace')
+
+        links = [[n, target] for n, target in iter_links(decoded())]
+    return digest.hexdigest(), {"links": links, "paths": paths}
+
+
+# ----- index ----------------------------------------------------------------
+
+class ReferenceIndex:
+    """Incrementally maintained per-file reference index rooted at ``root_dir``."""
+
+    def __init__(self, root_dir, index_path=None, marker=DEFAULT_MARKER):
+        self.root_dir = os.path.abspath(root_dir)
+        self.index_path = index_path
+        self.marker = marker
+        self.files = {}   # relpath -> {"mtime", "size", "hash"}
+        self.refs = {}    # hash -> refs, or None for binary content
+        self.known = set()
+        self.errors = []  # (filepath, message) for files that could not be read
+        self.stats = {"stat_hits": 0, "hash_hits": 0, "scanned": 0}
+        self._outside = {}
+
+    @classmethod
+    def default_path(cls, root_dir):
+        return os.path.join(os.path.abspath(root_dir), '.builder_cache', 'reference_index.json')
+
+    def load(self):
+        if not self.index_path or not os.path.isfile(self.index_path):
+            return False
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        header = (data.get('version'), data.get('root'), data.get('marker'))
+        if header != (INDEX_VERSION, self.root_dir, self.marker):
+            return False
+        self.files = data.get('files', {})
+        self.refs = data.get('refs', {})
+        return True
+
+    def save(self):
+        if not self.index_path:
+            return
+        live = {entry['hash'] for entry in self.files.values()}
+        self.refs = {h: r for h, r in self.refs.items() if h in live}
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            data = {'version': INDEX_VERSION, 'root': self.root_dir, 'marker': self.marker,
+                    'files': self.files, 'refs': self.refs}
+            write_atomic(self.index_path, json.dumps(data).encode('utf-8'))
+        except OSError:
+            pass  # The in-memory index still answers queries
+
+    def update(self, workers=None):
+        """
+        Walk the tree once and refresh entries for new or changed files.
+        Changed files are read on a thread pool of ``workers`` threads.
+        """
+        for _ in self.iter_update(workers):
+            pass
+        return self
+
+    def iter_update(self, workers=None):
+        """
+        update(), yielding (rel, error) for each file as soon as it is indexed
+        (``error`` is None unless the file could not be read). The walk finishes
+        before the first yield, so exists() and the per-file queries are
+        already accurate for every file yielded.
+        """
+        self.stats = {"stat_hits": 0, "hash_hits": 0, "scanned": 0}
+        self.errors = []
+        self._outside = {}
+        known = {self.root_dir}
+        cached_files, files = self.files, {}
+        changed = []
+        failed = []
+        for dirpath, dirnames, filenames in os.walk(self.root_dir):
+            dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+            for name in dirnames:
+                known.add(os.path.join(dirpath, name))
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                known.add(path)
+                rel = os.path.relpath(path, self.root_dir)
+                try:
+                    st = os.stat(path)
+                except OSError as e:
+                    failed.append((rel, str(e)))
+                    continue
+                cached = cached_files.get(rel)
+                if cached and cached['mtime'] == st.st_mtime_ns and cached['size'] == st.st_size:
+                    files[rel] = cached
+                    self.stats['stat_hits'] += 1
+                else:
+                    changed.append((rel, path, st))
+        self.files = files
+        self.known = known
+
+        for rel, error in failed:
+            self.errors.append((os.path.join(self.root_dir, rel), error))
+            yield rel, error
+        for rel in list(files):
+            yield rel, None
+
+        def scan(item):
+            try:
+                return item, scan_file(item[1], self.marker), None
+            except OSError as e:
+                return item, None, str(e)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(scan, item) for item in changed]
+            for future in as_completed(futures):
+                (rel, path, st), result, error = future.result()
+                if error is not None:
+                    self.errors.append((path, error))
+                    yield rel, error
+                    continue
+                digest, refs = result
+                if digest in self.refs:
+                    self.stats['hash_hits'] += 1
+                else:
+                    self.refs[digest] = refs
+                    self.stats['scanned'] += 1
+                files[rel] = {'mtime': st.st_mtime_ns, 'size': st.st_size, 'hash': digest}
+                yield rel, None
+
+    # ----- queries ------------------------------------------------------
+
+    def exists(self, path):
+        if path == self.root_dir or path.startswith(self.root_dir + os.sep):
+            return path in self.known
+        if path not in self._outside:
+            self._outside[path] = os.path.exists(path)
+        return self._outside[path]
+
+    def references(self, kind, rels=None):
+        """
+        Yield (filepath, line, target) for each recorded ``links`` or ``paths``
+        reference, in every file or only in ``rels``; links only count in .md
+        files.
+        """
+        for rel in self.files if rels is None else rels:
+            entry = self.files.get(rel)
+            if entry is None or (kind == 'links' and not rel.endswith('.md')):
+                continue
+            refs = self.refs.get(entry['hash'])
+            if refs:
+                for line, target in refs[kind]:
+                    yield os.path.join(self.root_dir, rel), line, target
+
+    def resolve_link(self, filepath, target):
+        target = unquote(target.split('#', 1)[0].split('?', 1)[0])
+        if not target:
+            return None  # Pure anchor or query
+        if target.startswith('/'):
+            return os.path.normpath(os.path.join(self.root_dir, target.lstrip('/')))
+        return os.path.normpath(os.path.join(os.path.dirname(filepath), target))
+
+    def broken_links(self):
+        """(filepath, line, link) for Markdown links whose target does not exist."""
+        broken = []
+        for filepath, line, target in self.references('links'):
+            resolved = self.resolve_link(filepath, target)
+            if resolved is not None and not self.exists(resolved):
+                broken.append((filepath, line, target))
+        return sorted(broken)
+
+    def broken_paths(self, rels=None):
+        """
+        (filepath, line, reference) for marker references missing under the
+        root, in every file or only in ``rels``.
+        """
+        broken = []
+        for filepath, line, reference in self.references('paths', rels):
+            if not self.exists(os.path.normpath(os.path.join(self.root_dir, reference))):
+                broken.append((filepath, line, reference))
+        return sorted(broken)
+
+
+def build_index(root_dir, persist=True, marker=DEFAULT_MARKER, workers=None):
+    """Load the persisted index for ``root_dir`` (if any), update it and save it."""
+    index_path = ReferenceIndex.default_path(root_dir) if persist else None
+    index = ReferenceIndex(root_dir, index_path, marker)
+    index.load()
+    index.update(workers)
+    index.save()
+    return index
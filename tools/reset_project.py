@@ -1,30 +1,51 @@
+import argparse
 import os
-import shutil
+import sys
 
-# Updated list of paths to generated files and folders
-generated_paths = [
-    "phases/phase1_concept_strategy/output/",
-    "phases/phase2_development_planning/deliverables/generated_files/",
-    "phases/phase3_ai_execution/codebase/build/",
-    "phases/phase4_testing_iteration/tests/test_results/",
-    "phases/phase5_launch_growth/marketing/marketing_materials/",
-]
+try:
+    from .generation_manifest import manifest_path, reset
+except ImportError:
+    from generation_manifest import manifest_path, reset
 
-def reset_project():
+# Generated files are listed in <project root>/.builder_cache/generated.json
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def reset_project(project_root=PROJECT_ROOT, dry_run=False, workers=None):
     """Deletes all generated files and folders to reset the project."""
-    for path in generated_paths:
-        if os.path.exists(path):
-            if os.path.isdir(path):
-                shutil.rmtree(path)
-                print(f"Deleted folder: {path}")
-            else:
-                os.remove(path)
-                print(f"Deleted file: {path}")
-    print("Project reset successfully!")
+    report = reset(project_root, dry_run=dry_run, workers=workers)
+    verb = "Would delete" if dry_run else "Deleted"
+    print(f"{verb} {report['files']} files ({report['bytes']} bytes) and {report['dirs']} folders "
+          f"in {report['seconds']:.3f}s")
+    if report["missing"]:
+        print(f"{report['missing']} generated files were already gone.")
+    if report["outside"]:
+        print(f"Skipped {report['outside']} recorded paths outside the project root.")
+    if report["kept_dirs"]:
+        print(f"Kept {report['kept_dirs']} generated folders that now hold other files.")
+    if not dry_run:
+        print("Project reset successfully!")
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Delete everything the wizards generated.")
+    parser.add_argument("--root", default=PROJECT_ROOT,
+                        help="Project root (default: this repository)")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be deleted")
+    parser.add_argument("--yes", action="store_true", help="Do not ask for confirmation")
+    parser.add_argument("--workers", type=int, default=None, help="Threads used to delete files")
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(manifest_path(args.root)):
+        print("Nothing to reset: no generation manifest found.")
+        return 0
+    if not args.dry_run and not args.yes:
+        confirm = input("Are you sure you want to reset the project? "
+                        "This will delete all generated files. (yes/no): ")
+        if confirm.lower() != "yes":
+            print("Reset canceled.")
+            return 1
+    reset_project(args.root, dry_run=args.dry_run, workers=args.workers)
+    return 0
 
 if __name__ == "__main__":
-    confirm = input("Are you sure you want to reset the project? This will delete all generated files. (yes/no): ")
-    if confirm.lower() == "yes":
-        reset_project()
-    else:
-        print("Reset canceled.")
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""
+Parallel test runner for Phase 4: Testing & Iteration.
+
+Test files (``*test*.py``) are discovered under a project's test folders and
+sharded across worker processes one file per task, longest first: durations
+from the previous run are kept in .builder_cache/test_durations.json, and
+files without a recorded duration are ordered by size. Each worker imports
+the file under a private module name and runs its unittest cases (plus any
+plain ``test_*`` functions) with output buffered, timing every test. Workers
+are reused across files, so afterwards the worker restores sys.path and drops
+every module loaded from the project; two test folders can each have their
+own ``helpers.py``.
+
+run_tests() returns a summary with one record per test:
+
+    {"id": "tests/test_x.py::TestX.test_y", "file": "tests/test_x.py",
+     "category": "unit", "status": "passed", "seconds": 0.01, "message": ""}
+
+Statuses are passed, failed, error, skipped and xfail. A file that fails to
+import, or whose worker dies, yields a single error record.
+"""
+
+import fnmatch
+import json
+import os
+import threading
+import time
+
+try:
+    from .artifact_writer import write_atomic
+except ImportError:
+    from artifact_writer import write_atomic
+
+# Relative to the project root; missing folders are skipped
+TEST_DIRS = ("phase3_ai_execution/tests", "phases/phase3_ai_execution/tests", "tests")
+TEST_PATTERN = "*test*.py"
+DURATIONS_FILE = os.path.join(".builder_cache", "test_durations.json")
+CATEGORIES = (("e2e", ("e2e", "end_to_end")), ("integration", ("integration",)))
+SLOWEST = 10
+MESSAGE_LINES = 40
+# Phase 4 has no security suite to run; the report says so instead of claiming a pass
+SECURITY_NOTE = ("Not checked: no security or compliance suite is configured, "
+                 "so only the tests above were run.")
+
+
+def category_for(rel_path: str) -> str:
+    """unit, integration or e2e, from the file's path."""
+    lowered = rel_path.lower()
+    for category, markers in CATEGORIES:
+        if any(marker in lowered for marker in markers):
+            return category
+    return "unit"
+
+
+def discover(project_root, dirs=TEST_DIRS, pattern=TEST_PATTERN) -> list[str]:
+    """Absolute paths of the test files under ``dirs``, each real file once."""
+    root = os.path.abspath(project_root)
+    found, seen = [], set()
+    for rel in dirs:
+        top = os.path.join(root, rel)
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = sorted(d for d in dirnames
+                                 if d != "__pycache__" and not d.startswith("."))
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                real = os.path.realpath(path)
+                if fnmatch.fnmatch(name, pattern) and real not in seen:
+                    seen.add(real)
+                    found.append(path)
+    return found
+
+
+# ----- worker side -------------------------------------------------------------
+
+def _record(rel, test_id, status, seconds, message=""):
+    lines = message.rstrip().splitlines()
+    if len(lines) > MESSAGE_LINES:
+        lines = lines[:MESSAGE_LINES] + [f"... ({len(lines) - MESSAGE_LINES} more lines)"]
+    return {"id": f"{rel}::{test_id}", "file": rel, "category": category_for(rel),
+            "status": status, "seconds": seconds, "message": "\n".join(lines)}
+
+
+def _timing_result(rel, module_name):
+    import unittest
+
+    class TimingResult(unittest.TestResult):
+        """Keeps one record per test with its outcome and duration."""
+
+        def __init__(self):
+            super().__init__()
+            self.buffer = True
+            self.records = []
+            self._current = None
+
+        def _id(self, test):
+            test_id = test.id()
+            if test_id.startswith(module_name + "."):
+                return test_id[len(module_name) + 1:]
+            return test_id
+
+        def startTest(self, test):
+            self._current, self._status, self._message = test, "passed", ""
+            self._t0 = time.perf_counter()
+            super().startTest(test)
+
+        def stopTest(self, test):
+            super().stopTest(test)
+            seconds = time.perf_counter() - self._t0
+            self.records.append(_record(rel, self._id(test), self._status, seconds, self._message))
+            self._current = None
+
+        def _outcome(self, test, status, message):
+            if test is self._current:
+                if self._status in ("passed", "xfail") or status == "error":
+                    self._status, self._message = status, message
+            else:  # setUpClass/tearDownModule errors arrive outside any test
+                self.records.append(_record(rel, self._id(test), status, 0.0, message))
+
+        def addFailure(self, test, err):
+            super().addFailure(test, err)
+            self._outcome(test, "failed", self.failures[-1][1])
+
+        def addError(self, test, err):
+            super().addError(test, err)
+            self._outcome(test, "error", self.errors[-1][1])
+
+        def addSubTest(self, test, subtest, err):
+            super().addSubTest(test, subtest, err)
+            if err is not None:
+                failed = issubclass(err[0], test.failureException)
+                self._outcome(test, "failed" if failed else "error",
+                              (self.failures if failed else self.errors)[-1][1])
+
+        def addSkip(self, test, reason):
+            super().addSkip(test, reason)
+            self._outcome(test, "skipped", reason)
+
+        def addExpectedFailure(self, test, err):
+            super().addExpectedFailure(test, err)
+            self._outcome(test, "xfail", "")
+
+        def addUnexpectedSuccess(self, test):
+            super().addUnexpectedSuccess(test)
+            self._outcome(test, "failed", "Unexpected success")
+
+    return TimingResult()
+
+
+def run_file(path: str, project_root: str) -> list[dict]:
+    """Worker entry point: import one test file and run everything in it."""
+    import contextlib
+    import importlib.util
+    import io
+    import re
+    import sys
+    import traceback
+    import unittest
+
+    rel = os.path.relpath(path, project_root).replace(os.sep, "/")
+    module_name = "_suite_" + re.sub(r"\W", "_", rel[:-3])
+    directory = os.path.dirname(os.path.abspath(path))
+    output = io.StringIO()
+    started = time.perf_counter()
+    saved_path, saved_modules = list(sys.path), set(sys.modules)
+    sys.path.insert(0, directory)
+    try:
+        try:
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                spec = importlib.util.spec_from_file_location(module_name, path)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+            suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+            for name, value in vars(module).items():
+                if (name.startswith("test") and callable(value) and not isinstance(value, type)
+                        and getattr(value, "__module__", None) == module_name):
+                    suite.addTest(unittest.FunctionTestCase(value, description=name))
+        except (Exception, SystemExit):
+            message = traceback.format_exc() + output.getvalue()
+            return [_record(rel, "<import>", "error", time.perf_counter() - started, message)]
+
+        result = _timing_result(rel, module_name)
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            suite.run(result)
+        return result.records
+    finally:
+        _restore(project_root, saved_path, saved_modules)
+
+
+def _restore(project_root, saved_path, saved_modules):
+    """Undo a test file's sys.path edits and unload the project modules it imported."""
+    import sys
+
+    sys.path[:] = saved_path
+    root = os.path.abspath(project_root) + os.sep
+    for name in set(sys.modules) - saved_modules:
+        filename = getattr(sys.modules[name], "__file__", None) or ""
+        if name.startswith("_suite_") or os.path.abspath(filename).startswith(root):
+            del sys.modules[name]  # Library modules stay loaded; reloading some is unsafe
+
+
+# ----- driver ------------------------------------------------------------------
+
+def _load_durations(path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _mp_context():
+    """
+    None (the platform default) in a single-threaded process. Forking while
+    other threads run can deadlock the child on a lock one of them held (chat
+    sessions run the wizards on worker threads), so then workers start fresh.
+    """
+    if threading.active_count() == 1:
+        return None
+    import multiprocessing
+
+    fresh = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(fresh)
+
+
+def run_tests(project_root, workers: int | None = None, dirs=TEST_DIRS) -> dict:
+    """
+    Discover and run the project's tests across ``workers`` processes
+    (default: one per CPU, at most one per file); ``workers=1`` runs them in
+    this process, for callers that are already pool workers. Called from a
+    multithreaded process, the pool starts its workers without fork. Returns
+    ``{"files", "tests", "passed", "failed", "errors", "skipped", "xfail",
+    "seconds", "test_seconds", "workers", "dirs", "results", "durations_file"}``
+    with ``results`` sorted by test id.
+    """
+    root = os.path.abspath(project_root)
+    files = discover(root, dirs)
+    durations_file = os.path.join(root, DURATIONS_FILE)
+    durations = _load_durations(durations_file)
+
+    def expected(path):
+        rel = os.path.relpath(path, root).replace(os.sep, "/")
+        return (rel in durations, durations.get(rel, 0.0), os.path.getsize(path))
+
+    files.sort(key=expected, reverse=True)  # Longest first keeps the shards even
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files) or 1))
+    started = time.perf_counter()
+    results = []
+    if files and workers == 1:
+        for path in files:
+            results += run_file(path, root)
+    elif files:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context()) as pool:
+            futures = {pool.submit(run_file, path, root): path for path in files}
+            for future, path in futures.items():
+                try:
+                    results += future.result()
+                except Exception as e:  # The worker died (e.g. os._exit in a test)
+                    rel = os.path.relpath(path, root).replace(os.sep, "/")
+                    message = f"{type(e).__name__}: {e}"
+                    results.append(_record(rel, "<worker>", "error", 0.0, message))
+    seconds = time.perf_counter() - started
+
+    results.sort(key=lambda r: r["id"])
+    per_file = {}
+    for r in results:
+        per_file[r["file"]] = per_file.get(r["file"], 0.0) + r["seconds"]
+    if per_file:
+        os.makedirs(os.path.dirname(durations_file), exist_ok=True)
+        data = json.dumps(dict(durations, **per_file), indent=2, sort_keys=True)
+        write_atomic(durations_file, data.encode("utf-8"))
+
+    statuses = [r["status"] for r in results]
+    return {
+        "files": len(files),
+        "tests": len(results),
+        "passed": statuses.count("passed"),
+        "failed": statuses.count("failed"),
+        "errors": statuses.count("error"),
+        "skipped": statuses.count("skipped"),
+        "xfail": statuses.count("xfail"),
+        "seconds": seconds,
+        "test_seconds": sum(per_file.values()),
+        "workers": workers if files else 0,
+        "dirs": [d for d in dirs if os.path.isdir(os.path.join(root, d))],
+        "results": results,
+        "durations_file": durations_file if per_file else None,
+    }
+
+
+def counts(results) -> dict:
+    """Status counts for a list of result records."""
+    tally = {"passed": 0, "failed": 0, "error": 0, "skipped": 0, "xfail": 0}
+    for r in results:
+        tally[r["status"]] += 1
+    return tally
+
+
+# ----- Markdown report ---------------------------------------------------------
+
+def _cell(text) -> str:
+    return str(text).replace("|", "\\|").replace("\n", " ")
+
+
+def report_fields(summary: dict, slowest: int = SLOWEST) -> dict:
+    """Template fields for phase4/test_results.md and phase4/bug_report.md."""
+    results = summary["results"]
+    if not results:
+        where = ", ".join(summary["dirs"]) or " or ".join(TEST_DIRS)
+        text = f"No tests found under {where}."
+        return {"summary": text, "failures": "None.", "slowest": "None.", "results": "None.",
+                "bugs": "No failing tests (no tests were found).", "security": SECURITY_NOTE}
+
+    text = (f"**{summary['tests']} tests** in {summary['files']} files: "
+            f"{summary['passed']} passed, {summary['failed']} failed, "
+            f"{summary['errors']} errors, {summary['skipped']} skipped"
+            + (f", {summary['xfail']} expected failures" if summary["xfail"] else "")
+            + f". Wall time {summary['seconds']:.2f}s on {summary['workers']} workers "
+              f"({summary['test_seconds']:.2f}s of test time).")
+
+    broken = [r for r in results if r["status"] in ("failed", "error")]
+    failures = "\n\n".join(f"### `{r['id']}` ({r['status']})\n\n```\n{r['message']}\n```"
+                           for r in broken) or "None."
+
+    by_time = sorted(results, key=lambda r: r["seconds"], reverse=True)[:slowest]
+    slowest_table = "\n".join(
+        ["| Test | Seconds | Status |", "| --- | ---: | --- |"]
+        + [f"| {_cell(r['id'])} | {r['seconds']:.3f} | {r['status']} |" for r in by_time])
+    results_table = "\n".join(
+        ["| Test | Category | Status | Seconds |", "| --- | --- | --- | ---: |"]
+        + [f"| {_cell(r['id'])} | {r['category']} | {r['status']} | {r['seconds']:.3f} |"
+           for r in results])
+
+    def last_line(message):
+        return _cell(message.splitlines()[-1] if message else "")
+
+    bugs = "\n".join(f"- `{r['id']}` ({r['status']}): {last_line(r['message'])}"
+                     for r in broken) or "No failing tests."
+    return {"summary": text, "failures": failures, "slowest": slowest_table,
+            "results": results_table, "bugs": bugs, "security": SECURITY_NOTE}
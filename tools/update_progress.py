@@ -1,14 +1,28 @@
 # Progress Update Script
 
+import json
 import os
 from pathlib import Path
 
+try:
+    from .artifact_writer import write_atomic
+    from .progress_scoring import fingerprint, score_file, score_files
+    from .reference_index import IGNORED_DIRS
+except ImportError:
+    from artifact_writer import write_atomic
+    from progress_scoring import fingerprint, score_file, score_files
+    from reference_index import IGNORED_DIRS
+
 # Define the root directory of the project
-ROOT_DIR = Path(__file__).parent
+ROOT_DIR = Path(__file__).resolve().parent.parent
 
 # Define the progress file
 PROGRESS_FILE = ROOT_DIR / 'project_overview/MASTER_GOAL_PROGRESS.md'
 
+# Per-file scores from earlier runs, keyed by relative path and validated by (mtime, size)
+CACHE_FILE = ROOT_DIR / '.builder_cache/progress_cache.json'
+CACHE_VERSION = 1
+
 # Define progress evaluation criteria
 PROGRESS_CRITERIA = {
     100: "File is complete and fully aligned with the master goal.",
@@ -19,37 +33,102 @@ PROGRESS_CRITERIA = {
 }
 
 def evaluate_file_progress(file_path):
-    """Evaluate the progress of a single file."""
-    # Placeholder logic for evaluation
-    # Replace with actual evaluation logic as needed
-    if file_path.exists():
-        return 100  # Assume all existing files are complete for now
-    return 0
-
-def update_progress():
-    """Update the MASTER_GOAL_PROGRESS.md file with the latest progress."""
-    progress_data = []
-
-    # Scan all files in the root directory and subdirectories
-    for root, _, files in os.walk(ROOT_DIR):
-        for file in files:
-            file_path = Path(root) / file
-            if file_path == PROGRESS_FILE:
-                continue  # Skip the progress file itself
-
-            progress = evaluate_file_progress(file_path)
-            progress_data.append((file_path.relative_to(ROOT_DIR), progress))
-
-    # Calculate overall progress
-    overall_progress = sum(progress for _, progress in progress_data) / len(progress_data)
-
-    # Write progress to the file
-    with open(PROGRESS_FILE, 'w') as f:
-        f.write("# Master Goal Progress\n\n")
-        f.write(f"Overall Progress: {overall_progress:.2f}%\n\n")
-        f.write("## File Breakdown\n")
-        for file_path, progress in progress_data:
-            f.write(f"- {file_path}: {progress}%\n")
+    """Evaluate the progress of a single file against PROGRESS_CRITERIA (see progress_scoring)."""
+    return score_file(file_path)
+
+def iter_files(root_dir):
+    """Yield (relative posix path, stat result) for every file, pruning IGNORED_DIRS."""
+    stack = [(str(root_dir), '')]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        for entry in entries:
+            rel = prefix + entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS:
+                        stack.append((entry.path, rel + '/'))
+                elif entry.is_file():
+                    yield rel, entry.stat()
+            except OSError:
+                continue
+
+def load_cache(cache_file):
+    """Return the cached {path: [mtime_ns, size, score]} map, or {} if unusable."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != CACHE_VERSION or data.get('scoring') != fingerprint():
+        return {}
+    return data.get('files', {})
+
+def save_cache(cache_file, files):
+    cache_file = Path(cache_file)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': CACHE_VERSION, 'scoring': fingerprint(), 'files': files}
+        write_atomic(str(cache_file), json.dumps(data).encode('utf-8'))
+    except OSError:
+        pass  # Scores are recomputed next run
+
+def write_report(progress_file, progress_data, overall_progress):
+    """Write the report atomically (see artifact_writer.write_atomic)."""
+    lines = ["# Master Goal Progress\n\n",
+             f"Overall Progress: {overall_progress:.2f}%\n\n",
+             "## File Breakdown\n"]
+    lines.extend(f"- {file_path}: {progress}%\n" for file_path, progress in progress_data)
+    write_atomic(str(progress_file), "".join(lines).encode('utf-8'))
+
+def update_progress(root_dir=ROOT_DIR, progress_file=PROGRESS_FILE, cache_file=CACHE_FILE,
+                    workers=None):
+    """
+    Update the MASTER_GOAL_PROGRESS.md file with the latest progress.
+
+    Only files whose (mtime, size) changed since the last run are evaluated
+    again, over a process pool of ``workers`` for large batches. The report
+    is rewritten only when a score, a file or the report itself changed.
+    Returns a summary dict of the run.
+    """
+    root_dir = Path(root_dir)
+    progress_file = Path(progress_file)
+    try:
+        skip = progress_file.resolve().relative_to(root_dir.resolve()).as_posix()
+    except ValueError:
+        skip = None  # Report lives outside the scanned tree
+
+    cached = load_cache(cache_file) if cache_file else {}
+    files = {}
+    changed = []
+    for rel, st in iter_files(root_dir):
+        if rel == skip:
+            continue  # Skip the progress file itself
+        entry = cached.get(rel)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            files[rel] = entry
+        else:
+            changed.append((rel, st))
+    scores = score_files([root_dir / rel for rel, _ in changed], workers, evaluate_file_progress)
+    for (rel, st), score in zip(changed, scores):
+        files[rel] = [st.st_mtime_ns, st.st_size, score]
+    evaluated = len(changed)
+    removed = len(cached.keys() - files.keys())
+
+    progress_data = sorted((rel, entry[2]) for rel, entry in files.items())
+    total = sum(score for _, score in progress_data)
+    overall_progress = total / len(progress_data) if progress_data else 0.0
+
+    written = bool(evaluated or removed or not progress_file.exists())
+    if written:
+        write_report(progress_file, progress_data, overall_progress)
+        if cache_file:
+            save_cache(cache_file, files)
+    return {'files': len(progress_data), 'evaluated': evaluated, 'removed': removed,
+            'overall': overall_progress, 'written': written}
 
 if __name__ == "__main__":
     update_progress()
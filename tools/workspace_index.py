@@ -0,0 +1,156 @@
+"""
+Workspace progress index.
+
+Walks the phase folders with os.scandir and records a compact summary per
+directory: its mtime, the number and total size of visible files directly in
+it, and its child directories. The summary is persisted as JSON so a later
+scan only re-lists directories whose mtime changed; every other directory is
+trusted from the cache, which keeps progress reporting O(changed dirs).
+
+Directory mtimes change when entries are added, removed or renamed, not when
+an existing file is rewritten in place, so cached sizes can lag behind edits.
+Progress checks only care whether files exist, which the mtime does track.
+"""
+
+import json
+import os
+
+try:
+    from .artifact_writer import write_atomic
+except ImportError:
+    from artifact_writer import write_atomic
+
+INDEX_VERSION = 1
+
+
+def _is_hidden(name: str) -> bool:
+    return name.startswith(".")
+
+
+class WorkspaceIndex:
+    """Incremental, persisted directory index rooted at ``root``."""
+
+    def __init__(self, root: str, index_path: str | None = None):
+        self.root = os.path.abspath(root)
+        self.index_path = index_path
+        self.dirs: dict[str, dict] = {}
+        self.stats = {"listed": 0, "reused": 0}
+        self._dirty = False
+
+    # ----- persistence -------------------------------------------------------
+
+    def load(self) -> bool:
+        """Load a previously saved index. Returns False if none is usable."""
+        if not self.index_path or not os.path.isfile(self.index_path):
+            return False
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != INDEX_VERSION or data.get("root") != self.root:
+            return False
+        self.dirs = data.get("dirs", {})
+        return True
+
+    def save(self) -> None:
+        """Write the index atomically; a no-op when nothing changed."""
+        if not self.index_path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        data = {"version": INDEX_VERSION, "root": self.root, "dirs": self.dirs}
+        write_atomic(self.index_path, json.dumps(data).encode("utf-8"))
+        self._dirty = False
+
+    # ----- scanning ----------------------------------------------------------
+
+    def _rel(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root)
+
+    def _list_dir(self, path: str, mtime: int) -> dict:
+        files = 0
+        size = 0
+        dirs = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if _is_hidden(entry.name):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files += 1
+                        size += entry.stat().st_size
+                except OSError:
+                    continue
+        self.stats["listed"] += 1
+        return {"mtime": mtime, "files": files, "size": size, "dirs": sorted(dirs)}
+
+    def scan(self, folders) -> None:
+        """Refresh the index for each folder (and everything beneath it)."""
+        self.stats = {"listed": 0, "reused": 0}
+        for top in dict.fromkeys(self._rel(f) for f in folders):
+            self._scan_tree(top)
+
+    def _scan_tree(self, top: str) -> None:
+        previous = {
+            rel: entry for rel, entry in self.dirs.items()
+            if rel == top or rel.startswith(top + os.sep)
+        }
+        for rel in previous:
+            del self.dirs[rel]
+
+        stack = [top]
+        while stack:
+            rel = stack.pop()
+            path = os.path.join(self.root, rel)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if not os.path.isdir(path):
+                continue
+            cached = previous.get(rel)
+            if cached is not None and cached["mtime"] == st.st_mtime_ns:
+                entry = dict(cached)
+                self.stats["reused"] += 1
+            else:
+                try:
+                    entry = self._list_dir(path, st.st_mtime_ns)
+                except OSError:
+                    continue
+            self.dirs[rel] = entry
+            stack.extend(os.path.join(rel, d) for d in entry["dirs"])
+
+        if self.stats["listed"] or set(previous) != {
+            rel for rel in self.dirs if rel == top or rel.startswith(top + os.sep)
+        }:
+            self._dirty = True
+        self._aggregate(top)
+
+    def _aggregate(self, top: str) -> None:
+        """Fill in ``tree_files`` (visible files in the whole subtree)."""
+        subtree = [
+            rel for rel in self.dirs if rel == top or rel.startswith(top + os.sep)
+        ]
+        for rel in sorted(subtree, key=lambda r: r.count(os.sep), reverse=True):
+            entry = self.dirs[rel]
+            entry["tree_files"] = entry["files"] + sum(
+                self.dirs.get(os.path.join(rel, d), {}).get("tree_files", 0)
+                for d in entry["dirs"]
+            )
+
+    # ----- queries -----------------------------------------------------------
+
+    def any_files(self, path: str) -> bool:
+        """True if ``path`` is an indexed directory with a visible file anywhere below it."""
+        entry = self.dirs.get(self._rel(path))
+        return bool(entry and entry.get("tree_files"))
+
+    def has_direct_files(self, path: str) -> bool:
+        """True if ``path`` is an indexed directory with a visible file directly in it."""
+        entry = self.dirs.get(self._rel(path))
+        return bool(entry and entry["files"])
+
+    def is_file(self, path: str) -> bool:
+        return os.path.isfile(path)